@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Throughput of the gh-fix-ci failure matcher on large CI logs.
+
+Compares LogAnalyzer (per-tool signatures, ranked regions) with the single-marker
+scan it replaced: lowercase each line and keep the window around the last line that
+contains any FAILURE_MARKERS entry. Both see the same lines one at a time, as they
+arrive from `gh run view --log`. The run-log column times stream_run_log itself, the
+path every check takes: each line is matched once and fed to the whole-run analyzer
+and to its job's analyzer (gh is stubbed out).
+
+Usage:
+    python benchmarks/bench_inspect_pr_checks.py                # synthetic logs
+    python benchmarks/bench_inspect_pr_checks.py run.log ...    # real logs, e.g. saved
+                                                                # with `gh run view --log`
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/.curated/gh-fix-ci/scripts"))
+
+import inspect_pr_checks as ipc  # noqa: E402
+
+PREFIX = "{job}\t{step}\t2024-05-01T12:{minute:02d}:{second:02d}.{micro:07d}Z "
+# Noise lines seen in real runs, including ones that mention "error" without failing.
+NOISE = (
+    "  Downloading {pkg}-{n}.0.{m}-py3-none-any.whl ({n}{m} kB)",
+    "Requirement already satisfied: {pkg} in /opt/hostedtoolcache/Python/3.11.9/x64/lib",
+    "npm WARN deprecated error-ex@1.3.{m}: this package is no longer maintained",
+    "   Compiling {pkg} v0.{n}.{m}",
+    "ok  \tgithub.com/acme/{pkg}\t0.{n}{m}s",
+    "PASS src/{pkg}/{pkg}.test.ts ({n}.{m} s)",
+    "tests/test_{pkg}.py::test_error_handling_{n} PASSED [ {m}%]",
+    "tests/test_{pkg}.py::test_case_{n} PASSED [ {m}%]",
+    "[command]/usr/bin/git -c protocol.version=2 fetch --no-tags --depth=1 origin",
+    "##[group]Run actions/setup-node@v4",
+    "##[endgroup]",
+)
+FAILURES = {
+    "pytest": [
+        "=================================== FAILURES ===================================",
+        "_______________________________ test_timeout ________________________________",
+        "    def test_timeout(client):",
+        ">       assert client.get('/health').status_code == 200",
+        "E       assert 503 == 200",
+        "tests/test_api.py:41: AssertionError",
+        "=========================== short test summary info ============================",
+        "FAILED tests/test_api.py::test_timeout - assert 503 == 200",
+        "=================== 1 failed, 2411 passed in 301.52s (0:05:01) ===================",
+    ],
+    "cargo": [
+        "error[E0308]: mismatched types",
+        "  --> src/parser.rs:118:24",
+        "   |",
+        "118 |         let n: u32 = token.len();",
+        "   |                ---   ^^^^^^^^^^^ expected `u32`, found `usize`",
+        "error: could not compile `parser` (lib) due to 1 previous error",
+    ],
+    "jest": [
+        "FAIL src/cart/cart.test.ts",
+        "  ● Cart › applies discount codes",
+        "    expect(received).toBe(expected) // Object.is equality",
+        "    Expected: 90",
+        "    Received: 100",
+        "Tests:       1 failed, 812 passed, 813 total",
+    ],
+    "go": [
+        "--- FAIL: TestResolve (0.02s)",
+        "    resolve_test.go:88: got \"a\", want \"b\"",
+        "FAIL",
+        "FAIL\tgithub.com/acme/resolver\t0.412s",
+    ],
+    "tsc": [
+        "src/api/client.ts(42,7): error TS2322: Type 'string' is not assignable to type 'number'.",
+        "src/api/client.ts(57,3): error TS2554: Expected 2 arguments, but got 1.",
+        "Found 2 errors in the same file, starting at: src/api/client.ts:42",
+    ],
+}
+TRAILER = [
+    "##[error]Process completed with exit code 1.",
+    "Post job cleanup.",
+    "[command]/usr/bin/git config --local --name-only --get-regexp core\\.sshCommand",
+    "Cleaning up orphan processes",
+    "Removing error-reporter cache",
+]
+
+
+def synthetic_log(kind: str, lines: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    body = []
+    for i in range(lines):
+        template = rng.choice(NOISE)
+        body.append(template.format(pkg=f"pkg{rng.randrange(400)}", n=rng.randrange(10), m=rng.randrange(100)))
+    # The real failure sits near the end, followed by the usual cleanup noise.
+    body[-len(TRAILER) - 200 : -len(TRAILER) - 200] = FAILURES[kind]
+    body[-len(TRAILER) :] = TRAILER
+    return [
+        PREFIX.format(job=f"{kind} (ubuntu-latest)", step="Run tests", minute=(i // 60) % 60, second=i % 60, micro=i % 10**7)
+        + line
+        for i, line in enumerate(body)
+    ]
+
+
+def marker_scan(lines: list[str], max_lines: int, context: int) -> tuple[str, str]:
+    """The single-marker matcher LogAnalyzer replaced, streamed the same way.
+
+    Returns (snippet, the line the snippet is centered on).
+    """
+    recent: deque[str] = deque(maxlen=context)
+    window: list[str] = []
+    picked = ""
+    after = 0
+    for line in lines:
+        lowered = line.lower()
+        if any(marker in lowered for marker in ipc.FAILURE_MARKERS):
+            window = [*recent, line]
+            picked = line
+            after = context - 1
+        elif after > 0:
+            window.append(line)
+            after -= 1
+        recent.append(line)
+    return "\n".join(window[-max_lines:]), picked
+
+
+def ranked_scan(lines: list[str], max_lines: int, context: int) -> tuple[str, str]:
+    analyzer = ipc.LogAnalyzer(max_lines, context)
+    for line in lines:
+        analyzer.feed(line)
+    regions = analyzer.finish().regions()
+    return analyzer.snippet(), lines[regions[0]["line"] - 1] if regions else ""
+
+
+def run_log_scan(lines: list[str], max_lines: int, context: int) -> tuple[str, str]:
+    def stream(args, cwd, on_line):
+        for line in lines:
+            on_line(line)
+        return ipc.GhResult(0, "", ""), None
+
+    real_stream = ipc.stream_gh_command
+    ipc.stream_gh_command = stream
+    try:
+        job_logs, run_log, _ = ipc.stream_run_log("0", Path("."), max_lines, context)
+    finally:
+        ipc.stream_gh_command = real_stream
+    job_name = lines[0].partition("\t")[0] if lines else ""
+    regions = job_logs.get(job_name, run_log).regions()
+    return "", lines[regions[0]["line"] - 1] if regions else ""
+
+
+def best_time(fn, lines: list[str], repeat: int) -> tuple[float, str]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _, picked = fn(lines, ipc.DEFAULT_MAX_LINES, ipc.DEFAULT_CONTEXT_LINES)
+        best = min(best, time.perf_counter() - start)
+    return best, ipc.strip_log_prefix(picked)[:70]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("logs", nargs="*", type=Path, help="Log files to scan instead of synthetic logs")
+    parser.add_argument("--lines", type=int, default=200_000, help="Lines per synthetic log")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the best is reported")
+    args = parser.parse_args()
+
+    if args.logs:
+        logs = {path.name: path.read_text(errors="replace").splitlines() for path in args.logs}
+    else:
+        logs = {kind: synthetic_log(kind, args.lines) for kind in FAILURES}
+
+    print(
+        f"{'log':<12}{'lines':>9}{'MiB':>7}  {'marker scan':>16}  {'LogAnalyzer':>16}  ratio"
+        f"  {'run log':>16}  ratio"
+    )
+    for name, lines in logs.items():
+        mib = sum(len(line) + 1 for line in lines) / 2**20
+        old_time, old_picked = best_time(marker_scan, lines, args.repeat)
+        new_time, new_picked = best_time(ranked_scan, lines, args.repeat)
+        run_time, run_picked = best_time(run_log_scan, lines, args.repeat)
+        print(
+            f"{name:<12}{len(lines):>9}{mib:>7.1f}  "
+            f"{len(lines) / old_time / 1000:>9.0f} klines/s  {len(lines) / new_time / 1000:>9.0f} klines/s"
+            f"  {new_time / old_time:.2f}x  {len(lines) / run_time / 1000:>9.0f} klines/s"
+            f"  {run_time / old_time:.2f}x"
+        )
+        print(f"{'':<12}marker scan picked: {old_picked}")
+        print(f"{'':<12}LogAnalyzer picked: {new_picked}")
+        print(f"{'':<12}run log picked:     {run_picked}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,12 +2,22 @@
 from __future__ import annotations
 
 import argparse
+import heapq
+import io
+import itertools
 import json
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Iterable, Sequence
+from typing import IO, Any, Callable, Iterable, Sequence
 
 FAILURE_CONCLUSIONS = {
     "failure",
@@ -39,8 +49,72 @@ FAILURE_MARKERS = (
     "segmentation fault",
 )
 
+# Tool-specific failure lines, highest priority first: (name, weight, pattern). Patterns
+# are matched against each log line with the gh job/step prefix, timestamp and ANSI
+# colors removed; a line takes the first signature that matches, and any other line
+# containing a FAILURE_MARKERS entry counts as GENERIC_SIGNATURE.
+FAILURE_SIGNATURES = (
+    ("pytest-failed", 6, r"^(?:FAILED|ERROR) \S+::\S+"),
+    ("pytest-assert", 5, r"^E {2,}\S"),
+    ("pytest-summary", 4, r"^=+ .*\b\d+ (?:failed|errors?)\b.* =+$"),
+    ("cargo-error", 6, r"^error(?:\[E\d{4}\])?: "),
+    ("cargo-test-failed", 6, r"^test \S+ \.\.\. FAILED$"),
+    ("rust-panic", 5, r"panicked at "),
+    ("jest-test", 6, r"^\s*\u25cf \S"),
+    ("jest-suite", 5, r"^\s*FAIL\s+\S+\.(?:[cm]?[jt]sx?)\b"),
+    ("go-test-failed", 6, r"^\s*--- FAIL: "),
+    ("go-panic", 5, r"^panic: "),
+    ("go-package-failed", 4, r"^FAIL\s+\S+"),
+    ("tsc-error", 6, r"\berror TS\d+:"),
+    ("python-traceback", 4, r"^Traceback \(most recent call last\)"),
+    ("exit-code", 1, r"^(?:##\[error\])?Process completed with exit code \d+"),
+    ("actions-error", 3, r"^##\[error\]"),
+)
+GENERIC_SIGNATURE = ("generic", 1)
+# Python's alternation is ordered, so one match() over all the anchored signatures finds
+# the highest-priority one; only unanchored signatures listed before it need a search().
+SIGNATURE_CONTENT_RE = re.compile(
+    "|".join(
+        f"(?P<s{idx}>{pattern[1:]})"
+        for idx, (_, _, pattern) in enumerate(FAILURE_SIGNATURES)
+        if pattern.startswith("^")
+    )
+)
+UNANCHORED_SIGNATURES = tuple(
+    (idx, re.compile(pattern))
+    for idx, (_, _, pattern) in enumerate(FAILURE_SIGNATURES)
+    if not pattern.startswith("^")
+)
+# Most lines are not failures. A line can only match a signature if it contains a
+# failure marker or one of the anchored patterns matches right after the gh log prefix,
+# and both checks are much cheaper than stripping the line and trying each signature
+# (or one case-insensitive alternation). The prefix is matched inside a lookahead and
+# then consumed with a backreference, which makes it atomic: a miss costs one attempt
+# instead of retrying the alternation at every shorter prefix. (Possessive quantifiers
+# would say the same thing but need Python 3.11.)
+ANCHORED_SIGNATURE_RE = re.compile(
+    r"(?=(?P<prefix>(?:[^\t]*\t[^\t]*\t(?=\ufeff?\d{4}-))?\ufeff?"
+    r"(?:\d{4}-\d\d-\d\dT[\d:.]+Z ?)?))(?P=prefix)(?:"
+    + "|".join(
+        f"(?:{pattern[1:]})" for _, _, pattern in FAILURE_SIGNATURES if pattern.startswith("^")
+    )
+    + ")"
+)
+# "failed" can never match where "fail" does not.
+PREFILTER_MARKERS = tuple(
+    marker
+    for marker in FAILURE_MARKERS
+    if not any(other != marker and other in marker for other in FAILURE_MARKERS)
+)
+ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
 DEFAULT_MAX_LINES = 160
 DEFAULT_CONTEXT_LINES = 30
+DEFAULT_REGIONS = 3
+DEFAULT_JOBS = 4
+# Zipped job logs stay in memory up to this size and spill to a temporary file beyond it.
+ZIP_SPOOL_BYTES = 16 * 1024 * 1024
+STEP_LOG_NAME_RE = re.compile(r"(?:^|/)(\d+)_[^/]*\.txt$")
 PENDING_LOG_MARKERS = (
     "still in progress",
     "log will be available when it is complete",
@@ -54,6 +128,175 @@ class GhResult:
         self.stderr = stderr
 
 
+class LogAnalyzer:
+    """Ranked failure regions and tail of a log that is fed one line at a time.
+
+    A region is a run of failure lines (see FAILURE_SIGNATURES) no more than `context`
+    lines apart, plus `context` lines before the first one and `context - 1` after the
+    last. Its score is the sum of the weights of the distinct signatures it contains.
+    Only the last lines, the open region and the best `regions` closed regions are kept,
+    so memory does not grow with the log size.
+
+    Call finish() once the whole log has been fed; after that the analyzer is read-only
+    and can be shared between threads.
+    """
+
+    def __init__(self, max_lines: int, context: int, regions: int = DEFAULT_REGIONS):
+        self.context = context
+        self.max_lines = max_lines
+        self.regions_kept = max(1, regions)
+        # Serves as both the tail and the context before the next region.
+        self._lines: deque[str] = deque(maxlen=max(max_lines, context))
+        self._lines_since_region = 0
+        self._line_number = 0
+        self._region: dict[str, Any] | None = None
+        self._seq = 0
+        self._top: list[tuple[int, int, dict[str, Any]]] = []
+
+    def feed(self, line: str) -> None:
+        self.feed_matched(line, match_signature(line))
+
+    def feed_matched(self, line: str, signature: tuple[str, int, str] | None) -> None:
+        """Feed a line already passed through match_signature, e.g. to several analyzers."""
+        self._line_number += 1
+        region = self._region
+        if signature:
+            if region is not None and len(region["lines"]) >= self.max_lines:
+                self._close_region()
+                region = None
+            if region is None:
+                # Context lines, but none that already belong to the previous region.
+                count = min(self.context, self._lines_since_region, len(self._lines))
+                before = list(itertools.islice(self._lines, len(self._lines) - count, None))
+                region = self._region = {
+                    "line": self._line_number,
+                    "lines": before,
+                    "signatures": {},
+                    "best": 0,
+                    "key": "",
+                }
+            name, weight, content = signature
+            region["lines"].append(line)
+            region["signatures"][name] = weight
+            # The region points at its strongest line; the later one on ties.
+            if weight >= region["best"]:
+                region["best"] = weight
+                region["line"] = self._line_number
+                region["key"] = content.strip()
+            region["after"] = self.context - 1
+        elif region is not None:
+            if region["after"] > 0:
+                region["lines"].append(line)
+                region["after"] -= 1
+            else:
+                self._close_region()
+        if self._region is None:
+            self._lines_since_region += 1
+        else:
+            self._lines_since_region = 0
+        self._lines.append(line)
+
+    def finish(self) -> LogAnalyzer:
+        """Close the region still open at the end of the log."""
+        self._close_region()
+        return self
+
+    def regions(self) -> list[dict[str, Any]]:
+        """Return the best distinct closed regions, highest score (then latest) first."""
+        ranked = sorted(self._top, key=lambda item: (item[0], item[1]), reverse=True)
+        return [
+            {
+                "line": region["line"],
+                "score": score,
+                "signatures": sorted(region["signatures"]),
+                "text": "\n".join(region["lines"][-self.max_lines :]),
+            }
+            for score, _, region in ranked
+        ]
+
+    def snippet(self) -> str:
+        regions = self.regions()
+        if not regions:
+            return self.tail()
+        return regions[0]["text"]
+
+    def tail(self) -> str:
+        skip = max(0, len(self._lines) - self.max_lines)
+        return "\n".join(itertools.islice(self._lines, skip, None))
+
+    def _close_region(self) -> None:
+        region, self._region = self._region, None
+        if region is None:
+            return
+        self._seq += 1
+        entry = (sum(region["signatures"].values()), self._seq, region)
+        # Repeats of the same failure line (retries, loops) count as one region.
+        for idx, (_, _, other) in enumerate(self._top):
+            if other["key"] == region["key"]:
+                if entry[:2] > self._top[idx][:2]:
+                    self._top[idx] = entry
+                    heapq.heapify(self._top)
+                return
+        if len(self._top) < self.regions_kept:
+            heapq.heappush(self._top, entry)
+        elif entry[:2] > self._top[0][:2]:
+            heapq.heapreplace(self._top, entry)
+
+
+class RunCache:
+    """Fetch each workflow run's metadata and log at most once per invocation.
+
+    The run log (every job in the run) is streamed once and demultiplexed by job name
+    into one LogAnalyzer per job, so checks from the same run each get their own job's
+    lines without another download. Safe to share between threads: concurrent callers
+    asking for the same run wait for the first fetch instead of starting their own.
+    """
+
+    def __init__(
+        self, repo_root: Path, max_lines: int, context: int, regions: int = DEFAULT_REGIONS
+    ):
+        self.repo_root = repo_root
+        self.max_lines = max_lines
+        self.context = context
+        self.regions = regions
+        self._lock = threading.Lock()
+        self._futures: dict[tuple[str, str], Future] = {}
+
+    def metadata(self, run_id: str) -> dict[str, Any] | None:
+        return self._memo(("metadata", run_id), lambda: fetch_run_metadata(run_id, self.repo_root))
+
+    def log(self, run_id: str) -> tuple[dict[str, LogAnalyzer], LogAnalyzer, str]:
+        return self._memo(
+            ("log", run_id),
+            lambda: stream_run_log(
+                run_id, self.repo_root, self.max_lines, self.context, self.regions
+            ),
+        )
+
+    def job_log(self, run_id: str, job_name: str) -> tuple[LogAnalyzer | None, str]:
+        """Return the analyzed lines for job_name, or the whole run log if none match."""
+        job_logs, run_log, log_error = self.log(run_id)
+        if log_error:
+            return None, log_error
+        return job_logs.get(job_name, run_log), ""
+
+    def repo_slug(self) -> str | None:
+        return self._memo(("repo", ""), lambda: fetch_repo_slug(self.repo_root))
+
+    def _memo(self, key: tuple[str, str], fetch: Any) -> Any:
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = self._futures[key] = Future()
+        if owner:
+            try:
+                future.set_result(fetch())
+            except BaseException as exc:
+                future.set_exception(exc)
+        return future.result()
+
+
 def run_gh_command(args: Sequence[str], cwd: Path) -> GhResult:
     process = subprocess.run(
         ["gh", *args],
@@ -64,14 +307,44 @@ def run_gh_command(args: Sequence[str], cwd: Path) -> GhResult:
     return GhResult(process.returncode, process.stdout, process.stderr)
 
 
-def run_gh_command_raw(args: Sequence[str], cwd: Path) -> tuple[int, bytes, str]:
-    process = subprocess.run(
-        ["gh", *args],
-        cwd=cwd,
-        capture_output=True,
-    )
-    stderr = process.stderr.decode(errors="replace")
-    return process.returncode, process.stdout, stderr
+def stream_gh_command(
+    args: Sequence[str],
+    cwd: Path,
+    on_line: Callable[[str], None],
+) -> tuple[GhResult, IO[bytes] | None]:
+    """Run gh and pass each stdout line to on_line as it arrives, without keeping stdout.
+
+    If stdout starts like a zip archive it is not split into lines; it is spooled to a
+    seekable file (in memory up to ZIP_SPOOL_BYTES) that is returned instead, rewound.
+    Returns (result, zip_payload) where result.stdout is empty.
+    """
+    process = subprocess.Popen(["gh", *args], cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stderr_chunks: list[bytes] = []
+    stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()))
+    stderr_reader.start()
+    payload = None
+    try:
+        if is_zip_payload(process.stdout.peek(2)):
+            # Not SpooledTemporaryFile: before Python 3.11 it lacks seekable(), which
+            # zipfile needs to read members.
+            head = process.stdout.read(ZIP_SPOOL_BYTES + 1)
+            if len(head) <= ZIP_SPOOL_BYTES:
+                payload = io.BytesIO(head)
+            else:
+                payload = tempfile.TemporaryFile()
+                payload.write(head)
+                del head
+                shutil.copyfileobj(process.stdout, payload)
+                payload.seek(0)
+        else:
+            for line in io.TextIOWrapper(process.stdout, errors="replace"):
+                on_line(line.rstrip("\n"))
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+        stderr_reader.join()
+    stderr = b"".join(stderr_chunks).decode(errors="replace")
+    return GhResult(returncode, "", stderr), payload
 
 
 def parse_args() -> argparse.Namespace:
@@ -88,7 +361,19 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--max-lines", type=int, default=DEFAULT_MAX_LINES)
     parser.add_argument("--context", type=int, default=DEFAULT_CONTEXT_LINES)
+    parser.add_argument(
+        "--regions",
+        type=int,
+        default=DEFAULT_REGIONS,
+        help="Number of distinct failure regions to report per check, best first.",
+    )
     parser.add_argument("--json", action="store_true", help="Emit JSON instead of text output.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="Number of checks to analyze concurrently (1 analyzes them one at a time).",
+    )
     return parser.parse_args()
 
 
@@ -115,16 +400,14 @@ def main() -> int:
         print(f"PR #{pr_value}: no failing checks detected.")
         return 0
 
-    results = []
-    for check in failing:
-        results.append(
-            analyze_check(
-                check,
-                repo_root=repo_root,
-                max_lines=max(1, args.max_lines),
-                context=max(1, args.context),
-            )
-        )
+    results = analyze_checks(
+        failing,
+        repo_root=repo_root,
+        max_lines=max(1, args.max_lines),
+        context=max(1, args.context),
+        jobs=max(1, args.jobs),
+        regions=max(1, args.regions),
+    )
 
     if args.json:
         print(json.dumps({"pr": pr_value, "results": results}, indent=2))
@@ -231,11 +514,42 @@ def is_failing(check: dict[str, Any]) -> bool:
     return bucket in FAILURE_BUCKETS
 
 
+def analyze_checks(
+    checks: Sequence[dict[str, Any]],
+    repo_root: Path,
+    max_lines: int,
+    context: int,
+    jobs: int = 1,
+    regions: int = DEFAULT_REGIONS,
+) -> list[dict[str, Any]]:
+    """Analyze checks, fetching each distinct run once; results keep the input order."""
+    runs = RunCache(repo_root, max_lines, context, regions)
+    if jobs <= 1:
+        return [analyze_check(check, repo_root, max_lines, context, runs) for check in checks]
+
+    run_ids = []
+    for check in checks:
+        run_id = extract_run_id(check.get("detailsUrl") or check.get("link") or "")
+        if run_id and run_id not in run_ids:
+            run_ids.append(run_id)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        # Start every run's metadata and log fetch before any analysis waits on them.
+        for run_id in run_ids:
+            pool.submit(runs.metadata, run_id)
+            pool.submit(runs.log, run_id)
+        futures = [
+            pool.submit(analyze_check, check, repo_root, max_lines, context, runs)
+            for check in checks
+        ]
+        return [future.result() for future in futures]
+
+
 def analyze_check(
     check: dict[str, Any],
     repo_root: Path,
     max_lines: int,
     context: int,
+    runs: RunCache | None = None,
 ) -> dict[str, Any]:
     url = check.get("detailsUrl") or check.get("link") or ""
     run_id = extract_run_id(url)
@@ -252,11 +566,14 @@ def analyze_check(
         base["note"] = "No GitHub Actions run id detected in detailsUrl."
         return base
 
-    metadata = fetch_run_metadata(run_id, repo_root)
-    log_text, log_error, log_status = fetch_check_log(
+    runs = runs or RunCache(repo_root, max_lines, context)
+    metadata = runs.metadata(run_id)
+    log, log_error, log_status = fetch_check_log(
         run_id=run_id,
         job_id=job_id,
         repo_root=repo_root,
+        runs=runs,
+        job_name=str(check.get("name") or ""),
     )
 
     if log_status == "pending":
@@ -273,11 +590,11 @@ def analyze_check(
             base["run"] = metadata
         return base
 
-    snippet = extract_failure_snippet(log_text, max_lines=max_lines, context=context)
     base["status"] = "ok"
     base["run"] = metadata or {}
-    base["logSnippet"] = snippet
-    base["logTail"] = tail_lines(log_text, max_lines)
+    base["logSnippet"] = log.snippet() if log else ""
+    base["failureRegions"] = log.regions() if log else []
+    base["logTail"] = log.tail() if log else ""
     return base
 
 
@@ -330,47 +647,145 @@ def fetch_check_log(
     run_id: str,
     job_id: str | None,
     repo_root: Path,
-) -> tuple[str, str, str]:
-    log_text, log_error = fetch_run_log(run_id, repo_root)
+    runs: RunCache | None = None,
+    job_name: str = "",
+    max_lines: int = DEFAULT_MAX_LINES,
+    context: int = DEFAULT_CONTEXT_LINES,
+) -> tuple[LogAnalyzer | None, str, str]:
+    runs = runs or RunCache(repo_root, max_lines, context)
+    log, log_error = runs.job_log(run_id, job_name)
     if not log_error:
-        return log_text, "", "ok"
+        return log, "", "ok"
 
     if is_log_pending_message(log_error) and job_id:
-        job_log, job_error = fetch_job_log(job_id, repo_root)
+        job_log, job_error = fetch_job_log(
+            job_id, repo_root, runs.repo_slug(), runs.max_lines, runs.context, runs.regions
+        )
         if job_log:
             return job_log, "", "ok"
         if job_error and is_log_pending_message(job_error):
-            return "", job_error, "pending"
+            return None, job_error, "pending"
         if job_error:
-            return "", job_error, "error"
-        return "", log_error, "pending"
+            return None, job_error, "error"
+        return None, log_error, "pending"
 
     if is_log_pending_message(log_error):
-        return "", log_error, "pending"
+        return None, log_error, "pending"
+
+    return None, log_error, "error"
 
-    return "", log_error, "error"
 
+def stream_run_log(
+    run_id: str, repo_root: Path, max_lines: int, context: int, regions: int = DEFAULT_REGIONS
+) -> tuple[dict[str, LogAnalyzer], LogAnalyzer, str]:
+    """Stream `gh run view --log` once, analyzing every job's lines and the whole log.
 
-def fetch_run_log(run_id: str, repo_root: Path) -> tuple[str, str]:
-    result = run_gh_command(["run", "view", run_id, "--log"], cwd=repo_root)
+    Each line of that output is prefixed with "<job name>\t<step name>\t".
+    """
+    job_logs: dict[str, LogAnalyzer] = {}
+    run_log = LogAnalyzer(max_lines, context, regions)
+
+    def on_line(line: str) -> None:
+        signature = match_signature(line)
+        run_log.feed_matched(line, signature)
+        job_name, sep, _ = line.partition("\t")
+        if sep:
+            if job_name not in job_logs:
+                job_logs[job_name] = LogAnalyzer(max_lines, context, regions)
+            job_logs[job_name].feed_matched(line, signature)
+
+    result, _ = stream_gh_command(["run", "view", run_id, "--log"], repo_root, on_line)
     if result.returncode != 0:
-        error = (result.stderr or result.stdout or "").strip()
-        return "", error or "gh run view failed"
-    return result.stdout, ""
+        error = result.stderr.strip()
+        return {}, run_log, error or "gh run view failed"
+    # The analyzers are shared between worker threads from here on.
+    run_log.finish()
+    for job_log in job_logs.values():
+        job_log.finish()
+    return job_logs, run_log, ""
 
 
-def fetch_job_log(job_id: str, repo_root: Path) -> tuple[str, str]:
-    repo_slug = fetch_repo_slug(repo_root)
+def fetch_job_log(
+    job_id: str,
+    repo_root: Path,
+    repo_slug: str | None = None,
+    max_lines: int = DEFAULT_MAX_LINES,
+    context: int = DEFAULT_CONTEXT_LINES,
+    regions: int = DEFAULT_REGIONS,
+) -> tuple[LogAnalyzer | None, str]:
+    repo_slug = repo_slug or fetch_repo_slug(repo_root)
     if not repo_slug:
-        return "", "Error: unable to resolve repository name for job logs."
+        return None, "Error: unable to resolve repository name for job logs."
     endpoint = f"/repos/{repo_slug}/actions/jobs/{job_id}/logs"
-    returncode, stdout_bytes, stderr = run_gh_command_raw(["api", endpoint], cwd=repo_root)
-    if returncode != 0:
-        message = (stderr or stdout_bytes.decode(errors="replace")).strip()
-        return "", message or "gh api job logs failed"
-    if is_zip_payload(stdout_bytes):
-        return "", "Job logs returned a zip archive; unable to parse."
-    return stdout_bytes.decode(errors="replace"), ""
+    log = LogAnalyzer(max_lines, context, regions)
+    result, zip_payload = stream_gh_command(["api", endpoint], repo_root, log.feed)
+    if result.returncode != 0:
+        if zip_payload is not None:
+            zip_payload.close()
+        message = result.stderr.strip()
+        return None, message or "gh api job logs failed"
+    if zip_payload is not None:
+        with zip_payload:
+            error = feed_zipped_job_log(zip_payload, job_id, repo_root, repo_slug, log)
+        if error:
+            return None, error
+    return log.finish(), ""
+
+
+def feed_zipped_job_log(
+    payload: IO[bytes], job_id: str, repo_root: Path, repo_slug: str, log: LogAnalyzer
+) -> str:
+    """Feed the failing steps of a zipped job log to log; return an error message or "".
+
+    The archive holds one "<step number>_<step name>.txt" file per step. Only the files
+    of steps the job API reports as failed are decompressed, falling back to every step
+    in order when no failed step can be matched.
+    """
+    try:
+        archive = zipfile.ZipFile(payload)
+    except (zipfile.BadZipFile, OSError):
+        return "Job logs returned an unreadable zip archive."
+    with archive:
+        step_files: list[tuple[int, str]] = []
+        for name in archive.namelist():
+            match = STEP_LOG_NAME_RE.search(name)
+            if match:
+                step_files.append((int(match.group(1)), name))
+        if not step_files:
+            return "Job logs zip archive contains no step logs."
+        step_files.sort()
+        failed_steps = fetch_failed_step_numbers(job_id, repo_root, repo_slug)
+        selected = [name for number, name in step_files if number in failed_steps]
+        for name in selected or [name for _, name in step_files]:
+            try:
+                with archive.open(name) as member:
+                    for line in io.TextIOWrapper(member, encoding="utf-8", errors="replace"):
+                        log.feed(line.rstrip("\r\n"))
+            # Corrupt member data fails while reading (bad deflate stream, CRC mismatch,
+            # truncation), not when the archive is opened.
+            except (zipfile.BadZipFile, zlib.error, EOFError, OSError) as exc:
+                return f"Job logs zip archive is corrupt ({name}): {exc}"
+    return ""
+
+
+def fetch_failed_step_numbers(job_id: str, repo_root: Path, repo_slug: str) -> set[int]:
+    result = run_gh_command(["api", f"/repos/{repo_slug}/actions/jobs/{job_id}"], cwd=repo_root)
+    if result.returncode != 0:
+        return set()
+    try:
+        data = json.loads(result.stdout or "{}")
+    except json.JSONDecodeError:
+        return set()
+    steps = data.get("steps") if isinstance(data, dict) else None
+    if not isinstance(steps, list):
+        return set()
+    return {
+        step["number"]
+        for step in steps
+        if isinstance(step, dict)
+        and isinstance(step.get("number"), int)
+        and normalize_field(step.get("conclusion")) in FAILURE_CONCLUSIONS
+    }
 
 
 def fetch_repo_slug(repo_root: Path) -> str | None:
@@ -420,38 +835,52 @@ def is_zip_payload(payload: bytes) -> bool:
     return payload.startswith(b"PK")
 
 
-def extract_failure_snippet(log_text: str, max_lines: int, context: int) -> str:
-    lines = log_text.splitlines()
-    if not lines:
-        return ""
-
-    marker_index = find_failure_index(lines)
-    if marker_index is None:
-        return "\n".join(lines[-max_lines:])
-
-    start = max(0, marker_index - context)
-    end = min(len(lines), marker_index + context)
-    window = lines[start:end]
-    if len(window) > max_lines:
-        window = window[-max_lines:]
-    return "\n".join(window)
-
-
-def find_failure_index(lines: Sequence[str]) -> int | None:
-    for idx in range(len(lines) - 1, -1, -1):
-        lowered = lines[idx].lower()
-        if any(marker in lowered for marker in FAILURE_MARKERS):
-            return idx
+def strip_log_prefix(line: str) -> str:
+    """Drop the "<job>\\t<step>\\t" prefix of `gh run view --log` and the timestamp."""
+    parts = line.split("\t", 2)
+    # Only a real prefix is followed by a timestamp; go test prints "FAIL\\t<pkg>\\t<time>".
+    if len(parts) == 3 and parts[2].lstrip("\ufeff")[:4].isdigit():
+        line = parts[2]
+    if line[:1] == "\ufeff":
+        line = line[1:]
+    # Timestamps look like 2024-01-01T00:00:00.1234567Z.
+    if line[10:11] == "T" and line[4:5] == "-" and line[:4].isdigit():
+        end = line.find("Z", 19, 40)
+        if end != -1:
+            line = line[end + 2 :] if line[end + 1 : end + 2] == " " else line[end + 1 :]
+    return line
+
+
+def match_signature(line: str) -> tuple[str, int, str] | None:
+    """Return (name, weight, content) for the first signature matching line, if any."""
+    lowered = line.lower()
+    for marker in PREFILTER_MARKERS:
+        if marker in lowered:
+            break
+    else:
+        if "\x1b" not in line and not ANCHORED_SIGNATURE_RE.match(line):
+            return None
+    content = strip_log_prefix(line)
+    if "\x1b" in content:
+        content = ANSI_ESCAPE_RE.sub("", content)
+    match = SIGNATURE_CONTENT_RE.match(content)
+    best = int(match.lastgroup[1:]) if match else len(FAILURE_SIGNATURES)
+    for idx, pattern in UNANCHORED_SIGNATURES:
+        if idx >= best:
+            break
+        if pattern.search(content):
+            best = idx
+            break
+    if best < len(FAILURE_SIGNATURES):
+        name, weight, _ = FAILURE_SIGNATURES[best]
+        return name, weight, content
+    # Checked again without the prefix: a marker in the job or step name is not a failure.
+    lowered = content.lower()
+    if any(marker in lowered for marker in PREFILTER_MARKERS):
+        return (*GENERIC_SIGNATURE, content)
     return None
 
 
-def tail_lines(text: str, max_lines: int) -> str:
-    if max_lines <= 0:
-        return ""
-    lines = text.splitlines()
-    return "\n".join(lines[-max_lines:])
-
-
 def render_results(pr_number: str, results: Iterable[dict[str, Any]]) -> None:
     results_list = list(results)
     print(f"PR #{pr_number}: {len(results_list)} failing checks analyzed.")
@@ -494,6 +923,13 @@ def render_results(pr_number: str, results: Iterable[dict[str, Any]]) -> None:
             print(indent_block(snippet, prefix="  "))
         else:
             print("No snippet available.")
+        other_regions = (result.get("failureRegions") or [])[1:]
+        if other_regions:
+            print("Other failure regions:")
+            for region in other_regions:
+                signatures = ", ".join(region.get("signatures") or [])
+                print(f"  [line {region.get('line')}, score {region.get('score')}: {signatures}]")
+                print(indent_block(region.get("text") or "", prefix="    "))
     print("-" * 60)
 
 
@@ -3,27 +3,343 @@
 Skill Packager - Creates a distributable .skill file of a skill folder
 
 Usage:
-    python utils/package_skill.py <path/to/skill-folder> [output-directory]
+    python utils/package_skill.py <path/to/skill-folder> [output-directory] [--reproducible]
+        [--compresslevel N] [--jobs N] [--max-file-size SIZE] [--max-total-size SIZE]
+    python utils/package_skill.py --tree <path/to/skills-root> <output-directory> [options]
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
+    python utils/package_skill.py skills/public/my-skill ./dist --reproducible
+    python utils/package_skill.py --tree skills ./dist
 """
 
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import re
+import stat
 import sys
+import tempfile
+import time
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
-from quick_validate import validate_skill
+from quick_validate import ValidationCache, find_skills, validate_skill
 
+# Earliest timestamp a zip entry can hold; used unless SOURCE_DATE_EPOCH is set.
+REPRODUCIBLE_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+DEFAULT_COMPRESSLEVEL = 6
+MANIFEST_SUFFIX = ".manifest.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+DEFAULT_JOBS = min(8, os.cpu_count() or 1)
 
-def package_skill(skill_path, output_dir=None):
+# Formats that are already compressed; deflating them again costs time and saves nothing.
+STORED_SUFFIXES = {
+    ".7z", ".avif", ".br", ".bz2", ".docx", ".eot", ".gif", ".gz", ".heic", ".jar",
+    ".jpeg", ".jpg", ".m4a", ".mov", ".mp3", ".mp4", ".ogg", ".otf", ".pdf", ".png",
+    ".pptx", ".skill", ".tgz", ".webm", ".webp", ".woff", ".woff2", ".xlsx", ".xz",
+    ".zip", ".zst",
+}
+
+
+IGNORE_FILENAME = ".skillignore"
+# Applied before the skill's own .skillignore, which can re-include them with "!pattern".
+DEFAULT_IGNORE_PATTERNS = [
+    ".git/",
+    ".DS_Store",
+    "__pycache__/",
+    "*.pyc",
+    "node_modules/",
+    ".venv/",
+    "venv/",
+    IGNORE_FILENAME,
+]
+SIZE_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*([KMG]?)B?$", re.IGNORECASE)
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+MAX_OFFENDERS_SHOWN = 10
+TREE_INDEX_FILENAME = "index.json"
+TREE_INDEX_VERSION = 1
+
+
+def parse_size(value):
+    """Parse a size such as 512, 200K, 10MB or 1.5G into bytes"""
+    match = SIZE_RE.match(value.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid size: {value!r} (expected e.g. 500K, 10M, 1G)")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).upper()])
+
+
+def _ignore_pattern_regex(pattern):
+    """Translate one gitignore glob into a regex over the /-separated relative path"""
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            parts.append("/.*")
+            i += 3
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2 :]:
+            end = pattern.index("]", i + 2)
+            body = pattern[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body}]")
+            i = end + 1
+        elif pattern[i] == "\\" and i + 1 < len(pattern):
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    # Patterns without a slash match a name at any depth, like .gitignore.
+    prefix = "" if anchored else "(?:.*/)?"
+    return re.compile(f"^{prefix}{''.join(parts)}$")
+
+
+def load_ignore_rules(skill_path):
+    """Return (regex, negated, dir_only) rules from the defaults plus the skill's .skillignore"""
+    lines = list(DEFAULT_IGNORE_PATTERNS)
+    ignore_file = skill_path / IGNORE_FILENAME
+    if ignore_file.is_file():
+        lines.extend(ignore_file.read_text(encoding="utf-8").splitlines())
+    rules = []
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if line:
+            rules.append((_ignore_pattern_regex(line), negated, dir_only))
+    return rules
+
+
+def is_ignored(rel_path, is_dir, rules):
+    """Apply rules in order; the last matching rule decides, as in .gitignore"""
+    ignored = False
+    for regex, negated, dir_only in rules:
+        if dir_only and not is_dir:
+            continue
+        if regex.match(rel_path):
+            ignored = not negated
+    return ignored
+
+
+def collect_files(skill_path, rules=None):
+    """Return (file_path, arcname) pairs for a skill, sorted by arcname
+
+    Ignored directories are pruned during the walk, so their contents are never visited.
+    """
+    if rules is None:
+        rules = load_ignore_rules(skill_path)
+    files = []
+    for dirpath, dirnames, filenames in os.walk(skill_path):
+        rel_dir = Path(dirpath).relative_to(skill_path).as_posix()
+        rel_dir = "" if rel_dir == "." else f"{rel_dir}/"
+        dirnames[:] = [name for name in dirnames if not is_ignored(rel_dir + name, True, rules)]
+        for filename in filenames:
+            file_path = Path(dirpath) / filename
+            if is_ignored(rel_dir + filename, False, rules) or not file_path.is_file():
+                continue
+            files.append((file_path, file_path.relative_to(skill_path.parent).as_posix()))
+    return sorted(files, key=lambda item: item[1])
+
+
+def check_size_budget(files, max_file_size=None, max_total_size=None):
+    """Return error lines for files over max_file_size or a total over max_total_size"""
+    sizes = [(file_path.stat().st_size, arcname) for file_path, arcname in files]
+    errors = []
+    if max_file_size is not None:
+        too_big = [(size, arcname) for size, arcname in sizes if size > max_file_size]
+        if too_big:
+            errors.append(
+                f"{len(too_big)} file(s) exceed the per-file limit of {_format_size(max_file_size)}"
+            )
+    total = sum(size for size, _ in sizes)
+    if max_total_size is not None and total > max_total_size:
+        errors.append(
+            f"Total size {_format_size(total)} exceeds the limit of {_format_size(max_total_size)}"
+        )
+    if errors:
+        errors.append("Largest files:")
+        for size, arcname in sorted(sizes, reverse=True)[:MAX_OFFENDERS_SHOWN]:
+            errors.append(f"  {_format_size(size):>10}  {arcname}")
+    return errors
+
+
+def file_sha256(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file_handle:
+        for chunk in iter(lambda: file_handle.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compress_type_for(file_path):
+    """Store already-compressed formats as-is and deflate everything else"""
+    if file_path.suffix.lower() in STORED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def archive_mode(file_path):
+    """Permissions recorded for a member in reproducible mode: only the exec bit survives"""
+    return 0o755 if file_path.stat().st_mode & stat.S_IXUSR else 0o644
+
+
+def build_manifest(skill_name, files, compresslevel=DEFAULT_COMPRESSLEVEL, jobs=DEFAULT_JOBS):
+    """Per-file SHA-256 manifest plus one content hash covering every path, mode and digest
+
+    The archive's own digest is added as "archive_sha256" once it has been written.
+    """
+
+    def entry_for(item):
+        file_path, arcname = item
+        return {
+            "path": arcname,
+            "size": file_path.stat().st_size,
+            "mode": f"{archive_mode(file_path):o}",
+            "sha256": file_sha256(file_path),
+        }
+
+    # hashlib releases the GIL on large buffers, so threads hash files in parallel.
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        entries = list(pool.map(entry_for, files))
+    content = hashlib.sha256()
+    for entry in entries:
+        content.update(f"{entry['path']}\0{entry['mode']}\0{entry['sha256']}\n".encode("utf-8"))
+    return {
+        "skill": skill_name,
+        "content_sha256": content.hexdigest(),
+        "compresslevel": compresslevel,
+        "files": entries,
+    }
+
+
+def read_manifest(manifest_path):
+    try:
+        return json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def is_up_to_date(skill_filename, previous, manifest):
+    """True if the archive on disk is the one previous describes and its content still matches
+
+    The archive's own hash is checked too, so an archive rewritten by a non-reproducible
+    run, or truncated by an interrupted one, is rebuilt rather than kept.
+    """
+    if not previous or not skill_filename.is_file():
+        return False
+    if previous.get("content_sha256") != manifest["content_sha256"]:
+        return False
+    if previous.get("compresslevel") != manifest["compresslevel"]:
+        return False
+    return previous.get("archive_sha256") == file_sha256(skill_filename)
+
+
+def _write_atomic(path, write):
+    """Call write(tmp_path) for a temporary file next to path, then move it into place"""
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _reproducible_date_time():
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch and epoch.isdigit():
+        return max(REPRODUCIBLE_DATE_TIME, time.gmtime(int(epoch))[:6])
+    return REPRODUCIBLE_DATE_TIME
+
+
+def _write_reproducible(zipf, file_path, arcname, date_time, compresslevel):
+    """Write one entry with fixed metadata so identical content yields identical bytes"""
+    zinfo = zipfile.ZipInfo(arcname, date_time=date_time)
+    zinfo.create_system = 3
+    zinfo.external_attr = (stat.S_IFREG | archive_mode(file_path)) << 16
+    zinfo.compress_type = compress_type_for(file_path)
+    zinfo.file_size = file_path.stat().st_size
+    if zinfo.compress_type == zipfile.ZIP_STORED or compresslevel == DEFAULT_COMPRESSLEVEL:
+        # Stored members need no level, and zipf.open() deflates at zlib's default,
+        # which is level 6, so these are streamed from disk.
+        with open(file_path, "rb") as src, zipf.open(zinfo, "w") as dest:
+            for chunk in iter(lambda: src.read(HASH_CHUNK_SIZE), b""):
+                dest.write(chunk)
+    else:
+        # writestr is the only public way to give a ZipInfo member another compression
+        # level, so with a non-default --compresslevel those files are read whole.
+        zipf.writestr(zinfo, file_path.read_bytes(), compresslevel=compresslevel)
+    return zipf.getinfo(arcname)
+
+
+def _write_member(zipf, file_path, arcname, compresslevel):
+    """Write one entry streamed from disk, keeping the file's own timestamp and mode"""
+    zipf.write(
+        file_path,
+        arcname,
+        compress_type=compress_type_for(file_path),
+        compresslevel=compresslevel,
+    )
+    return zipf.getinfo(arcname)
+
+
+def _format_size(num_bytes):
+    for unit in ("B", "KB", "MB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.0f} {unit}" if unit == "B" else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+
+def package_skill(
+    skill_path,
+    output_dir=None,
+    reproducible=False,
+    compresslevel=DEFAULT_COMPRESSLEVEL,
+    jobs=DEFAULT_JOBS,
+    max_file_size=None,
+    max_total_size=None,
+):
     """
     Package a skill folder into a .skill file.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file (defaults to current directory)
+        reproducible: Write sorted entries with normalized timestamps and permissions, plus a
+            <name>.skill.manifest.json sidecar; unchanged content leaves the archive untouched
+        compresslevel: Deflate level (0-9) for compressible files; known compressed
+            formats (PNG, fonts, PDFs, zips, ...) are always stored
+        jobs: Worker threads used to hash files for the manifest (reproducible only)
+        max_file_size: Optional per-file size limit in bytes
+        max_total_size: Optional limit in bytes for the sum of all packaged files
+
+    Files matching the skill's .skillignore (gitignore syntax) or the default ignore
+    patterns (__pycache__, .DS_Store, node_modules, virtualenvs, ...) are left out.
 
     Returns:
         Path to the created .skill file, or None if error
@@ -47,7 +363,9 @@ def package_skill(skill_path, output_dir=None):
 
     # Run validation before packaging
     print("Validating skill...")
-    valid, message = validate_skill(skill_path)
+    cache = ValidationCache()
+    valid, message = validate_skill(skill_path, cache)
+    cache.save()
     if not valid:
         print(f"[ERROR] Validation failed: {message}")
         print("   Please fix the validation errors before packaging.")
@@ -63,18 +381,67 @@ def package_skill(skill_path, output_dir=None):
         output_path = Path.cwd()
 
     skill_filename = output_path / f"{skill_name}.skill"
+    manifest_filename = output_path / f"{skill_name}.skill{MANIFEST_SUFFIX}"
+    timings = {}
+    started = time.perf_counter()
+    files = collect_files(skill_path)
+    timings["scan"] = time.perf_counter() - started
 
-    # Create the .skill file (zip format)
+    budget_errors = check_size_budget(files, max_file_size, max_total_size)
+    if budget_errors:
+        print("[ERROR] Size budget exceeded:")
+        for line in budget_errors:
+            print(f"   {line}")
+        return None
+
+    manifest = None
+    if reproducible:
+        started = time.perf_counter()
+        manifest = build_manifest(skill_name, files, compresslevel, jobs)
+        timings["hash"] = time.perf_counter() - started
+        if is_up_to_date(skill_filename, read_manifest(manifest_filename), manifest):
+            print(f"[OK] Content unchanged ({manifest['content_sha256'][:12]}), keeping: {skill_filename}")
+            return skill_filename
+
+    # Create the .skill file (zip format) next to its destination and move it into place
+    # once complete, so an interrupted run never leaves a truncated archive behind.
     try:
-        with zipfile.ZipFile(skill_filename, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob("*"):
-                if file_path.is_file():
-                    # Calculate the relative path within the zip
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
+        started = time.perf_counter()
+        date_time = _reproducible_date_time()
+        bytes_in = 0
+
+        def write_archive(tmp_path):
+            nonlocal bytes_in
+            with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+                for file_path, arcname in files:
+                    if reproducible:
+                        zinfo = _write_reproducible(zipf, file_path, arcname, date_time, compresslevel)
+                    else:
+                        zinfo = _write_member(zipf, file_path, arcname, compresslevel)
+                    bytes_in += zinfo.file_size
+                    stored = " (stored)" if zinfo.compress_type == zipfile.ZIP_STORED else ""
+                    print(f"  Added: {arcname}{stored}")
 
+        _write_atomic(skill_filename, write_archive)
+        timings["write"] = time.perf_counter() - started
+
+        if manifest:
+            manifest["archive_sha256"] = file_sha256(skill_filename)
+            _write_atomic(
+                manifest_filename,
+                lambda tmp_path: tmp_path.write_text(json.dumps(manifest, indent=2) + "\n"),
+            )
+            print(f"  Manifest: {manifest_filename}")
+        elif manifest_filename.exists():
+            # The manifest described the archive this run just replaced.
+            manifest_filename.unlink()
+
+        bytes_out = skill_filename.stat().st_size
+        phases = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in timings.items())
+        print(
+            f"\n  {len(files)} files: {_format_size(bytes_in)} in -> {_format_size(bytes_out)} out"
+            f" ({phases})"
+        )
         print(f"\n[OK] Successfully packaged skill to: {skill_filename}")
         return skill_filename
 
@@ -83,23 +450,191 @@ def package_skill(skill_path, output_dir=None):
         return None
 
 
+def _package_tree_worker(skill_path, output_dir, options):
+    """Package one skill with its output captured, returning a result dict for the index"""
+    skill_name = Path(skill_path).name
+    skill_filename = Path(output_dir) / f"{skill_name}.skill"
+    try:
+        before = skill_filename.stat().st_mtime_ns
+    except OSError:
+        before = None
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        result = package_skill(skill_path, output_dir, reproducible=True, jobs=1, **options)
+    if not result:
+        return {"name": skill_name, "path": str(skill_path), "status": "failed", "log": log.getvalue()}
+    return {
+        "name": skill_name,
+        "path": str(skill_path),
+        "status": "unchanged" if skill_filename.stat().st_mtime_ns == before else "built",
+    }
+
+
+def package_tree(root, output_dir, jobs=DEFAULT_JOBS, **options):
+    """
+    Package every skill (directory with a SKILL.md) under root into output_dir.
+
+    Skills are packaged reproducibly in a process pool; a skill whose content hash
+    matches its existing manifest keeps its archive. An index.json listing every
+    archive with its size and hashes is written to output_dir.
+
+    Returns:
+        True if every skill was packaged, False otherwise
+    """
+    root = Path(root).resolve()
+    output_path = Path(output_dir).resolve()
+    skill_paths = [path for path in find_skills(root) if output_path not in path.parents]
+    if not skill_paths:
+        print(f"[ERROR] No SKILL.md found under {root}")
+        return False
+
+    seen = {}
+    for path in skill_paths:
+        if path.name in seen:
+            print(f"[ERROR] Duplicate skill name '{path.name}': {seen[path.name]} and {path}")
+            return False
+        seen[path.name] = path
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    started = time.perf_counter()
+    workers = max(1, min(jobs, len(skill_paths)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            path: pool.submit(_package_tree_worker, str(path), str(output_path), options)
+            for path in skill_paths
+        }
+        results = []
+        for path, future in futures.items():
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # A crashed (or killed) worker fails its own skill, not the whole tree.
+                results.append(
+                    {
+                        "name": path.name,
+                        "path": str(path),
+                        "status": "failed",
+                        "log": f"[ERROR] Packaging crashed: {type(e).__name__}: {e}",
+                    }
+                )
+
+    entries = []
+    for result in sorted(results, key=lambda item: item["name"]):
+        print(f"  {result['status']:>9}: {result['name']}")
+        if result["status"] == "failed":
+            for line in result["log"].strip().splitlines():
+                print(f"      {line}")
+            continue
+        skill_filename = output_path / f"{result['name']}.skill"
+        manifest = read_manifest(output_path / f"{result['name']}.skill{MANIFEST_SUFFIX}") or {}
+        entries.append(
+            {
+                "name": result["name"],
+                "source": Path(result["path"]).relative_to(root).as_posix(),
+                "archive": skill_filename.name,
+                "size": skill_filename.stat().st_size,
+                "sha256": file_sha256(skill_filename),
+                "content_sha256": manifest.get("content_sha256"),
+            }
+        )
+
+    index_filename = output_path / TREE_INDEX_FILENAME
+    index_filename.write_text(
+        json.dumps({"version": TREE_INDEX_VERSION, "skills": entries}, indent=2) + "\n"
+    )
+    counts = {
+        status: sum(1 for result in results if result["status"] == status)
+        for status in ("built", "unchanged", "failed")
+    }
+    print(
+        f"\n  {len(results)} skills: {counts['built']} built, {counts['unchanged']} unchanged,"
+        f" {counts['failed']} failed ({time.perf_counter() - started:.2f}s)"
+    )
+    print(f"  Index: {index_filename}")
+    return counts["failed"] == 0
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
-        print("\nExample:")
-        print("  python utils/package_skill.py skills/public/my-skill")
-        print("  python utils/package_skill.py skills/public/my-skill ./dist")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Package a skill folder into a distributable .skill file.",
+        usage="python utils/package_skill.py <path/to/skill-folder> [output-directory] [options]",
+    )
+    parser.add_argument("skill_path", help="Path to the skill folder (or the skills root with --tree)")
+    parser.add_argument("output_dir", nargs="?", help="Output directory (defaults to current directory)")
+    parser.add_argument(
+        "--reproducible",
+        action="store_true",
+        help="Byte-for-byte reproducible archive with a SHA-256 manifest sidecar",
+    )
+    parser.add_argument(
+        "--tree",
+        action="store_true",
+        help="Package every skill under skill_path (implies --reproducible; skips unchanged skills)",
+    )
+    parser.add_argument(
+        "--compresslevel",
+        type=int,
+        choices=range(10),
+        default=DEFAULT_COMPRESSLEVEL,
+        metavar="0-9",
+        help=f"Deflate level for compressible files (default: {DEFAULT_COMPRESSLEVEL})",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help=(
+            "Worker threads for hashing the manifest with --reproducible, or worker processes"
+            f" with --tree (default: {DEFAULT_JOBS}); members are always compressed in order"
+        ),
+    )
+    parser.add_argument(
+        "--max-file-size",
+        type=parse_size,
+        metavar="SIZE",
+        help="Fail if any packaged file is larger than SIZE (e.g. 5M)",
+    )
+    parser.add_argument(
+        "--max-total-size",
+        type=parse_size,
+        metavar="SIZE",
+        help="Fail if the packaged files add up to more than SIZE (e.g. 50M)",
+    )
+    args = parser.parse_args()
+    if args.jobs is not None and not (args.reproducible or args.tree):
+        parser.error("--jobs only applies with --reproducible or --tree")
+    if args.jobs is None:
+        args.jobs = DEFAULT_JOBS
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    if args.tree:
+        if not args.output_dir:
+            parser.error("--tree requires an output directory")
+        print(f"Packaging skills under: {args.skill_path}")
+        print(f"   Output directory: {args.output_dir}")
+        print()
+        ok = package_tree(
+            args.skill_path,
+            args.output_dir,
+            jobs=args.jobs,
+            compresslevel=args.compresslevel,
+            max_file_size=args.max_file_size,
+            max_total_size=args.max_total_size,
+        )
+        sys.exit(0 if ok else 1)
 
-    print(f"Packaging skill: {skill_path}")
-    if output_dir:
-        print(f"   Output directory: {output_dir}")
+    print(f"Packaging skill: {args.skill_path}")
+    if args.output_dir:
+        print(f"   Output directory: {args.output_dir}")
     print()
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(
+        args.skill_path,
+        args.output_dir,
+        reproducible=args.reproducible,
+        compresslevel=args.compresslevel,
+        jobs=args.jobs,
+        max_file_size=args.max_file_size,
+        max_total_size=args.max_total_size,
+    )
 
     if result:
         sys.exit(0)
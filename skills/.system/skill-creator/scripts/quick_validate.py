@@ -1,101 +1,473 @@
 #!/usr/bin/env python3
 """
 Quick validation script for skills - minimal version
+
+Usage:
+    python quick_validate.py <skill_directory>
+    python quick_validate.py <skill_directory> [<skill_directory> ...] [--format json|junit]
+    python quick_validate.py --root skills/ [--jobs N] [--format json|junit] [--output report]
 """
 
+import argparse
+import hashlib
+import io
+import json
+import os
 import re
 import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import yaml
-
 MAX_SKILL_NAME_LENGTH = 64
+SKIPPED_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv"}
+# Bump whenever a validation rule or message changes so cached results are discarded.
+VALIDATOR_VERSION = 2
+MAX_CACHE_ENTRIES = 10000
+SIMPLE_LINE_RE = re.compile(r"^(name|description|license|metadata):(?: +(\S.*))?$")
+NESTED_LINE_RE = re.compile(r"^( +)([A-Za-z0-9_-]+): +(\S.*)$")
+# Leading characters that make a YAML plain scalar something other than a plain string
+# (indicators, quotes, numbers, signs, .inf/.nan, merge keys, nulls).
+UNSAFE_PLAIN_START = set("-?:,[]{}#&*!|>'\"%@`.+=<~0123456789")
+# YAML 1.1 words PyYAML resolves to booleans or null.
+YAML_SPECIAL_WORDS = {"y", "n", "yes", "no", "true", "false", "on", "off", "null"}
+
+
+class ValidationCache:
+    """On-disk map from SKILL.md content hash (and validator version) to validation errors"""
+
+    def __init__(self, path=None):
+        if path is None:
+            codex_home = os.environ.get("CODEX_HOME", os.path.expanduser("~/.codex"))
+            path = Path(codex_home) / "cache" / "skill-validation.json"
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._updates = {}
+        self.entries = self._load()
+
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        entries = data.get("entries") if isinstance(data, dict) else None
+        return entries if isinstance(entries, dict) else {}
+
+    @staticmethod
+    def key_for(skill_path):
+        """Cache key for a skill, or None if it has no SKILL.md to hash
+
+        Validation only looks at the frontmatter block, so only that is read and hashed.
+        """
+        try:
+            frontmatter_text, error = read_frontmatter(Path(skill_path) / "SKILL.md")
+        except (OSError, UnicodeDecodeError):
+            return None
+        material = f"v{VALIDATOR_VERSION}\0{error}\0{frontmatter_text}"
+        return hashlib.sha256(material.encode("utf-8", "surrogatepass")).hexdigest()
 
+    def get(self, key):
+        errors = self.entries.get(key) if key else None
+        if isinstance(errors, list):
+            self.hits += 1
+            return errors
+        self.misses += 1
+        return None
 
-def validate_skill(skill_path):
+    def put(self, key, errors):
+        if not key:
+            return
+        self.entries.pop(key, None)
+        self.entries[key] = errors
+        self._updates[key] = errors
+
+    def save(self):
+        """Write this instance's new entries on top of whatever is on disk now
+
+        Other processes (e.g. package_skill.py --tree workers) may have saved since this
+        cache was loaded, so their entries are merged in rather than overwritten.
+        """
+        if not self._updates:
+            return
+        self.entries = self._load()
+        for key, errors in self._updates.items():
+            self.entries.pop(key, None)
+            self.entries[key] = errors
+        # Entries are kept in insertion order, so trimming from the front drops the oldest.
+        keys = list(self.entries)
+        for key in keys[: max(0, len(keys) - MAX_CACHE_ENTRIES)]:
+            del self.entries[key]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.path.parent)
+            with os.fdopen(fd, "w") as file_handle:
+                json.dump({"version": VALIDATOR_VERSION, "entries": self.entries}, file_handle)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            return
+        self._updates = {}
+
+    def stats(self):
+        return f"validation cache: {self.hits} hit(s), {self.misses} miss(es)"
+
+
+def validate_skill(skill_path, cache=None):
     """Basic validation of a skill"""
+    key = cache.key_for(skill_path) if cache else None
+    errors = cache.get(key) if key else None
+    if errors is None:
+        errors = collect_errors(skill_path)
+        if cache:
+            cache.put(key, errors)
+    if errors:
+        return False, errors[0]
+    return True, "Skill is valid!"
+
+
+def collect_errors(skill_path):
+    """Return every validation error for a skill, in the order validate_skill reports them"""
     skill_path = Path(skill_path)
 
     skill_md = skill_path / "SKILL.md"
     if not skill_md.exists():
-        return False, "SKILL.md not found"
+        return ["SKILL.md not found"]
+
+    try:
+        frontmatter_text, error = read_frontmatter(skill_md)
+    except (OSError, UnicodeDecodeError) as e:
+        return [f"Unable to read SKILL.md: {e}"]
+    return _text_errors(frontmatter_text, error)
+
+
+def collect_content_errors(content):
+    """Same as collect_errors, for SKILL.md content that is not on disk (e.g. in an archive)"""
+    return _text_errors(*read_frontmatter_text(content))
+
+
+def _text_errors(frontmatter_text, error):
+    if error:
+        return [error]
+    frontmatter, error = load_frontmatter(frontmatter_text)
+    if error:
+        return [error]
+    return _frontmatter_errors(frontmatter)
 
-    content = skill_md.read_text()
-    if not content.startswith("---"):
-        return False, "No YAML frontmatter found"
 
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
-        return False, "Invalid frontmatter format"
+def load_frontmatter(frontmatter_text):
+    """Parse frontmatter text, returning (frontmatter, None) or (None, error)
 
-    frontmatter_text = match.group(1)
+    Raises ImportError if the text needs PyYAML and it is not installed.
+    """
+    frontmatter = parse_simple_frontmatter(frontmatter_text)
+    if frontmatter is not None:
+        return frontmatter, None
+    # Anything beyond flat name/description/license scalars goes through PyYAML.
+    import yaml
 
     try:
         frontmatter = yaml.safe_load(frontmatter_text)
-        if not isinstance(frontmatter, dict):
-            return False, "Frontmatter must be a YAML dictionary"
     except yaml.YAMLError as e:
-        return False, f"Invalid YAML in frontmatter: {e}"
+        return None, f"Invalid YAML in frontmatter: {e}"
+    if not isinstance(frontmatter, dict):
+        return None, "Frontmatter must be a YAML dictionary"
+    return frontmatter, None
+
+
+def read_frontmatter(skill_md):
+    """Read SKILL.md up to the closing '---' line and return (frontmatter_text, error)
+
+    Matches the block that r"^---\n(.*?)\n---" would capture from the whole file, without
+    reading the body.
+    """
+    with open(skill_md) as file_handle:
+        return _frontmatter_block(file_handle)
+
+
+def read_frontmatter_text(content):
+    """Same as read_frontmatter, for SKILL.md content already in memory"""
+    return _frontmatter_block(io.StringIO(content, newline=None))
+
+
+def _frontmatter_block(file_handle):
+    first_line = file_handle.readline()
+    if not first_line.startswith("---"):
+        return None, "No YAML frontmatter found"
+    if first_line != "---\n":
+        return None, "Invalid frontmatter format"
+    lines = []
+    for line in file_handle:
+        if lines and line.startswith("---"):
+            return "".join(lines)[:-1], None
+        lines.append(line)
+    return None, "Invalid frontmatter format"
 
+
+def parse_simple_frontmatter(frontmatter_text):
+    """Parse flat scalars plus a one-level metadata mapping, or return None to defer to PyYAML
+
+    Only values PyYAML would load as the same plain strings are accepted.
+    """
+    frontmatter = {}
+    nested = None
+    indent = None
+    for line in frontmatter_text.split("\n"):
+        if not line.strip():
+            continue
+        match = NESTED_LINE_RE.match(line)
+        if match and nested is not None:
+            key = match.group(2)
+            if indent not in (None, match.group(1)) or key in nested or _simple_scalar(key) != key:
+                return None
+            indent = match.group(1)
+            value = _simple_scalar(match.group(3).rstrip(" "))
+            if value is None:
+                return None
+            nested[key] = value
+            continue
+        if nested is not None and not nested:
+            return None
+        match = SIMPLE_LINE_RE.match(line)
+        if not match or match.group(1) in frontmatter:
+            return None
+        key, raw_value = match.group(1), match.group(2)
+        if key == "metadata":
+            if raw_value is not None:
+                return None
+            nested = frontmatter[key] = {}
+            indent = None
+            continue
+        nested = None
+        value = _simple_scalar(raw_value.rstrip(" ")) if raw_value is not None else None
+        if value is None:
+            return None
+        frontmatter[key] = value
+    if nested is not None and not nested:
+        return None
+    return frontmatter or None
+
+
+def _simple_scalar(value):
+    if not value.isprintable():
+        return None
+    if len(value) >= 2 and value[0] == value[-1] == "'" and "'" not in value[1:-1]:
+        return value[1:-1]
+    if len(value) >= 2 and value[0] == value[-1] == '"' and not set('"\\') & set(value[1:-1]):
+        return value[1:-1]
+    if value[0] in UNSAFE_PLAIN_START or value.lower() in YAML_SPECIAL_WORDS:
+        return None
+    if ": " in value or " #" in value or value.endswith(":"):
+        return None
+    return value
+
+
+def _frontmatter_errors(frontmatter):
+    errors = []
     allowed_properties = {"name", "description", "license", "allowed-tools", "metadata"}
 
     unexpected_keys = set(frontmatter.keys()) - allowed_properties
     if unexpected_keys:
         allowed = ", ".join(sorted(allowed_properties))
         unexpected = ", ".join(sorted(unexpected_keys))
-        return (
-            False,
-            f"Unexpected key(s) in SKILL.md frontmatter: {unexpected}. Allowed properties are: {allowed}",
+        errors.append(
+            f"Unexpected key(s) in SKILL.md frontmatter: {unexpected}. Allowed properties are: {allowed}"
         )
 
     if "name" not in frontmatter:
-        return False, "Missing 'name' in frontmatter"
+        errors.append("Missing 'name' in frontmatter")
     if "description" not in frontmatter:
-        return False, "Missing 'description' in frontmatter"
+        errors.append("Missing 'description' in frontmatter")
 
     name = frontmatter.get("name", "")
     if not isinstance(name, str):
-        return False, f"Name must be a string, got {type(name).__name__}"
+        errors.append(f"Name must be a string, got {type(name).__name__}")
+        name = ""
     name = name.strip()
     if name:
         if not re.match(r"^[a-z0-9-]+$", name):
-            return (
-                False,
-                f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)",
+            errors.append(
+                f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
             )
         if name.startswith("-") or name.endswith("-") or "--" in name:
-            return (
-                False,
-                f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens",
+            errors.append(
+                f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens"
             )
         if len(name) > MAX_SKILL_NAME_LENGTH:
-            return (
-                False,
+            errors.append(
                 f"Name is too long ({len(name)} characters). "
-                f"Maximum is {MAX_SKILL_NAME_LENGTH} characters.",
+                f"Maximum is {MAX_SKILL_NAME_LENGTH} characters."
             )
 
     description = frontmatter.get("description", "")
     if not isinstance(description, str):
-        return False, f"Description must be a string, got {type(description).__name__}"
+        errors.append(f"Description must be a string, got {type(description).__name__}")
+        description = ""
     description = description.strip()
     if description:
         if "<" in description or ">" in description:
-            return False, "Description cannot contain angle brackets (< or >)"
+            errors.append("Description cannot contain angle brackets (< or >)")
         if len(description) > 1024:
-            return (
-                False,
-                f"Description is too long ({len(description)} characters). Maximum is 1024 characters.",
+            errors.append(
+                f"Description is too long ({len(description)} characters). Maximum is 1024 characters."
             )
 
-    return True, "Skill is valid!"
+    return errors
 
 
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python quick_validate.py <skill_directory>")
-        sys.exit(1)
+def _validate_timed(skill_path):
+    start = time.perf_counter()
+    crashed = False
+    try:
+        errors = collect_errors(skill_path)
+    except Exception as e:
+        # One broken skill must not take the rest of the batch (and its report) down.
+        errors = [f"Validation crashed: {type(e).__name__}: {e}"]
+        crashed = True
+    return {
+        "path": str(skill_path),
+        "valid": not errors,
+        "errors": errors,
+        "seconds": round(time.perf_counter() - start, 6),
+        "crashed": crashed,
+    }
+
+
+def find_skills(root):
+    """Find every directory under root that contains a SKILL.md"""
+    skills = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIPPED_DIRS)
+        if "SKILL.md" in filenames:
+            skills.append(Path(dirpath))
+    return skills
+
+
+def validate_many(skill_paths, jobs=None, cache=None):
+    """Validate skills in a process pool, returning one result dict per skill in input order
+
+    Skills whose SKILL.md hash is in the cache are answered without being revalidated.
+    """
+    skill_paths = [str(path) for path in skill_paths]
+    results = [None] * len(skill_paths)
+    pending = []
+    for idx, path in enumerate(skill_paths):
+        start = time.perf_counter()
+        key = cache.key_for(path) if cache else None
+        errors = cache.get(key) if key else None
+        if errors is None:
+            pending.append((idx, key))
+            continue
+        results[idx] = {
+            "path": path,
+            "valid": not errors,
+            "errors": errors,
+            "seconds": round(time.perf_counter() - start, 6),
+            "crashed": False,
+            "cached": True,
+        }
 
-    valid, message = validate_skill(sys.argv[1])
-    print(message)
-    sys.exit(0 if valid else 1)
+    pending_paths = [skill_paths[idx] for idx, _ in pending]
+    if jobs == 1 or len(pending_paths) < 2:
+        fresh = [_validate_timed(path) for path in pending_paths]
+    else:
+        workers = min(jobs or os.cpu_count() or 1, len(pending_paths))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(pending_paths) // (workers * 4))
+            fresh = list(pool.map(_validate_timed, pending_paths, chunksize=chunksize))
+    for (idx, key), result in zip(pending, fresh):
+        # Crashes (e.g. PyYAML missing) are not a property of the content, so not cached.
+        if cache and not result["crashed"]:
+            cache.put(key, result["errors"])
+        results[idx] = {**result, "cached": False}
+    return results
+
+
+def format_junit(results, total_seconds):
+    suite = ET.Element(
+        "testsuite",
+        name="skill-validation",
+        tests=str(len(results)),
+        failures=str(sum(1 for result in results if not result["valid"])),
+        time=f"{total_seconds:.3f}",
+    )
+    for result in results:
+        case = ET.SubElement(
+            suite,
+            "testcase",
+            classname="quick_validate",
+            name=result["path"],
+            time=f"{result['seconds']:.6f}",
+        )
+        if not result["valid"]:
+            failure = ET.SubElement(case, "failure", message=result["errors"][0])
+            failure.text = "\n".join(result["errors"])
+    return ET.tostring(suite, encoding="unicode")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate one or more skill directories.")
+    parser.add_argument("skill_directories", nargs="*", help="Skill directories to validate")
+    parser.add_argument("--root", action="append", default=[], help="Validate every skill under this directory")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--format", choices=["text", "json", "junit"], default="text")
+    parser.add_argument("--output", help="Write the report to this file instead of stdout")
+    parser.add_argument("--no-cache", action="store_true", help="Revalidate every skill, ignoring cached results")
+    args = parser.parse_args()
+    cache = None if args.no_cache else ValidationCache()
+
+    skill_paths = [Path(path) for path in args.skill_directories]
+    for root in args.root:
+        skill_paths.extend(find_skills(root))
+    if not skill_paths:
+        parser.error("provide at least one skill directory or --root")
+
+    # Single-skill text mode keeps the original one-line output.
+    if len(skill_paths) == 1 and args.format == "text" and not args.output:
+        valid, message = validate_skill(skill_paths[0], cache)
+        if cache:
+            cache.save()
+        print(message)
+        sys.exit(0 if valid else 1)
+
+    start = time.perf_counter()
+    results = validate_many(skill_paths, args.jobs, cache)
+    total_seconds = time.perf_counter() - start
+    if cache:
+        cache.save()
+        print(cache.stats(), file=sys.stderr)
+    failed = sum(1 for result in results if not result["valid"])
+
+    if args.format == "json":
+        report = json.dumps(
+            {
+                "valid": failed == 0,
+                "total": len(results),
+                "failed": failed,
+                "seconds": round(total_seconds, 6),
+                "skills": results,
+            },
+            indent=2,
+        )
+    elif args.format == "junit":
+        report = format_junit(results, total_seconds)
+    else:
+        lines = []
+        for result in results:
+            if result["valid"]:
+                lines.append(f"[OK] {result['path']}")
+            else:
+                lines.extend(f"[ERROR] {result['path']}: {error}" for error in result["errors"])
+        lines.append(f"{len(results) - failed}/{len(results)} skills valid ({total_seconds:.2f}s)")
+        report = "\n".join(lines)
+
+    if args.output:
+        Path(args.output).write_text(report + "\n")
+    else:
+        print(report)
+    sys.exit(0 if failed == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,19 +3,503 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import http.client
+import io
+import json
 import os
+import random
+import re
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
 import urllib.request
+from dataclasses import dataclass
+from typing import Callable, TypeVar
 
+from skill_state import file_lock, write_json_atomic
 
-def github_request(url: str, user_agent: str) -> bytes:
-    headers = {"User-Agent": user_agent}
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+REQUEST_TIMEOUT_SECONDS = 60
+GITHUB_HOSTS = {"github.com", "api.github.com", "codeload.github.com"}
+MAX_RETRIES = 4
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+# Rate-limit waits longer than this fail fast instead of stalling the caller.
+MAX_RATE_LIMIT_WAIT_SECONDS = 60.0
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+REQUESTS_PER_SECOND = 10.0
+REQUEST_BURST = 20
+COMMIT_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+REF_CACHE_TTL_SECONDS = 5 * 60
+# In the archive cache directory: readers hold it shared, eviction holds it exclusively.
+ARCHIVE_LOCK_FILENAME = ".archives.lock"
+T = TypeVar("T")
+# Connection-level failures that mean a kept-alive socket went stale.
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+def _codex_home() -> str:
+    return os.environ.get("CODEX_HOME", os.path.expanduser("~/.codex"))
+
+
+def _is_github_host(host: str) -> bool:
+    return host in GITHUB_HOSTS or host.endswith(".githubusercontent.com")
+
+
+def _github_headers(
+    user_agent: str, extra_headers: dict[str, str] | None = None
+) -> dict[str, str]:
+    headers = {"User-Agent": user_agent, **(extra_headers or {})}
     token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
     if token:
         headers["Authorization"] = f"token {token}"
-    req = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(req) as resp:
-        return resp.read()
+    return headers
+
+
+@dataclass
+class RequestStats:
+    requests: int = 0
+    not_modified: int = 0
+    retries: int = 0
+    wait_seconds: float = 0.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket that paces requests shared by every client in the process."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available; return seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for `seconds`, e.g. until a rate-limit window resets."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+_bucket = TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST)
+
+
+def _backoff_delay(attempt: int) -> float:
+    return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt))
+
+
+def _rate_limit_delay(headers: http.client.HTTPMessage | None) -> float | None:
+    """Seconds GitHub asks us to wait, from Retry-After or an exhausted X-RateLimit window."""
+    if headers is None:
+        return None
+    retry_after = headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    reset = headers.get("X-RateLimit-Reset")
+    if headers.get("X-RateLimit-Remaining") == "0" and reset and reset.isdigit():
+        return max(0.0, int(reset) - time.time()) + 1
+    return None
+
+
+def _is_rate_limited(exc: urllib.error.HTTPError) -> bool:
+    if exc.code == 429 or _rate_limit_delay(exc.headers) is not None:
+        return True
+    body = exc.fp.getvalue() if isinstance(exc.fp, io.BytesIO) else b""
+    return exc.code == 403 and b"rate limit" in body.lower()
+
+
+class KeepAliveHTTPSHandler(urllib.request.HTTPSHandler):
+    """HTTPSHandler that keeps one direct connection per host and thread alive.
+
+    Requests tunnelled through a proxy by urllib's ProxyHandler go through the stock
+    handler. A pooled connection is only reused once its previous response was read
+    to the end; callers that stop early must call discard() for that host.
+    """
+
+    connection_class = http.client.HTTPSConnection
+
+    def __init__(self):
+        super().__init__()
+        self._local = threading.local()
+
+    def https_open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        if urllib.parse.urlsplit(req.full_url).netloc != req.host:
+            return super().https_open(req)
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items() if k not in headers})
+        headers = {name.title(): value for name, value in headers.items()}
+        pool = self._pool()
+        for attempt in range(2):
+            conn = pool.get(req.host)
+            reused = conn is not None
+            if not reused:
+                conn = pool[req.host] = self.connection_class(req.host, timeout=req.timeout)
+            try:
+                conn.request(req.get_method(), req.selector, req.data, headers)
+                resp = conn.getresponse()
+            except STALE_CONNECTION_ERRORS as exc:
+                self.discard(req.host)
+                if not reused or attempt:
+                    raise urllib.error.URLError(exc) from exc
+            except (OSError, http.client.HTTPException) as exc:
+                self.discard(req.host)
+                raise urllib.error.URLError(exc) from exc
+            else:
+                # Mirror AbstractHTTPHandler.do_open so the opener's processors see the
+                # same response attributes.
+                resp.url = req.get_full_url()
+                resp.msg = resp.reason
+                return resp
+        raise AssertionError("unreachable")
+
+    def discard(self, host: str) -> None:
+        """Close this thread's connection to host, e.g. after an unfinished response."""
+        conn = self._pool().pop(host, None)
+        if conn is not None:
+            conn.close()
+
+    def _pool(self) -> dict[str, http.client.HTTPConnection]:
+        pool = getattr(self._local, "pool", None)
+        if pool is None:
+            pool = self._local.pool = {}
+        return pool
+
+
+class GitHubRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """urllib's redirect handling, except the token is only sent to GitHub hosts."""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        new_req = super().redirect_request(req, fp, code, msg, headers, newurl)
+        host = urllib.parse.urlsplit(newurl).hostname or ""
+        if new_req is not None and not _is_github_host(host):
+            new_req.remove_header("Authorization")
+        return new_req
+
+
+class GitHubClient:
+    """HTTPS client that keeps connections alive per thread and revalidates cached GETs.
+
+    Proxies (including no_proxy) and redirects are handled by urllib's own handlers;
+    only direct HTTPS connections are pooled. Responses carrying an ETag or
+    Last-Modified header are stored under cache_dir and replayed when GitHub answers
+    a conditional request with 304 Not Modified, which does not count against the API
+    rate limit.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        cache_dir: str | None = None,
+        bucket: TokenBucket | None = None,
+    ):
+        self.user_agent = user_agent
+        self.cache_dir = cache_dir
+        self.bucket = bucket or _bucket
+        self.stats = RequestStats()
+        self._stats_lock = threading.Lock()
+        self._https = KeepAliveHTTPSHandler()
+        self._opener = urllib.request.build_opener(self._https, GitHubRedirectHandler())
+
+    def request(
+        self, url: str, headers: dict[str, str] | None = None, cache: bool = True
+    ) -> bytes:
+        return self._with_retries(lambda: self._request_once(url, headers, cache))
+
+    def download(self, url: str, dest_path: str) -> int:
+        """Stream a response body to dest_path in fixed-size chunks; return bytes written."""
+        return self._with_retries(lambda: self._download_once(url, dest_path))
+
+    def _with_retries(self, send: Callable[[], T]) -> T:
+        """Call send(), retrying rate limits, 5xx and network errors with jittered backoff."""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                return send()
+            except urllib.error.URLError as exc:
+                delay = self._retry_delay(exc, attempt)
+                if delay is None:
+                    raise
+            with self._stats_lock:
+                self.stats.retries += 1
+                self.stats.wait_seconds += delay
+            time.sleep(delay)
+        raise AssertionError("unreachable")
+
+    def _retry_delay(self, exc: urllib.error.URLError, attempt: int) -> float | None:
+        if attempt >= MAX_RETRIES:
+            return None
+        if not isinstance(exc, urllib.error.HTTPError):
+            return _backoff_delay(attempt)
+        if _is_rate_limited(exc):
+            delay = _rate_limit_delay(exc.headers)
+            if delay is None:
+                delay = _backoff_delay(attempt) + BACKOFF_BASE_SECONDS * 2**attempt
+            if delay > MAX_RATE_LIMIT_WAIT_SECONDS:
+                return None
+            self.bucket.pause(delay)
+            return delay
+        if exc.code in RETRY_STATUS_CODES:
+            return _backoff_delay(attempt)
+        return None
+
+    def _request_once(
+        self, url: str, headers: dict[str, str] | None, cache: bool
+    ) -> bytes:
+        request_headers = _github_headers(self.user_agent, headers)
+        request_headers["Accept-Encoding"] = "gzip"
+        entry = self._cache_lookup(url, request_headers) if cache else None
+        if entry:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+        try:
+            resp = self._open(url, request_headers)
+        except urllib.error.HTTPError as exc:
+            if exc.code == 304 and entry:
+                with self._stats_lock:
+                    self.stats.not_modified += 1
+                return self._cache_body(entry)
+            raise
+        with resp:
+            body = self._read(resp, resp.read)
+        if resp.getheader("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        if cache:
+            self._cache_store(url, request_headers, resp, body)
+        return body
+
+    def _download_once(self, url: str, dest_path: str) -> int:
+        written = 0
+
+        def read_chunk() -> bytes:
+            chunk = resp.read(DOWNLOAD_CHUNK_SIZE)
+            if not chunk and resp.length:
+                # Sized reads end quietly when the peer hangs up; treat that as a failure.
+                raise http.client.IncompleteRead(b"", resp.length)
+            return chunk
+
+        with self._open(url, _github_headers(self.user_agent)) as resp:
+            try:
+                with open(dest_path, "wb") as file_handle:
+                    while True:
+                        chunk = self._read(resp, read_chunk)
+                        if not chunk:
+                            break
+                        file_handle.write(chunk)
+                        written += len(chunk)
+            except BaseException:
+                # Whatever is left of the body is still on the socket.
+                self._discard(resp)
+                raise
+        return written
+
+    def _read(self, resp: http.client.HTTPResponse, read: Callable[[], bytes]) -> bytes:
+        """Call read(), turning a connection dropped mid-body into a retryable URLError."""
+        try:
+            return read()
+        except (OSError, http.client.HTTPException) as exc:
+            self._discard(resp)
+            raise urllib.error.URLError(exc) from exc
+
+    def _discard(self, resp: http.client.HTTPResponse) -> None:
+        self._https.discard(urllib.parse.urlsplit(resp.geturl()).netloc)
+
+    def _open(self, url: str, headers: dict[str, str]) -> http.client.HTTPResponse:
+        """Send a GET through the opener; the caller must read the response to the end.
+
+        HTTP errors are raised with their body already read into memory, so the
+        connection stays reusable and the body can be inspected for rate limiting.
+        """
+        if not _is_github_host(urllib.parse.urlsplit(url).hostname or ""):
+            headers = {k: v for k, v in headers.items() if k != "Authorization"}
+        waited = self.bucket.acquire()
+        with self._stats_lock:
+            self.stats.requests += 1
+            self.stats.wait_seconds += waited
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            resp = self._opener.open(request, timeout=REQUEST_TIMEOUT_SECONDS)
+        except urllib.error.HTTPError as exc:
+            with exc:
+                body = self._read(exc, exc.read)
+            raise urllib.error.HTTPError(
+                exc.geturl(), exc.code, exc.reason, exc.headers, io.BytesIO(body)
+            ) from None
+        except http.client.HTTPException as exc:
+            raise urllib.error.URLError(exc) from exc
+        if resp.getheader("X-RateLimit-Remaining") == "0":
+            delay = _rate_limit_delay(resp.headers)
+            if delay is not None and delay <= MAX_RATE_LIMIT_WAIT_SECONDS:
+                self.bucket.pause(delay)
+        return resp
+
+    def _cache_key(self, url: str, headers: dict[str, str]) -> str:
+        # Authorization is part of the key so one token never sees another's responses.
+        material = "\n".join(
+            [url, headers.get("Accept", ""), headers.get("Authorization", "")]
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _cache_lookup(self, url: str, headers: dict[str, str]) -> dict | None:
+        if not self.cache_dir:
+            return None
+        meta_path = os.path.join(self.cache_dir, f"{self._cache_key(url, headers)}.json")
+        try:
+            with open(meta_path, "r", encoding="utf-8") as file_handle:
+                entry = json.load(file_handle)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not os.path.isfile(entry.get("body_path", "")):
+            return None
+        return entry
+
+    @staticmethod
+    def _cache_body(entry: dict) -> bytes:
+        with open(entry["body_path"], "rb") as file_handle:
+            return file_handle.read()
+
+    def _cache_store(
+        self, url: str, headers: dict[str, str], resp: http.client.HTTPResponse, body: bytes
+    ) -> None:
+        etag = resp.getheader("ETag")
+        last_modified = resp.getheader("Last-Modified")
+        if not self.cache_dir or not (etag or last_modified):
+            return
+        key = self._cache_key(url, headers)
+        body_path = os.path.join(self.cache_dir, f"{key}.body")
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body_path": body_path,
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            _write_atomic(body_path, body)
+            _write_atomic(
+                os.path.join(self.cache_dir, f"{key}.json"),
+                json.dumps(entry).encode("utf-8"),
+            )
+        except OSError:
+            pass
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as file_handle:
+            file_handle.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+_clients: dict[str, GitHubClient] = {}
+_clients_lock = threading.Lock()
+
+
+def github_client(user_agent: str) -> GitHubClient:
+    """Return the process-wide client for user_agent, sharing its connections and cache."""
+    with _clients_lock:
+        client = _clients.get(user_agent)
+        if client is None:
+            cache_dir = os.path.join(_codex_home(), "cache", "github-http")
+            client = _clients[user_agent] = GitHubClient(user_agent, cache_dir)
+        return client
+
+
+def github_request(
+    url: str, user_agent: str, headers: dict[str, str] | None = None
+) -> bytes:
+    return github_client(user_agent).request(url, headers)
+
+
+def github_download(url: str, user_agent: str, dest_path: str) -> int:
+    """Stream a response body to dest_path in fixed-size chunks; return bytes written."""
+    return github_client(user_agent).download(url, dest_path)
 
 
 def github_api_contents_url(repo: str, path: str, ref: str) -> str:
     return f"https://api.github.com/repos/{repo}/contents/{path}?ref={ref}"
+
+
+def github_api_commit_url(repo: str, ref: str) -> str:
+    return f"https://api.github.com/repos/{repo}/commits/{ref}"
+
+
+def github_cache_root() -> str:
+    """Directory for downloads shared by the install and list scripts."""
+    return os.path.join(_codex_home(), "cache", "skill-install")
+
+
+def github_archive_cache_path(repo: str, sha: str) -> str:
+    """Where the codeload zip of repo at commit sha is cached."""
+    return os.path.join(github_cache_root(), "archives", repo, f"{sha}.zip")
+
+
+def github_commit_sha(
+    repo: str, ref: str, user_agent: str, max_age: float = REF_CACHE_TTL_SECONDS
+) -> str | None:
+    """Resolve ref to a commit SHA, reusing an answer cached less than max_age seconds ago.
+
+    Returns None if the API answers with something that is not a commit SHA; HTTP and
+    network errors are raised to the caller.
+    """
+    if COMMIT_SHA_RE.match(ref):
+        return ref
+    refs_path = os.path.join(github_cache_root(), "refs.json")
+    key = f"{repo}@{ref}"
+    entry = _read_json(refs_path).get(key)
+    if isinstance(entry, dict) and time.time() - entry.get("resolved_at", 0) < max_age:
+        sha = entry.get("sha")
+        if isinstance(sha, str) and COMMIT_SHA_RE.match(sha):
+            return sha
+    payload = github_request(
+        github_api_commit_url(repo, ref), user_agent, {"Accept": "application/vnd.github.sha"}
+    )
+    sha = payload.decode("utf-8", errors="replace").strip()
+    if not COMMIT_SHA_RE.match(sha):
+        return None
+    os.makedirs(os.path.dirname(refs_path), exist_ok=True)
+    # Re-read under the lock so concurrent resolutions of other refs are kept.
+    with file_lock(f"{refs_path}.lock"):
+        refs = _read_json(refs_path)
+        refs[key] = {"sha": sha, "resolved_at": time.time()}
+        write_json_atomic(refs_path, refs)
+    return sha
+
+
+def _read_json(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as file_handle:
+            data = json.load(file_handle)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
@@ -1,21 +1,55 @@
 #!/usr/bin/env python3
-"""Install a skill from a GitHub repo path into $CODEX_HOME/skills."""
+"""Install a skill from a GitHub repo path or a .skill archive into $CODEX_HOME/skills."""
 
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+from dataclasses import dataclass, field
+import errno
+import hashlib
+import json
 import os
+import posixpath
 import shutil
 import subprocess
 import sys
+import tarfile
 import tempfile
+import time
 import urllib.error
 import urllib.parse
 import zipfile
 
-from github_utils import github_request
+from github_utils import (
+    ARCHIVE_LOCK_FILENAME,
+    COMMIT_SHA_RE,
+    REF_CACHE_TTL_SECONDS,
+    github_archive_cache_path,
+    github_cache_root,
+    github_client,
+    github_commit_sha,
+    github_download,
+)
+from skill_metadata import validate_skill_md
+from skill_state import (
+    file_lock,
+    read_lock,
+    refresh_installed,
+    registry_path,
+    tree_hash,
+    write_lock,
+)
 DEFAULT_REF = "main"
+CACHE_MAX_BYTES = 1024 * 1024 * 1024
+CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+DEFAULT_JOBS = 4
+INSTALL_LOCK_FILENAME = ".install.lock"
+STAGING_PREFIX = ".skill-staging-"
+TMP_PREFIX = "skill-install-"
+# Temporary trees this old under _tmp_root() are left over from killed installs.
+STALE_TMP_SECONDS = 60 * 60
 
 
 @dataclass
@@ -27,6 +61,12 @@ class Args:
     dest: str | None = None
     name: str | None = None
     method: str = "auto"
+    no_cache: bool = False
+    manifest: str | None = None
+    jobs: int = DEFAULT_JOBS
+    sync: bool = False
+    archive: str | None = None
+    upgrade: bool = False
 
 
 @dataclass
@@ -38,22 +78,51 @@ class Source:
     repo_url: str | None = None
 
 
+@dataclass
+class InstallGroup:
+    """Skills fetched together from one repo/ref with one method."""
+
+    source: Source
+    method: str
+    names: list[str] = field(default_factory=list)
+    repo_root: str = ""
+    commit_sha: str | None = None
+    fetch_seconds: float = 0.0
+
+
+@dataclass
+class TransferStats:
+    """Bytes placed into skill directories by rename versus by copying."""
+
+    moved_bytes: int = 0
+    copied_bytes: int = 0
+
+
 class InstallError(Exception):
     pass
 
 
+_transfer_stats = TransferStats()
+
+
 def _codex_home() -> str:
     return os.environ.get("CODEX_HOME", os.path.expanduser("~/.codex"))
 
 
 def _tmp_root() -> str:
-    base = os.path.join(tempfile.gettempdir(), "codex")
+    # Kept under $CODEX_HOME so staged skills are usually on the same filesystem as
+    # $CODEX_HOME/skills and can be renamed into place instead of copied.
+    base = os.path.join(_codex_home(), "tmp")
     os.makedirs(base, exist_ok=True)
     return base
 
 
-def _request(url: str) -> bytes:
-    return github_request(url, "codex-skill-install")
+def _cache_root() -> str:
+    return github_cache_root()
+
+
+def _download(url: str, dest_path: str) -> int:
+    return github_download(url, "codex-skill-install", dest_path)
 
 
 def _parse_github_url(url: str, default_ref: str) -> tuple[str, str, str, str | None]:
@@ -77,39 +146,205 @@ def _parse_github_url(url: str, default_ref: str) -> tuple[str, str, str, str |
     return owner, repo, ref, subpath or None
 
 
-def _download_repo_zip(owner: str, repo: str, ref: str, dest_dir: str) -> str:
+def _download_repo_zip(
+    owner: str,
+    repo: str,
+    ref: str,
+    dest_dir: str,
+    paths: list[str],
+    use_cache: bool = True,
+) -> tuple[str, str | None]:
+    """Extract paths from the repo zip at ref; return (repo_root, commit_sha or None).
+
+    The ref is resolved to a commit first and that commit is downloaded, so the SHA
+    returned is the one the files came from rather than a second, later lookup.
+    """
+    # --no-cache still pins the ref, but skips the cached resolution and archive.
+    max_age = REF_CACHE_TTL_SECONDS if use_cache else 0
+    sha = _resolve_commit_sha(owner, repo, ref, max_age)
+    if not (sha and use_cache):
+        zip_path = os.path.join(dest_dir, "repo.zip")
+        _fetch_repo_zip(owner, repo, sha or ref, zip_path)
+        try:
+            return _extract_repo_zip(zip_path, dest_dir, paths, sha)
+        finally:
+            os.remove(zip_path)
+    archive_root = os.path.join(_cache_root(), "archives")
+    os.makedirs(archive_root, exist_ok=True)
+    # Readers share the lock; eviction takes it exclusively, so an archive is never
+    # deleted between being found (or fetched) and being extracted.
+    with file_lock(os.path.join(archive_root, ARCHIVE_LOCK_FILENAME), shared=True):
+        zip_path = _cached_repo_zip(owner, repo, sha)
+        try:
+            result = _extract_repo_zip(zip_path, dest_dir, paths, sha)
+        except InstallError:
+            # A cached archive that cannot be extracted is dropped so the next run refetches it.
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(zip_path)
+            raise
+    _evict_archives(archive_root, keep=zip_path)
+    return result
+
+
+def _extract_repo_zip(
+    zip_path: str, dest_dir: str, paths: list[str], sha: str | None
+) -> tuple[str, str | None]:
+    try:
+        with zipfile.ZipFile(zip_path, "r") as zip_file:
+            top_level = _zip_top_level(zip_file)
+            _safe_extract_zip(zip_file, dest_dir, _member_prefixes(top_level, paths))
+            return os.path.join(dest_dir, top_level), _zip_commit_sha(zip_file) or sha
+    except zipfile.BadZipFile as exc:
+        raise InstallError("Downloaded archive is not a valid zip file.") from exc
+
+
+def _zip_commit_sha(zip_file: zipfile.ZipFile) -> str | None:
+    """Commit SHA that `git archive` (and so GitHub) stores as the zip comment, if any."""
+    comment = zip_file.comment.decode("ascii", errors="replace").strip()
+    return comment if COMMIT_SHA_RE.match(comment) else None
+
+
+def _fetch_repo_zip(owner: str, repo: str, ref: str, zip_path: str) -> None:
     zip_url = f"https://codeload.github.com/{owner}/{repo}/zip/{ref}"
-    zip_path = os.path.join(dest_dir, "repo.zip")
     try:
-        payload = _request(zip_url)
+        _download(zip_url, zip_path)
     except urllib.error.HTTPError as exc:
         raise InstallError(f"Download failed: HTTP {exc.code}") from exc
-    with open(zip_path, "wb") as file_handle:
-        file_handle.write(payload)
-    with zipfile.ZipFile(zip_path, "r") as zip_file:
-        _safe_extract_zip(zip_file, dest_dir)
-        top_levels = {name.split("/")[0] for name in zip_file.namelist() if name}
+
+
+def _resolve_commit_sha(
+    owner: str, repo: str, ref: str, max_age: float = REF_CACHE_TTL_SECONDS
+) -> str | None:
+    """Resolve ref to a commit SHA, or None if it cannot be resolved."""
+    try:
+        return github_commit_sha(f"{owner}/{repo}", ref, "codex-skill-install", max_age)
+    except OSError:
+        return None
+
+
+def _cached_repo_zip(owner: str, repo: str, sha: str) -> str:
+    """Return the cached zip of owner/repo at sha, downloading it if missing.
+
+    Call with the archive cache lock held (shared).
+    """
+    zip_path = github_archive_cache_path(f"{owner}/{repo}", sha)
+    if os.path.isfile(zip_path):
+        os.utime(zip_path)
+        return zip_path
+    os.makedirs(os.path.dirname(zip_path), exist_ok=True)
+    fd, partial_path = tempfile.mkstemp(suffix=".partial", dir=os.path.dirname(zip_path))
+    os.close(fd)
+    try:
+        _fetch_repo_zip(owner, repo, sha, partial_path)
+        os.replace(partial_path, zip_path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+    return zip_path
+
+
+def _evict_archives(archive_root: str, keep: str) -> None:
+    """Drop archives past the max age, then least recently used ones over the size cap."""
+    with file_lock(os.path.join(archive_root, ARCHIVE_LOCK_FILENAME)):
+        _evict_archives_locked(archive_root, keep)
+
+
+def _evict_archives_locked(archive_root: str, keep: str) -> None:
+    now = time.time()
+    archives = []
+    for dirpath, _, filenames in os.walk(archive_root):
+        for filename in filenames:
+            if not filename.endswith(".zip"):
+                continue
+            path = os.path.join(dirpath, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            archives.append((stat.st_mtime, stat.st_size, path))
+    archives.sort()
+    total = sum(size for _, size, _ in archives)
+    for mtime, size, path in archives:
+        if path == keep:
+            continue
+        if now - mtime <= CACHE_MAX_AGE_SECONDS and total <= CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def _zip_top_level(zip_file: zipfile.ZipFile) -> str:
+    top_levels = {name.split("/")[0] for name in zip_file.namelist() if name}
     if not top_levels:
         raise InstallError("Downloaded archive was empty.")
     if len(top_levels) != 1:
         raise InstallError("Unexpected archive layout.")
-    return os.path.join(dest_dir, next(iter(top_levels)))
+    return next(iter(top_levels))
+
+
+def _member_prefixes(top_level: str, paths: list[str]) -> list[str]:
+    prefixes = []
+    for path in paths:
+        normalized = posixpath.normpath(path.replace(os.sep, "/")).strip("/")
+        prefixes.append(f"{top_level}/{normalized}/" if normalized != "." else f"{top_level}/")
+    return prefixes
 
 
-def _run_git(args: list[str]) -> None:
+def _run_git(args: list[str]) -> str:
     result = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
     if result.returncode != 0:
         raise InstallError(result.stderr.strip() or "Git command failed.")
+    return result.stdout
+
+
+def _remote_commit_sha(source: Source) -> str | None:
+    """Resolve the current commit of source.ref, via the API or git ls-remote."""
+    sha = _resolve_commit_sha(source.owner, source.repo, source.ref, max_age=0)
+    if sha:
+        return sha
+    for repo_url in (
+        source.repo_url or _build_repo_url(source.owner, source.repo),
+        _build_repo_ssh(source.owner, source.repo),
+    ):
+        try:
+            output = _run_git(["git", "ls-remote", repo_url, source.ref])
+        except InstallError:
+            continue
+        for line in output.splitlines():
+            sha = line.split("\t", 1)[0]
+            if COMMIT_SHA_RE.match(sha):
+                return sha
+    return None
+
+
+def _checkout_commit_sha(repo_root: str) -> str | None:
+    """Commit checked out in a git clone; None (never a fresh guess) for anything else."""
+    if not os.path.isdir(os.path.join(repo_root, ".git")):
+        return None
+    try:
+        return _run_git(["git", "-C", repo_root, "rev-parse", "HEAD"]).strip()
+    except InstallError:
+        return None
 
 
-def _safe_extract_zip(zip_file: zipfile.ZipFile, dest_dir: str) -> None:
+def _safe_extract_zip(
+    zip_file: zipfile.ZipFile, dest_dir: str, prefixes: list[str] | None = None
+) -> None:
+    """Extract members under prefixes (all members if None), one at a time."""
     dest_root = os.path.realpath(dest_dir)
     for info in zip_file.infolist():
-        extracted_path = os.path.realpath(os.path.join(dest_dir, info.filename))
-        if extracted_path == dest_root or extracted_path.startswith(dest_root + os.sep):
+        if prefixes is not None and not any(
+            info.filename == prefix.rstrip("/") or info.filename.startswith(prefix)
+            for prefix in prefixes
+        ):
             continue
-        raise InstallError("Archive contains files outside the destination.")
-    zip_file.extractall(dest_dir)
+        extracted_path = os.path.realpath(os.path.join(dest_dir, info.filename))
+        if not (extracted_path == dest_root or extracted_path.startswith(dest_root + os.sep)):
+            raise InstallError("Archive contains files outside the destination.")
+        zip_file.extract(info, dest_dir)
 
 
 def _validate_relative_path(path: str) -> None:
@@ -161,6 +396,104 @@ def _git_sparse_checkout(repo_url: str, ref: str, paths: list[str], dest_dir: st
     return repo_dir
 
 
+def _git_mirror_dir(owner: str, repo: str) -> str:
+    return os.path.join(_cache_root(), "git", owner, f"{repo}.git")
+
+
+def _git_mirror_checkout(source: Source, dest_dir: str) -> tuple[str, str]:
+    """Materialize source.paths from a persistent partial-clone mirror of the repo.
+
+    The bare mirror under $CODEX_HOME/cache/skill-install/git is created on first use
+    and only fetched incrementally afterwards (commits and trees; blobs are fetched
+    lazily when `git archive` needs them). Returns (repo_root, commit_sha).
+    """
+    mirror = _git_mirror_dir(source.owner, source.repo)
+    os.makedirs(os.path.dirname(mirror), exist_ok=True)
+    with file_lock(f"{mirror}.lock"):
+        if not os.path.isdir(mirror):
+            _init_git_mirror(mirror)
+        sha = _fetch_git_mirror(mirror, source)
+        repo_root = os.path.join(dest_dir, "repo")
+        _git_archive_extract(mirror, sha, source.paths, repo_root)
+    return repo_root, sha
+
+
+def _init_git_mirror(mirror: str) -> None:
+    partial_dir = tempfile.mkdtemp(suffix=".partial", dir=os.path.dirname(mirror))
+    try:
+        _run_git(["git", "init", "--quiet", "--bare", partial_dir])
+        _run_git(["git", "-C", partial_dir, "remote", "add", "origin", "unset"])
+        os.rename(partial_dir, mirror)
+    finally:
+        if os.path.isdir(partial_dir):
+            shutil.rmtree(partial_dir, ignore_errors=True)
+
+
+def _fetch_git_mirror(mirror: str, source: Source) -> str:
+    """Fetch source.ref into the mirror over HTTPS, then SSH; return its commit SHA."""
+    error: InstallError | None = None
+    for repo_url in (
+        source.repo_url or _build_repo_url(source.owner, source.repo),
+        _build_repo_ssh(source.owner, source.repo),
+    ):
+        # Lazy blob fetches during `git archive` go to whichever URL last worked.
+        _run_git(["git", "-C", mirror, "remote", "set-url", "origin", repo_url])
+        try:
+            _run_git(
+                [
+                    "git",
+                    "-C",
+                    mirror,
+                    "fetch",
+                    "--quiet",
+                    "--filter=blob:none",
+                    "--depth",
+                    "1",
+                    "--no-tags",
+                    "origin",
+                    source.ref,
+                ]
+            )
+        except InstallError as exc:
+            error = exc
+            continue
+        return _run_git(["git", "-C", mirror, "rev-parse", "FETCH_HEAD^{commit}"]).strip()
+    assert error is not None
+    raise error
+
+
+def _git_archive_extract(mirror: str, sha: str, paths: list[str], dest_dir: str) -> None:
+    """Stream `git archive` of paths at sha into dest_dir."""
+    os.makedirs(dest_dir)
+    dest_root = os.path.realpath(dest_dir)
+    proc = subprocess.Popen(
+        ["git", "-C", mirror, "archive", "--format=tar", sha, "--", *paths],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    tar_error: Exception | None = None
+    try:
+        with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+            for member in tar:
+                extracted_path = os.path.realpath(os.path.join(dest_dir, member.name))
+                if not (
+                    extracted_path == dest_root or extracted_path.startswith(dest_root + os.sep)
+                ):
+                    raise InstallError("Archive contains files outside the destination.")
+                tar.extract(member, dest_dir)
+    except tarfile.TarError as exc:
+        tar_error = exc
+    finally:
+        proc.stdout.close()
+        stderr = proc.stderr.read().decode("utf-8", errors="replace")
+        proc.stderr.close()
+        returncode = proc.wait()
+    if returncode != 0:
+        raise InstallError(stderr.strip() or "git archive failed.")
+    if tar_error:
+        raise InstallError(f"Unable to extract git archive: {tar_error}")
+
+
 def _validate_skill(path: str) -> None:
     if not os.path.isdir(path):
         raise InstallError(f"Skill path not found: {path}")
@@ -169,11 +502,167 @@ def _validate_skill(path: str) -> None:
         raise InstallError("SKILL.md not found in selected skill directory.")
 
 
-def _copy_skill(src: str, dest_dir: str) -> None:
-    os.makedirs(os.path.dirname(dest_dir), exist_ok=True)
-    if os.path.exists(dest_dir):
-        raise InstallError(f"Destination already exists: {dest_dir}")
-    shutil.copytree(src, dest_dir)
+@contextlib.contextmanager
+def _install_lock(dest_root: str):
+    """Hold an exclusive lock on dest_root so concurrent installers take turns.
+
+    Staging directories left behind by an interrupted install are removed once the
+    lock is held, since no other installer can be using them. Temporary trees under
+    _tmp_root() are shared by every destination, so only old ones are removed.
+    """
+    os.makedirs(dest_root, exist_ok=True)
+    with file_lock(os.path.join(dest_root, INSTALL_LOCK_FILENAME)):
+        for entry in os.scandir(dest_root):
+            if entry.name.startswith(STAGING_PREFIX):
+                shutil.rmtree(entry.path, ignore_errors=True)
+        _remove_stale_tmp_dirs()
+        yield
+
+
+def _remove_stale_tmp_dirs() -> None:
+    cutoff = time.time() - STALE_TMP_SECONDS
+    for entry in os.scandir(_tmp_root()):
+        try:
+            stale = entry.name.startswith(TMP_PREFIX) and entry.stat().st_mtime < cutoff
+        except OSError:
+            continue
+        if stale:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def _tree_size(root: str) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            total += os.lstat(os.path.join(dirpath, filename)).st_size
+    return total
+
+
+def _move_tree(src: str, dest: str) -> None:
+    """Rename src to dest, copying only when they are on different filesystems."""
+    size = _tree_size(src)
+    try:
+        os.rename(src, dest)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.copytree(src, dest)
+        _transfer_stats.copied_bytes += size
+        return
+    _transfer_stats.moved_bytes += size
+
+
+def _install_trees(items: list[tuple[str, str]], dest_root: str, replace: bool = False) -> None:
+    """Install (src, dest_dir) pairs into dest_root all-or-nothing; call with the install lock held.
+
+    Each skill is moved into a hidden staging directory inside dest_root and then renamed
+    into place, so a destination is never left half-written. Sources are consumed: they
+    are renamed when on the same filesystem and copied otherwise. With replace, an
+    existing skill is renamed aside first and restored if any later step fails.
+    """
+    staging_dir = tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=dest_root)
+    swapped: list[tuple[str, str | None]] = []
+    try:
+        staged = []
+        moved: dict[str, str] = {}
+        for idx, (src, dest_dir) in enumerate(items):
+            if os.path.exists(dest_dir) and not replace:
+                raise InstallError(
+                    f"Destination already exists: {dest_dir} (use --upgrade to replace it)"
+                )
+            staged_dir = os.path.join(staging_dir, f"new-{idx}")
+            if src in moved:
+                # The same source installed under a second name.
+                shutil.copytree(moved[src], staged_dir)
+                _transfer_stats.copied_bytes += _tree_size(staged_dir)
+            else:
+                _move_tree(src, staged_dir)
+                moved[src] = staged_dir
+            staged.append((staged_dir, dest_dir))
+        for idx, (staged_dir, dest_dir) in enumerate(staged):
+            backup_dir = None
+            if os.path.exists(dest_dir):
+                backup_dir = os.path.join(staging_dir, f"old-{idx}")
+                os.rename(dest_dir, backup_dir)
+            swapped.append((dest_dir, backup_dir))
+            os.rename(staged_dir, dest_dir)
+    except BaseException:
+        for dest_dir, backup_dir in reversed(swapped):
+            shutil.rmtree(dest_dir, ignore_errors=True)
+            if backup_dir:
+                os.rename(backup_dir, dest_dir)
+        raise
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _fetch_archive(archive: str, tmp_dir: str) -> str:
+    """Return a local path for a .skill archive, streaming URLs into tmp_dir."""
+    if urllib.parse.urlparse(archive).scheme in ("http", "https"):
+        zip_path = os.path.join(tmp_dir, "archive.skill")
+        try:
+            _download(archive, zip_path)
+        except urllib.error.HTTPError as exc:
+            raise InstallError(f"Download failed: HTTP {exc.code}") from exc
+        return zip_path
+    if not os.path.isfile(archive):
+        raise InstallError(f"Archive not found: {archive}")
+    return archive
+
+
+def _extract_skill_archive(zip_path: str, dest_dir: str) -> str:
+    """Validate the skill in a .skill archive and extract only its directory."""
+    try:
+        with zipfile.ZipFile(zip_path, "r") as zip_file:
+            top_level = _zip_top_level(zip_file)
+            try:
+                content = zip_file.read(f"{top_level}/SKILL.md").decode("utf-8")
+            except KeyError as exc:
+                raise InstallError("SKILL.md not found in archive.") from exc
+            except UnicodeDecodeError as exc:
+                raise InstallError("SKILL.md in archive is not valid UTF-8.") from exc
+            errors = validate_skill_md(content)
+            if errors:
+                raise InstallError(f"Invalid skill in archive: {errors[0]}")
+            _safe_extract_zip(zip_file, dest_dir, [f"{top_level}/"])
+    except zipfile.BadZipFile as exc:
+        raise InstallError("Archive is not a valid .skill (zip) file.") from exc
+    return os.path.join(dest_dir, top_level)
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file_handle:
+        for chunk in iter(lambda: file_handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _install_archive(
+    archive: str, name: str | None, dest_root: str, replace: bool = False
+) -> tuple[str, str, float]:
+    """Install the skill packaged in a local or remote .skill archive and lock it."""
+    started = time.monotonic()
+    tmp_dir = tempfile.mkdtemp(prefix=TMP_PREFIX, dir=_tmp_root())
+    try:
+        zip_path = _fetch_archive(archive, tmp_dir)
+        skill_dir = _extract_skill_archive(zip_path, os.path.join(tmp_dir, "skill"))
+        skill_name = name or os.path.basename(skill_dir)
+        _validate_skill_name(skill_name)
+        dest_dir = os.path.join(dest_root, skill_name)
+        archive_sha = _file_sha256(zip_path)
+        with _install_lock(dest_root):
+            _install_trees([(skill_dir, dest_dir)], dest_root, replace)
+            entries = read_lock(dest_root)
+            entries[skill_name] = {
+                "archive": archive if "://" in archive else os.path.abspath(archive),
+                "archive_sha256": archive_sha,
+                "tree_hash": tree_hash(dest_dir),
+            }
+            write_lock(dest_root, entries)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return skill_name, dest_dir, time.monotonic() - started
 
 
 def _build_repo_url(owner: str, repo: str) -> str:
@@ -184,25 +673,32 @@ def _build_repo_ssh(owner: str, repo: str) -> str:
     return f"git@github.com:{owner}/{repo}.git"
 
 
-def _prepare_repo(source: Source, method: str, tmp_dir: str) -> str:
+def _prepare_repo(
+    source: Source, method: str, tmp_dir: str, use_cache: bool = True
+) -> tuple[str, str | None]:
+    """Fetch source.paths into tmp_dir; return (repo_root, commit_sha if already known)."""
     if method in ("download", "auto"):
         try:
-            return _download_repo_zip(source.owner, source.repo, source.ref, tmp_dir)
+            return _download_repo_zip(
+                source.owner, source.repo, source.ref, tmp_dir, source.paths, use_cache
+            )
         except InstallError as exc:
             if method == "download":
                 raise
             err_msg = str(exc)
             if "HTTP 401" in err_msg or "HTTP 403" in err_msg or "HTTP 404" in err_msg:
-                pass
+                print(f"{err_msg} Falling back to git.", file=sys.stderr)
             else:
                 raise
     if method in ("git", "auto"):
+        if use_cache:
+            return _git_mirror_checkout(source, tmp_dir)
         repo_url = source.repo_url or _build_repo_url(source.owner, source.repo)
         try:
-            return _git_sparse_checkout(repo_url, source.ref, source.paths, tmp_dir)
+            return _git_sparse_checkout(repo_url, source.ref, source.paths, tmp_dir), None
         except InstallError:
             repo_url = _build_repo_ssh(source.owner, source.repo)
-            return _git_sparse_checkout(repo_url, source.ref, source.paths, tmp_dir)
+            return _git_sparse_checkout(repo_url, source.ref, source.paths, tmp_dir), None
     raise InstallError("Unsupported method.")
 
 
@@ -240,14 +736,217 @@ def _resolve_source(args: Args) -> Source:
     )
 
 
+def _skill_names(paths: list[str], name: str | None) -> list[str]:
+    if name and len(paths) != 1:
+        raise InstallError("--name can only be used with a single skill path.")
+    names = []
+    for path in paths:
+        _validate_relative_path(path)
+        skill_name = name or os.path.basename(path.rstrip("/"))
+        if not skill_name:
+            raise InstallError("Unable to derive skill name.")
+        _validate_skill_name(skill_name)
+        names.append(skill_name)
+    return names
+
+
+def _load_manifest(manifest_path: str, default_ref: str, default_method: str) -> list[InstallGroup]:
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as file_handle:
+            text = file_handle.read()
+    except OSError as exc:
+        raise InstallError(f"Unable to read manifest: {exc}") from exc
+    if manifest_path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError as exc:
+            raise InstallError("PyYAML is required for YAML manifests; use JSON instead.") from exc
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as exc:
+            raise InstallError(f"Invalid manifest: {exc}") from exc
+    else:
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as exc:
+            raise InstallError(f"Invalid manifest: {exc}") from exc
+    entries = data.get("skills") if isinstance(data, dict) else data
+    if not isinstance(entries, list) or not entries:
+        raise InstallError("Manifest must contain a non-empty list of skills.")
+
+    groups: dict[tuple[str, str, str, str], InstallGroup] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise InstallError("Manifest entries must be objects.")
+        path = entry.get("path")
+        paths = [path] if isinstance(path, str) else path
+        method = entry.get("method", default_method)
+        if method not in ("auto", "download", "git"):
+            raise InstallError(f"Unsupported method in manifest: {method}")
+        source = _resolve_source(
+            Args(
+                url=entry.get("url"),
+                repo=entry.get("repo"),
+                path=paths,
+                ref=entry.get("ref", default_ref),
+            )
+        )
+        key = (source.owner, source.repo, source.ref, method)
+        group = groups.setdefault(
+            key,
+            InstallGroup(
+                source=Source(owner=source.owner, repo=source.repo, ref=source.ref, paths=[]),
+                method=method,
+            ),
+        )
+        group.names.extend(_skill_names(source.paths, entry.get("name")))
+        group.source.paths.extend(source.paths)
+    return list(groups.values())
+
+
+def _check_destinations(
+    groups: list[InstallGroup], dest_root: str, replace: bool = False
+) -> None:
+    seen: set[str] = set()
+    for group in groups:
+        for skill_name in group.names:
+            if skill_name in seen:
+                raise InstallError(f"Skill {skill_name} is listed more than once.")
+            seen.add(skill_name)
+            dest_dir = os.path.join(dest_root, skill_name)
+            if os.path.exists(dest_dir) and not replace:
+                raise InstallError(
+                    f"Destination already exists: {dest_dir} (use --upgrade to replace it)"
+                )
+
+
+def _fetch_group(group: InstallGroup, tmp_dir: str, use_cache: bool) -> None:
+    source = group.source
+    os.makedirs(tmp_dir)
+    started = time.monotonic()
+    try:
+        group.repo_root, commit_sha = _prepare_repo(source, group.method, tmp_dir, use_cache)
+    except InstallError as exc:
+        raise InstallError(f"{source.owner}/{source.repo}@{source.ref}: {exc}") from exc
+    group.commit_sha = commit_sha or _checkout_commit_sha(group.repo_root)
+    group.fetch_seconds = time.monotonic() - started
+
+
+def _fetch_groups(groups: list[InstallGroup], tmp_dir: str, jobs: int, use_cache: bool) -> None:
+    """Fetch each group once, running up to `jobs` fetches concurrently."""
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(groups)))) as pool:
+        futures = [
+            pool.submit(_fetch_group, group, os.path.join(tmp_dir, str(idx)), use_cache)
+            for idx, group in enumerate(groups)
+        ]
+        for future in futures:
+            future.result()
+
+
+def _install_groups(
+    groups: list[InstallGroup], dest_root: str, replace: bool = False
+) -> list[tuple[str, str, float]]:
+    """Install every skill from fetched groups atomically; call with the install lock held."""
+    for group in groups:
+        for path in group.source.paths:
+            _validate_skill(os.path.join(group.repo_root, path))
+    started = time.monotonic()
+    items = []
+    fetch_seconds = []
+    for group in groups:
+        for path, skill_name in zip(group.source.paths, group.names):
+            items.append((os.path.join(group.repo_root, path), os.path.join(dest_root, skill_name)))
+            fetch_seconds.append((skill_name, group.fetch_seconds))
+    _install_trees(items, dest_root, replace)
+    elapsed = time.monotonic() - started
+    return [
+        (skill_name, dest_dir, seconds + elapsed)
+        for (skill_name, seconds), (_, dest_dir) in zip(fetch_seconds, items)
+    ]
+
+
+def _update_lock(groups: list[InstallGroup], dest_root: str) -> None:
+    entries = read_lock(dest_root)
+    for group in groups:
+        source = group.source
+        for path, skill_name in zip(source.paths, group.names):
+            entries[skill_name] = {
+                "repo": f"{source.owner}/{source.repo}",
+                "ref": source.ref,
+                "path": path,
+                "method": group.method,
+                "sha": group.commit_sha,
+                "tree_hash": tree_hash(os.path.join(dest_root, skill_name)),
+            }
+    write_lock(dest_root, entries)
+
+
+def _sync_groups(dest_root: str) -> tuple[list[InstallGroup], list[str], list[str]]:
+    """Return groups for locked skills whose commit or files changed, plus up-to-date names.
+
+    Skills installed from a .skill archive have no upstream ref and are returned as skipped.
+    """
+    entries = read_lock(dest_root)
+    if not entries:
+        raise InstallError(f"No skills.lock found in {dest_root}.")
+    groups: dict[tuple[str, str, str], InstallGroup] = {}
+    remote_shas: dict[tuple[str, str], str | None] = {}
+    unchanged = []
+    skipped = []
+    for skill_name, entry in sorted(entries.items()):
+        if "archive" in entry:
+            skipped.append(skill_name)
+            continue
+        repo, ref, path = entry.get("repo"), entry.get("ref"), entry.get("path")
+        if not (isinstance(repo, str) and isinstance(ref, str) and isinstance(path, str)):
+            raise InstallError(f"Invalid skills.lock entry for {skill_name}.")
+        source = _resolve_source(Args(repo=repo, path=[path], ref=ref))
+        if (repo, ref) not in remote_shas:
+            remote_shas[(repo, ref)] = _remote_commit_sha(source)
+        remote_sha = remote_shas[(repo, ref)]
+        dest_dir = os.path.join(dest_root, skill_name)
+        if (
+            remote_sha
+            and remote_sha == entry.get("sha")
+            and os.path.isdir(dest_dir)
+            and tree_hash(dest_dir) == entry.get("tree_hash")
+        ):
+            unchanged.append(skill_name)
+            continue
+        method = entry.get("method", "auto")
+        group = groups.setdefault(
+            (repo, ref, method),
+            InstallGroup(
+                source=Source(owner=source.owner, repo=source.repo, ref=ref, paths=[]),
+                method=method,
+            ),
+        )
+        group.source.paths.append(path)
+        group.names.append(skill_name)
+    return list(groups.values()), unchanged, skipped
+
+
+def _format_bytes(num_bytes: int) -> str:
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
 def _default_dest() -> str:
     return os.path.join(_codex_home(), "skills")
 
 
 def _parse_args(argv: list[str]) -> Args:
-    parser = argparse.ArgumentParser(description="Install a skill from GitHub.")
+    parser = argparse.ArgumentParser(description="Install a skill from GitHub or a .skill archive.")
     parser.add_argument("--repo", help="owner/repo")
     parser.add_argument("--url", help="https://github.com/owner/repo[/tree/ref/path]")
+    parser.add_argument(
+        "--archive",
+        help="Local path or http(s) URL of a .skill archive built by package_skill.py",
+    )
     parser.add_argument(
         "--path",
         nargs="+",
@@ -263,43 +962,106 @@ def _parse_args(argv: list[str]) -> Args:
         choices=["auto", "download", "git"],
         default="auto",
     )
+    parser.add_argument(
+        "--manifest",
+        help="JSON (or YAML) file listing skills to install: "
+        '{"skills": [{"repo": "owner/repo", "path": "...", "ref": "...", "name": "..."}]}',
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="Number of repos to fetch concurrently in --manifest mode",
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Reinstall locked skills whose commit or files changed since install",
+    )
+    parser.add_argument(
+        "--upgrade",
+        action="store_true",
+        help="Atomically replace skills that are already installed",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the download cache under $CODEX_HOME/cache/skill-install",
+    )
     return parser.parse_args(argv, namespace=Args())
 
 
 def main(argv: list[str]) -> int:
     args = _parse_args(argv)
+    _transfer_stats.moved_bytes = _transfer_stats.copied_bytes = 0
     try:
-        source = _resolve_source(args)
-        source.ref = source.ref or args.ref
-        if not source.paths:
-            raise InstallError("No skill paths provided.")
-        for path in source.paths:
-            _validate_relative_path(path)
         dest_root = args.dest or _default_dest()
-        tmp_dir = tempfile.mkdtemp(prefix="skill-install-", dir=_tmp_root())
-        try:
-            repo_root = _prepare_repo(source, args.method, tmp_dir)
-            installed = []
-            for path in source.paths:
-                skill_name = args.name if len(source.paths) == 1 else None
-                skill_name = skill_name or os.path.basename(path.rstrip("/"))
-                _validate_skill_name(skill_name)
-                if not skill_name:
-                    raise InstallError("Unable to derive skill name.")
-                dest_dir = os.path.join(dest_root, skill_name)
-                if os.path.exists(dest_dir):
-                    raise InstallError(f"Destination already exists: {dest_dir}")
-                skill_src = os.path.join(repo_root, path)
-                _validate_skill(skill_src)
-                _copy_skill(skill_src, dest_dir)
-                installed.append((skill_name, dest_dir))
-        finally:
-            if os.path.isdir(tmp_dir):
-                shutil.rmtree(tmp_dir, ignore_errors=True)
-        for skill_name, dest_dir in installed:
-            print(f"Installed {skill_name} to {dest_dir}")
+        unchanged: list[str] = []
+        skipped: list[str] = []
+        installed = []
+        groups: list[InstallGroup] = []
+        if args.sync:
+            if args.url or args.repo or args.path or args.name or args.manifest or args.archive:
+                raise InstallError("--sync cannot be combined with other install sources.")
+            groups, unchanged, skipped = _sync_groups(dest_root)
+        elif args.manifest:
+            if args.url or args.repo or args.path or args.name or args.archive:
+                raise InstallError(
+                    "--manifest cannot be combined with --repo, --url, --path, --name or --archive."
+                )
+            groups = _load_manifest(args.manifest, args.ref, args.method)
+        elif args.archive:
+            if args.url or args.repo or args.path:
+                raise InstallError("--archive cannot be combined with --repo, --url or --path.")
+            installed.append(_install_archive(args.archive, args.name, dest_root, args.upgrade))
+        else:
+            source = _resolve_source(args)
+            source.ref = source.ref or args.ref
+            if not source.paths:
+                raise InstallError("No skill paths provided.")
+            groups = [
+                InstallGroup(
+                    source=source,
+                    method=args.method,
+                    names=_skill_names(source.paths, args.name),
+                )
+            ]
+        replace = args.sync or args.upgrade
+        _check_destinations(groups, dest_root, replace)
+        if groups:
+            tmp_dir = tempfile.mkdtemp(prefix=TMP_PREFIX, dir=_tmp_root())
+            try:
+                _fetch_groups(groups, tmp_dir, args.jobs, not args.no_cache)
+                with _install_lock(dest_root):
+                    installed = _install_groups(groups, dest_root, replace)
+                    _update_lock(groups, dest_root)
+            finally:
+                if os.path.isdir(tmp_dir):
+                    shutil.rmtree(tmp_dir, ignore_errors=True)
+        if installed:
+            refresh_installed(dest_root, registry_path(_codex_home()))
+        for skill_name in unchanged:
+            print(f"Up to date: {skill_name}")
+        for skill_name in skipped:
+            print(f"Skipped {skill_name}: installed from a .skill archive")
+        for skill_name, dest_dir, elapsed in installed:
+            timing = f" ({elapsed:.2f}s)" if args.manifest or args.sync else ""
+            print(f"Installed {skill_name} to {dest_dir}{timing}")
+        if installed:
+            # Renames move no data, so only copies count as bytes written.
+            print(
+                f"Skill files: {_format_bytes(_transfer_stats.moved_bytes)} renamed into place, "
+                f"{_format_bytes(_transfer_stats.copied_bytes)} copied."
+            )
+        stats = github_client("codex-skill-install").stats
+        if stats.retries:
+            print(
+                f"GitHub requests were retried {stats.retries} times "
+                f"({stats.wait_seconds:.1f}s waiting on rate limits and backoff).",
+                file=sys.stderr,
+            )
         return 0
-    except InstallError as exc:
+    except (InstallError, OSError) as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
 
@@ -4,16 +4,35 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
+import posixpath
 import sys
+import tempfile
+import time
 import urllib.error
+import zipfile
 
-from github_utils import github_api_contents_url, github_request
+from github_utils import (
+    ARCHIVE_LOCK_FILENAME,
+    github_api_contents_url,
+    github_archive_cache_path,
+    github_cache_root,
+    github_commit_sha,
+    github_download,
+    github_request,
+)
+from skill_metadata import parse_frontmatter, parse_headings
+from skill_search import index_path, load_index, refresh_index, save_index, search
+from skill_state import file_lock, installed_skills, registry_path, write_json_atomic
 
 DEFAULT_REPO = "openai/skills"
 DEFAULT_PATH = "skills/.curated"
 DEFAULT_REF = "main"
+DEFAULT_CATALOG_TTL = 60 * 60
+DEFAULT_SEARCH_LIMIT = 10
+CATALOG_VERSION = 2
 
 
 class ListError(Exception):
@@ -25,10 +44,21 @@ class Args(argparse.Namespace):
     path: str
     ref: str
     format: str
+    catalog: bool
+    query: str | None
+    ttl: int
+    refresh: bool
+    command: str | None
+    terms: list[str]
+    limit: int
 
 
-def _request(url: str) -> bytes:
-    return github_request(url, "codex-skill-list")
+def _request(url: str, headers: dict[str, str] | None = None) -> bytes:
+    return github_request(url, "codex-skill-list", headers)
+
+
+def _download(url: str, dest_path: str) -> int:
+    return github_download(url, "codex-skill-list", dest_path)
 
 
 def _codex_home() -> str:
@@ -37,14 +67,7 @@ def _codex_home() -> str:
 
 def _installed_skills() -> set[str]:
     root = os.path.join(_codex_home(), "skills")
-    if not os.path.isdir(root):
-        return set()
-    entries = set()
-    for name in os.listdir(root):
-        path = os.path.join(root, name)
-        if os.path.isdir(path):
-            entries.add(name)
-    return entries
+    return set(installed_skills(root, registry_path(_codex_home())))
 
 
 def _list_curated(repo: str, path: str, ref: str) -> list[str]:
@@ -65,6 +88,221 @@ def _list_curated(repo: str, path: str, ref: str) -> list[str]:
     return sorted(skills)
 
 
+def _catalog_path(repo: str, path: str, ref: str) -> str:
+    key = hashlib.sha256(f"{repo}\n{path}\n{ref}".encode("utf-8")).hexdigest()[:32]
+    return os.path.join(_codex_home(), "cache", "skill-catalog", f"{key}.json")
+
+
+def _read_catalog(catalog_path: str) -> dict | None:
+    try:
+        with open(catalog_path, "r", encoding="utf-8") as file_handle:
+            data = json.load(file_handle)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != CATALOG_VERSION:
+        return None
+    return data
+
+
+def _resolve_commit_sha(repo: str, ref: str) -> str:
+    try:
+        sha = github_commit_sha(repo, ref, "codex-skill-list", max_age=0)
+    except urllib.error.HTTPError as exc:
+        if exc.code == 404:
+            raise ListError(f"Ref not found: https://github.com/{repo}/tree/{ref}") from exc
+        raise ListError(f"Failed to resolve {repo}@{ref}: HTTP {exc.code}") from exc
+    except (urllib.error.URLError, OSError) as exc:
+        raise ListError(f"Failed to resolve {repo}@{ref}: {exc}") from exc
+    if not sha:
+        raise ListError(f"Failed to resolve {repo}@{ref}: unexpected API response")
+    return sha
+
+
+def _download_archive(repo: str, sha: str, tmp_dir: str) -> str:
+    zip_path = os.path.join(tmp_dir, "repo.zip")
+    try:
+        _download(f"https://codeload.github.com/{repo}/zip/{sha}", zip_path)
+    except urllib.error.HTTPError as exc:
+        raise ListError(f"Failed to download {repo}@{sha}: HTTP {exc.code}") from exc
+    except (urllib.error.URLError, OSError) as exc:
+        raise ListError(f"Failed to download {repo}@{sha}: {exc}") from exc
+    return zip_path
+
+
+def _read_archive_catalog(zip_path: str, path: str) -> list[dict]:
+    try:
+        with zipfile.ZipFile(zip_path) as zip_file:
+            return _catalog_entries(zip_file, path)
+    except zipfile.BadZipFile as exc:
+        raise ListError("Downloaded archive is not a valid zip file.") from exc
+    except OSError as exc:
+        raise ListError(f"Unable to read the downloaded archive: {exc}") from exc
+
+
+def _build_catalog(repo: str, path: str, sha: str) -> list[dict]:
+    """Read every skill under path from one archive download of the commit."""
+    # Reuse the installer's archive cache when it already holds this commit. The
+    # shared lock keeps its eviction from deleting the archive while it is read.
+    cached = github_archive_cache_path(repo, sha)
+    archive_root = os.path.join(github_cache_root(), "archives")
+    if os.path.isdir(archive_root):
+        with file_lock(os.path.join(archive_root, ARCHIVE_LOCK_FILENAME), shared=True):
+            if os.path.isfile(cached):
+                return _read_archive_catalog(cached, path)
+    with tempfile.TemporaryDirectory(prefix="skill-catalog-") as tmp_dir:
+        return _read_archive_catalog(_download_archive(repo, sha, tmp_dir), path)
+
+
+def _catalog_entries(zip_file: zipfile.ZipFile, path: str) -> list[dict]:
+    names = zip_file.namelist()
+    if not names:
+        raise ListError("Downloaded archive was empty.")
+    base = f"{names[0].split('/')[0]}/{posixpath.normpath(path).strip('/')}/"
+    skills: dict[str, dict] = {}
+    for info in zip_file.infolist():
+        if not info.filename.startswith(base) or info.is_dir():
+            continue
+        parts = info.filename[len(base) :].split("/")
+        if len(parts) < 2:
+            continue
+        entry = skills.setdefault(
+            parts[0],
+            {
+                "name": parts[0],
+                "description": "",
+                "license": "",
+                "headings": [],
+                "size": 0,
+                "files": 0,
+            },
+        )
+        entry["size"] += info.file_size
+        entry["files"] += 1
+        if parts[1:] == ["SKILL.md"]:
+            content = zip_file.read(info).decode("utf-8", errors="replace")
+            frontmatter = parse_frontmatter(content) or {}
+            for key in ("description", "license"):
+                value = frontmatter.get(key)
+                if isinstance(value, str):
+                    entry[key] = value.strip()
+            entry["headings"] = parse_headings(content)
+    return [skills[name] for name in sorted(skills)]
+
+
+def _load_catalog(repo: str, path: str, ref: str, ttl: int, refresh: bool) -> dict:
+    """Return the cached catalog, rebuilding it only when the ref moved to a new commit."""
+    catalog_path = _catalog_path(repo, path, ref)
+    catalog = _read_catalog(catalog_path)
+    if catalog and not refresh and time.time() - catalog.get("fetched_at", 0) < ttl:
+        return catalog
+    try:
+        sha = _resolve_commit_sha(repo, ref)
+        skills = None if catalog and catalog.get("sha") == sha else _build_catalog(repo, path, sha)
+    except ListError as exc:
+        if not catalog:
+            raise
+        # A stale catalog beats no answer; the next run checks GitHub again.
+        print(f"Warning: using the cached catalog at {catalog['sha'][:7]} ({exc})", file=sys.stderr)
+        return catalog
+    if skills is not None:
+        if not skills:
+            raise ListError(
+                "Curated skills path not found: "
+                f"https://github.com/{repo}/tree/{ref}/{path}"
+            )
+        catalog = {
+            "version": CATALOG_VERSION,
+            "repo": repo,
+            "path": path,
+            "ref": ref,
+            "sha": sha,
+            "skills": skills,
+        }
+    catalog["fetched_at"] = time.time()
+    write_json_atomic(catalog_path, catalog)
+    return catalog
+
+
+def _matches(entry: dict, query: str | None) -> bool:
+    if not query:
+        return True
+    haystack = f"{entry['name']} {entry['description']}".lower()
+    return all(term in haystack for term in query.lower().split())
+
+
+def _installed_docs(indexed: dict[str, dict]) -> list[dict]:
+    """Search documents for installed skills, reading only SKILL.md files that changed."""
+    root = os.path.join(_codex_home(), "skills")
+    docs = []
+    for parent in (root, os.path.join(root, ".system")):
+        try:
+            entries = list(os.scandir(parent))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            skill_md = os.path.join(entry.path, "SKILL.md")
+            doc_id = f"installed:{entry.path}"
+            try:
+                stat = os.stat(skill_md)
+            except OSError:
+                continue
+            signature = f"{stat.st_mtime_ns}:{stat.st_size}"
+            if indexed.get(doc_id, {}).get("signature") == signature:
+                docs.append({"id": doc_id, "signature": signature})
+                continue
+            try:
+                with open(skill_md, "r", encoding="utf-8", errors="replace") as file_handle:
+                    content = file_handle.read()
+            except OSError:
+                continue
+            frontmatter = parse_frontmatter(content) or {}
+            description = frontmatter.get("description")
+            docs.append(
+                {
+                    "id": doc_id,
+                    "source": "installed",
+                    "name": entry.name,
+                    "description": description.strip() if isinstance(description, str) else "",
+                    "headings": parse_headings(content),
+                    "signature": signature,
+                }
+            )
+    return docs
+
+
+def _curated_docs(repo: str, path: str, ref: str) -> list[dict]:
+    """Search documents from the cached catalog, fetching it only if none exists yet."""
+    catalog = _read_catalog(_catalog_path(repo, path, ref))
+    if catalog is None:
+        try:
+            catalog = _load_catalog(repo, path, ref, DEFAULT_CATALOG_TTL, refresh=False)
+        except ListError as exc:
+            print(f"Warning: searching installed skills only ({exc})", file=sys.stderr)
+            return []
+    return [
+        {
+            "id": f"curated:{repo}/{path}@{ref}:{entry['name']}",
+            "source": "curated",
+            "name": entry["name"],
+            "description": entry.get("description", ""),
+            "headings": entry.get("headings", []),
+            "signature": catalog["sha"],
+        }
+        for entry in catalog["skills"]
+    ]
+
+
+def _search(args: Args) -> list[dict]:
+    path = index_path(_codex_home())
+    index = load_index(path)
+    docs = _curated_docs(args.repo, args.path, args.ref) + _installed_docs(index["docs"])
+    if refresh_index(index, docs):
+        save_index(path, index)
+    return search(index, " ".join(args.terms), args.limit)
+
+
 def _parse_args(argv: list[str]) -> Args:
     parser = argparse.ArgumentParser(description="List curated skills.")
     parser.add_argument("--repo", default=DEFAULT_REPO)
@@ -76,12 +314,66 @@ def _parse_args(argv: list[str]) -> Args:
         default="text",
         help="Output format",
     )
+    parser.add_argument(
+        "--catalog",
+        action="store_true",
+        help="Include SKILL.md metadata, fetched with one archive download and cached",
+    )
+    parser.add_argument(
+        "--query", help="Only list catalog skills whose name/description contain every term"
+    )
+    parser.add_argument(
+        "--ttl",
+        type=int,
+        default=DEFAULT_CATALOG_TTL,
+        help="Seconds a cached catalog is used without checking GitHub",
+    )
+    parser.add_argument(
+        "--refresh", action="store_true", help="Ignore the catalog TTL and revalidate"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    search_parser = subparsers.add_parser(
+        "search", help="Search cached curated and installed skills by keyword"
+    )
+    search_parser.add_argument("terms", nargs="+", help="Keywords to search for")
+    search_parser.add_argument("--limit", type=int, default=DEFAULT_SEARCH_LIMIT)
+    search_parser.add_argument(
+        "--format", choices=["text", "json"], default=argparse.SUPPRESS, help="Output format"
+    )
     return parser.parse_args(argv, namespace=Args())
 
 
+def _print_catalog(args: Args) -> None:
+    catalog = _load_catalog(args.repo, args.path, args.ref, args.ttl, args.refresh)
+    installed = _installed_skills()
+    entries = [
+        {**entry, "installed": entry["name"] in installed, "sha": catalog["sha"]}
+        for entry in catalog["skills"]
+        if _matches(entry, args.query)
+    ]
+    if args.format == "json":
+        print(json.dumps(entries))
+        return
+    for idx, entry in enumerate(entries, start=1):
+        suffix = " (already installed)" if entry["installed"] else ""
+        description = f" - {entry['description']}" if entry["description"] else ""
+        print(f"{idx}. {entry['name']}{suffix}{description}")
+
+
 def main(argv: list[str]) -> int:
     args = _parse_args(argv)
     try:
+        if args.command == "search":
+            results = _search(args)
+            if args.format == "json":
+                print(json.dumps(results))
+            else:
+                for idx, result in enumerate(results, start=1):
+                    print(f"{idx}. {result['name']} ({result['source']}) - {result['description']}")
+            return 0
+        if args.catalog or args.query:
+            _print_catalog(args)
+            return 0
         skills = _list_curated(args.repo, args.path, args.ref)
         installed = _installed_skills()
         if args.format == "json":
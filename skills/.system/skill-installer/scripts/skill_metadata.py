@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""SKILL.md frontmatter parsing for the skill install scripts.
+
+The rules mirror skill-creator's quick_validate.py so an installed skill passes the same
+checks it was authored against. skill-installer must run on its own, so they are kept
+here rather than imported; tests/test_skill_metadata.py checks that the two agree.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+
+FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
+HEADING_RE = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$")
+ALLOWED_PROPERTIES = {"name", "description", "license", "allowed-tools", "metadata"}
+SKILL_NAME_RE = re.compile(r"^[a-z0-9-]+$")
+MAX_SKILL_NAME_LENGTH = 64
+MAX_DESCRIPTION_LENGTH = 1024
+SIMPLE_LINE_RE = re.compile(r"^(name|description|license|metadata):(?: +(\S.*))?$")
+NESTED_LINE_RE = re.compile(r"^( +)([A-Za-z0-9_-]+): +(\S.*)$")
+# Leading characters that make a YAML plain scalar something other than a plain string.
+UNSAFE_PLAIN_START = set("-?:,[]{}#&*!|>'\"%@`.+=<~0123456789")
+# YAML 1.1 words PyYAML resolves to booleans or null.
+YAML_SPECIAL_WORDS = {"y", "n", "yes", "no", "true", "false", "on", "off", "null"}
+
+
+def parse_frontmatter(content: str) -> dict | None:
+    """Return the SKILL.md frontmatter as a dict, or None if it is missing or malformed.
+
+    Frontmatter beyond simple scalars needs PyYAML; without it this returns None.
+    """
+    frontmatter_text, error = read_frontmatter_text(content)
+    if error:
+        return None
+    try:
+        frontmatter, _ = load_frontmatter(frontmatter_text)
+    except ImportError:
+        return None
+    return frontmatter
+
+
+def validate_skill_md(content: str) -> list[str]:
+    """Return the errors quick_validate.py reports for this SKILL.md content."""
+    frontmatter_text, error = read_frontmatter_text(content)
+    if error:
+        return [error]
+    try:
+        frontmatter, error = load_frontmatter(frontmatter_text)
+    except ImportError:
+        return ["PyYAML is required to validate this SKILL.md frontmatter (pip install pyyaml)"]
+    if error:
+        return [error]
+    return _frontmatter_errors(frontmatter)
+
+
+def read_frontmatter_text(content: str) -> tuple[str | None, str | None]:
+    """Return (frontmatter_text, error) for the block between the opening and closing '---'."""
+    lines_in = io.StringIO(content, newline=None)
+    first_line = lines_in.readline()
+    if not first_line.startswith("---"):
+        return None, "No YAML frontmatter found"
+    if first_line != "---\n":
+        return None, "Invalid frontmatter format"
+    lines: list[str] = []
+    for line in lines_in:
+        if lines and line.startswith("---"):
+            return "".join(lines)[:-1], None
+        lines.append(line)
+    return None, "Invalid frontmatter format"
+
+
+def load_frontmatter(frontmatter_text: str) -> tuple[dict | None, str | None]:
+    """Parse frontmatter text, returning (frontmatter, None) or (None, error).
+
+    Raises ImportError if the text needs PyYAML and it is not installed.
+    """
+    frontmatter = _parse_simple_frontmatter(frontmatter_text)
+    if frontmatter is not None:
+        return frontmatter, None
+    import yaml
+
+    try:
+        frontmatter = yaml.safe_load(frontmatter_text)
+    except yaml.YAMLError as exc:
+        return None, f"Invalid YAML in frontmatter: {exc}"
+    if not isinstance(frontmatter, dict):
+        return None, "Frontmatter must be a YAML dictionary"
+    return frontmatter, None
+
+
+def parse_headings(content: str) -> list[str]:
+    """Return the markdown heading texts in SKILL.md body order, skipping the frontmatter."""
+    content = content.replace("\r\n", "\n")
+    match = FRONTMATTER_RE.match(content)
+    body = content[match.end() :] if match else content
+    headings = []
+    in_fence = False
+    for line in body.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+            continue
+        heading = None if in_fence else HEADING_RE.match(line)
+        if heading:
+            headings.append(heading.group(1))
+    return headings
+
+
+def _parse_simple_frontmatter(frontmatter_text: str) -> dict | None:
+    """Parse flat scalars plus a one-level metadata mapping, or return None to defer to PyYAML."""
+    frontmatter: dict = {}
+    nested: dict | None = None
+    indent = None
+    for line in frontmatter_text.split("\n"):
+        if not line.strip():
+            continue
+        match = NESTED_LINE_RE.match(line)
+        if match and nested is not None:
+            key = match.group(2)
+            if indent not in (None, match.group(1)) or key in nested or _simple_scalar(key) != key:
+                return None
+            indent = match.group(1)
+            value = _simple_scalar(match.group(3).rstrip(" "))
+            if value is None:
+                return None
+            nested[key] = value
+            continue
+        if nested is not None and not nested:
+            return None
+        match = SIMPLE_LINE_RE.match(line)
+        if not match or match.group(1) in frontmatter:
+            return None
+        key, raw_value = match.group(1), match.group(2)
+        if key == "metadata":
+            if raw_value is not None:
+                return None
+            nested = frontmatter[key] = {}
+            indent = None
+            continue
+        nested = None
+        value = _simple_scalar(raw_value.rstrip(" ")) if raw_value is not None else None
+        if value is None:
+            return None
+        frontmatter[key] = value
+    if nested is not None and not nested:
+        return None
+    return frontmatter or None
+
+
+def _simple_scalar(value: str) -> str | None:
+    if not value.isprintable():
+        return None
+    if len(value) >= 2 and value[0] == value[-1] == "'" and "'" not in value[1:-1]:
+        return value[1:-1]
+    if len(value) >= 2 and value[0] == value[-1] == '"' and not set('"\\') & set(value[1:-1]):
+        return value[1:-1]
+    if value[0] in UNSAFE_PLAIN_START or value.lower() in YAML_SPECIAL_WORDS:
+        return None
+    if ": " in value or " #" in value or value.endswith(":"):
+        return None
+    return value
+
+
+def _frontmatter_errors(frontmatter: dict) -> list[str]:
+    errors = []
+    unexpected_keys = set(frontmatter) - ALLOWED_PROPERTIES
+    if unexpected_keys:
+        errors.append(
+            f"Unexpected key(s) in SKILL.md frontmatter: {', '.join(sorted(unexpected_keys))}. "
+            f"Allowed properties are: {', '.join(sorted(ALLOWED_PROPERTIES))}"
+        )
+    if "name" not in frontmatter:
+        errors.append("Missing 'name' in frontmatter")
+    if "description" not in frontmatter:
+        errors.append("Missing 'description' in frontmatter")
+
+    name = frontmatter.get("name", "")
+    if not isinstance(name, str):
+        errors.append(f"Name must be a string, got {type(name).__name__}")
+        name = ""
+    name = name.strip()
+    if name:
+        if not SKILL_NAME_RE.match(name):
+            errors.append(
+                f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
+            )
+        if name.startswith("-") or name.endswith("-") or "--" in name:
+            errors.append(f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens")
+        if len(name) > MAX_SKILL_NAME_LENGTH:
+            errors.append(
+                f"Name is too long ({len(name)} characters). "
+                f"Maximum is {MAX_SKILL_NAME_LENGTH} characters."
+            )
+
+    description = frontmatter.get("description", "")
+    if not isinstance(description, str):
+        errors.append(f"Description must be a string, got {type(description).__name__}")
+        description = ""
+    description = description.strip()
+    if description:
+        if "<" in description or ">" in description:
+            errors.append("Description cannot contain angle brackets (< or >)")
+        if len(description) > MAX_DESCRIPTION_LENGTH:
+            errors.append(
+                f"Description is too long ({len(description)} characters). "
+                f"Maximum is {MAX_DESCRIPTION_LENGTH} characters."
+            )
+    return errors
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Persistent inverted index over skill names, descriptions and headings."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+
+from skill_state import write_json_atomic
+
+INDEX_VERSION = 1
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = {"a", "an", "and", "for", "in", "of", "on", "or", "the", "to", "use", "when", "with"}
+FIELD_WEIGHTS = {"name": 3.0, "headings": 2.0, "description": 1.0}
+
+
+def tokenize(text: str) -> list[str]:
+    return [
+        token
+        for token in TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+def index_path(codex_home: str) -> str:
+    return os.path.join(codex_home, "cache", "skill-search", "index.json")
+
+
+def load_index(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as file_handle:
+            index = json.load(file_handle)
+    except (OSError, ValueError):
+        index = None
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        index = {"version": INDEX_VERSION, "docs": {}, "postings": {}}
+    return index
+
+
+def save_index(path: str, index: dict) -> None:
+    write_json_atomic(path, index)
+
+
+def refresh_index(index: dict, docs: list[dict]) -> bool:
+    """Reindex docs whose signature changed and drop vanished ones; return True if modified.
+
+    Docs whose signature is already indexed only need their "id" and "signature".
+    """
+    current = {doc["id"]: doc for doc in docs}
+    changed = False
+    for doc_id in list(index["docs"]):
+        doc = current.get(doc_id)
+        if doc is None or doc["signature"] != index["docs"][doc_id]["signature"]:
+            _remove_doc(index, doc_id)
+            changed = True
+    for doc_id, doc in current.items():
+        if doc_id not in index["docs"]:
+            _add_doc(index, doc)
+            changed = True
+    return changed
+
+
+def search(index: dict, query: str, limit: int) -> list[dict]:
+    """Rank docs by summed term weights; query terms also match as token prefixes."""
+    scores: dict[str, float] = {}
+    postings = index["postings"]
+    for term in set(tokenize(query)):
+        matches = [term] if term in postings else [t for t in postings if t.startswith(term)]
+        for token in matches:
+            # Prefix hits count for less than exact ones.
+            factor = 1.0 if token == term else 0.5
+            for doc_id, weight in postings[token].items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight * factor
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [{**_public_fields(index["docs"][doc_id]), "score": round(score, 2)} for doc_id, score in ranked]
+
+
+def _public_fields(doc: dict) -> dict:
+    return {key: doc[key] for key in ("source", "name", "description")}
+
+
+def _add_doc(index: dict, doc: dict) -> None:
+    weights: dict[str, float] = {}
+    for field, weight in FIELD_WEIGHTS.items():
+        value = doc.get(field) or ""
+        text = " ".join(value) if isinstance(value, list) else value
+        for token in tokenize(text):
+            weights[token] = weights.get(token, 0.0) + weight
+    index["docs"][doc["id"]] = {
+        "source": doc["source"],
+        "name": doc["name"],
+        "description": doc.get("description", ""),
+        "signature": doc["signature"],
+        "tokens": sorted(weights),
+    }
+    for token, weight in weights.items():
+        index["postings"].setdefault(token, {})[doc["id"]] = weight
+
+
+def _remove_doc(index: dict, doc_id: str) -> None:
+    doc = index["docs"].pop(doc_id)
+    for token in doc["tokens"]:
+        posting = index["postings"].get(token, {})
+        posting.pop(doc_id, None)
+        if not posting:
+            index["postings"].pop(token, None)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Installed-skill state shared by the skill install scripts."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Windows: file locks are no-ops, so processes are not serialized.
+    fcntl = None
+
+LOCK_FILENAME = "skills.lock"
+LOCK_VERSION = 1
+REGISTRY_VERSION = 1
+
+
+def lock_path(skills_root: str) -> str:
+    return os.path.join(skills_root, LOCK_FILENAME)
+
+
+def read_lock(skills_root: str) -> dict[str, dict]:
+    """Return the lock entries keyed by skill name, or {} if there is no usable lock."""
+    try:
+        with open(lock_path(skills_root), "r", encoding="utf-8") as file_handle:
+            data = json.load(file_handle)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or not isinstance(data.get("skills"), dict):
+        return {}
+    return {name: entry for name, entry in data["skills"].items() if isinstance(entry, dict)}
+
+
+def write_lock(skills_root: str, entries: dict[str, dict]) -> None:
+    write_json_atomic(
+        lock_path(skills_root),
+        {"version": LOCK_VERSION, "skills": dict(sorted(entries.items()))},
+    )
+
+
+def write_json_atomic(path: str, data: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file_handle:
+            json.dump(data, file_handle, indent=2, sort_keys=True)
+            file_handle.write("\n")
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+@contextlib.contextmanager
+def file_lock(lock_path: str, shared: bool = False):
+    """Hold an flock on lock_path (exclusive unless shared) for the duration of the block."""
+    with open(lock_path, "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def registry_path(codex_home: str) -> str:
+    return os.path.join(codex_home, "cache", "installed-skills.json")
+
+
+def installed_skills(skills_root: str, registry_file: str) -> dict[str, dict]:
+    """Return installed skills keyed by name from the registry.
+
+    The registry stores the skills directory mtime; the directory is only rescanned
+    when that mtime changes (a skill was added, removed or renamed).
+    """
+    try:
+        root_mtime = os.stat(skills_root).st_mtime_ns
+    except OSError:
+        return {}
+    root_key = os.path.realpath(skills_root)
+    registry = _read_registry(registry_file)
+    cached = registry["roots"].get(root_key)
+    if isinstance(cached, dict) and cached.get("dir_mtime_ns") == root_mtime:
+        return cached.get("skills", {})
+    return refresh_installed(skills_root, registry_file)
+
+
+def refresh_installed(skills_root: str, registry_file: str) -> dict[str, dict]:
+    """Rescan skills_root with os.scandir, merge lock details, and persist the registry."""
+    try:
+        root_mtime = os.stat(skills_root).st_mtime_ns
+        entries = list(os.scandir(skills_root))
+    except OSError:
+        return {}
+    lock = read_lock(skills_root)
+    skills = {}
+    for entry in entries:
+        if entry.name.startswith(".") or not entry.is_dir():
+            continue
+        locked = lock.get(entry.name, {})
+        source = None
+        if all(isinstance(locked.get(key), str) for key in ("repo", "path", "ref")):
+            source = f"{locked['repo']}/{locked['path']}@{locked['ref']}"
+        elif isinstance(locked.get("archive"), str):
+            source = locked["archive"]
+        skills[entry.name] = {
+            "source": source,
+            "sha": locked.get("sha"),
+            "mtime_ns": entry.stat().st_mtime_ns,
+        }
+    registry = _read_registry(registry_file)
+    registry["roots"][os.path.realpath(skills_root)] = {
+        "dir_mtime_ns": root_mtime,
+        "skills": skills,
+    }
+    try:
+        write_json_atomic(registry_file, registry)
+    except OSError:
+        pass
+    return skills
+
+
+def _read_registry(registry_file: str) -> dict:
+    try:
+        with open(registry_file, "r", encoding="utf-8") as file_handle:
+            data = json.load(file_handle)
+    except (OSError, ValueError):
+        data = None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != REGISTRY_VERSION
+        or not isinstance(data.get("roots"), dict)
+    ):
+        return {"version": REGISTRY_VERSION, "roots": {}}
+    return data
+
+
+def tree_hash(root: str) -> str:
+    """Hash relative file paths and contents under root, independent of walk order."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            files.append((os.path.relpath(path, root).replace(os.sep, "/"), path))
+    digest = hashlib.sha256()
+    for rel_path, path in sorted(files):
+        file_digest = hashlib.sha256()
+        with open(path, "rb") as file_handle:
+            for chunk in iter(lambda: file_handle.read(1024 * 1024), b""):
+                file_digest.update(chunk)
+        digest.update(f"{rel_path}\0{file_digest.hexdigest()}\n".encode("utf-8"))
+    return f"sha256:{digest.hexdigest()}"
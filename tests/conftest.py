@@ -0,0 +1,53 @@
+"""Shared fixtures for the skill script tests.
+
+The scripts are standalone files rather than an installed package, so each script
+directory is put on sys.path and hyphenated script names are loaded by path.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPT_DIRS = {
+    "skill-installer": REPO_ROOT / "skills" / ".system" / "skill-installer" / "scripts",
+    "skill-creator": REPO_ROOT / "skills" / ".system" / "skill-creator" / "scripts",
+    "gh-fix-ci": REPO_ROOT / "skills" / ".curated" / "gh-fix-ci" / "scripts",
+}
+for script_dir in SCRIPT_DIRS.values():
+    if str(script_dir) not in sys.path:
+        sys.path.insert(0, str(script_dir))
+
+
+def load_script(skill: str, filename: str):
+    """Import a script file from a skill's scripts directory under a valid module name."""
+    module_name = filename[: -len(".py")].replace("-", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPT_DIRS[skill] / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(autouse=True)
+def codex_home(tmp_path, monkeypatch):
+    """Point every cache and install location at a throwaway $CODEX_HOME."""
+    home = tmp_path / "codex-home"
+    home.mkdir()
+    monkeypatch.setenv("CODEX_HOME", str(home))
+    return home
+
+
+def write_skill(root: Path, name: str, description: str = "Does a thing.", body: str = "") -> Path:
+    skill_dir = root / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\n---\n\n# {name}\n{body}"
+    )
+    return skill_dir
@@ -0,0 +1,310 @@
+"""Tests for skill-installer's github_utils.py."""
+
+from __future__ import annotations
+
+import http.client
+import http.server
+import os
+import socket
+import struct
+import threading
+import time
+import urllib.error
+import zipfile
+
+import pytest
+from conftest import load_script
+
+import github_utils
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+
+@pytest.fixture
+def api(monkeypatch):
+    calls = []
+    answers = []
+
+    def request(url, user_agent, headers=None):
+        calls.append(url)
+        answer = answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    monkeypatch.setattr(github_utils, "github_request", request)
+    return calls, answers
+
+
+def test_commit_sha_is_cached_per_ref(api):
+    calls, answers = api
+    answers.extend([f"{SHA_A}\n".encode(), SHA_B.encode()])
+    assert github_utils.github_commit_sha("o/r", "main", "test") == SHA_A
+    assert github_utils.github_commit_sha("o/r", "main", "test") == SHA_A
+    assert calls == ["https://api.github.com/repos/o/r/commits/main"]
+    assert github_utils.github_commit_sha("o/r", "main", "test", max_age=0) == SHA_B
+    assert github_utils.github_commit_sha("o/r", "main", "test") == SHA_B
+
+
+def test_commit_sha_passes_through_full_shas_and_rejects_garbage(api):
+    calls, answers = api
+    assert github_utils.github_commit_sha("o/r", SHA_A, "test") == SHA_A
+    answers.append(b"<html>not a sha</html>")
+    assert github_utils.github_commit_sha("o/r", "main", "test") is None
+    assert len(calls) == 1
+
+
+def test_list_and_install_share_resolver_and_archive_cache(api):
+    calls, answers = api
+    installer = load_script("skill-installer", "install-skill-from-github.py")
+    lister = load_script("skill-installer", "list-curated-skills.py")
+    answers.append(SHA_A.encode())
+    assert lister._resolve_commit_sha("o/r", "main") == SHA_A
+    assert installer._resolve_commit_sha("o", "r", "main") == SHA_A
+    assert len(calls) == 1
+
+    cached = github_utils.github_archive_cache_path("o/r", SHA_A)
+    assert cached.endswith(f"archives/o/r/{SHA_A}.zip")
+    os.makedirs(os.path.dirname(cached))
+    with zipfile.ZipFile(cached, "w") as zip_file:
+        zip_file.writestr("r-main/skills/.curated/demo/SKILL.md", "# Demo\n")
+    entries = lister._build_catalog("o/r", "skills/.curated", SHA_A)
+    assert [entry["name"] for entry in entries] == ["demo"]
+    assert len(calls) == 1
+
+
+def test_list_reports_unresolvable_refs(api):
+    calls, answers = api
+    lister = load_script("skill-installer", "list-curated-skills.py")
+    answers.append(urllib.error.HTTPError("url", 404, "Not Found", None, None))
+    with pytest.raises(lister.ListError, match="Ref not found"):
+        lister._resolve_commit_sha("o/r", "nope")
+    answers.append(b"garbage")
+    with pytest.raises(lister.ListError, match="unexpected API response"):
+        lister._resolve_commit_sha("o/r", "main")
+
+
+def test_concurrent_resolutions_keep_every_ref(monkeypatch):
+    import json
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    barrier = threading.Barrier(8)
+
+    def request(url, user_agent, headers=None):
+        barrier.wait()
+        time.sleep(0.01)
+        return url.rsplit("/", 1)[1].encode().ljust(40, b"0")
+
+    monkeypatch.setattr(github_utils, "github_request", request)
+    refs = [f"{idx:x}" for idx in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda ref: github_utils.github_commit_sha("o/r", ref, "test"), refs))
+    with open(os.path.join(github_utils.github_cache_root(), "refs.json")) as file_handle:
+        cached = json.load(file_handle)
+    assert sorted(cached) == [f"o/r@{ref}" for ref in refs]
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_CONNECT(self):
+        self.server.seen.append((self.requestline, dict(self.headers)))
+        self._send(403)
+
+    def do_GET(self):
+        self.server.seen.append((self.requestline, dict(self.headers)))
+        port = self.server.server_address[1]
+        if self.path == "/data" or self.path.startswith("http://"):
+            self._send(200, b"hello")
+        elif self.path == "/redirect":
+            self._send(302, headers={"Location": f"https://localhost:{port}/echo-auth"})
+        elif self.path == "/echo-auth":
+            self._send(200, self.headers.get("Authorization", "none").encode())
+        elif self.path == "/etag":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self._send(304)
+            else:
+                self._send(200, b"fresh", {"ETag": '"v1"'})
+        elif self.path == "/flaky":
+            self.server.flaky_hits += 1
+            if self.server.flaky_hits > 1:
+                self._send(200, b"0123456789")
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", "10")
+            self.end_headers()
+            self.wfile.write(b"012")
+            self.wfile.flush()
+            # Reset the connection (RST) halfway through the body.
+            self.connection.setsockopt(
+                socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+            )
+            self.close_connection = True
+        elif self.path in ("/throttled", "/busy"):
+            self.server.hits[self.path] = self.server.hits.get(self.path, 0) + 1
+            if self.server.hits[self.path] > 1:
+                self._send(200, b"ok")
+            elif self.path == "/throttled":
+                self._send(429, b"slow down", {"Retry-After": "0"})
+            else:
+                self._send(503, b"busy")
+        elif self.path == "/exhausted":
+            self.server.hits[self.path] = self.server.hits.get(self.path, 0) + 1
+            reset = str(int(time.time()) + 3600)
+            headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}
+            self._send(403, b"API rate limit exceeded", headers)
+        else:
+            self.server.hits[self.path] = self.server.hits.get(self.path, 0) + 1
+            self._send(404)
+
+
+def _serve():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.flaky_hits = 0
+    server.seen = []
+    server.hits = {}
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def server():
+    server = _serve()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    """A client whose pooled "HTTPS" connections are plain HTTP to the test server."""
+    for name in ("http_proxy", "https_proxy", "no_proxy", "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(github_utils, "_backoff_delay", lambda attempt: 0.0)
+
+    def make():
+        client = github_utils.GitHubClient("test", str(tmp_path / "http-cache"))
+        client._https.connection_class = http.client.HTTPConnection
+        return client
+
+    return make
+
+
+def test_direct_connections_are_kept_alive(server, client):
+    github = client()
+    url = f"https://127.0.0.1:{server.server_address[1]}/data"
+    assert github.request(url, cache=False) == b"hello"
+    assert github.request(url, cache=False) == b"hello"
+    assert server.connections == 1
+
+
+def test_not_modified_replays_cached_body(server, client):
+    github = client()
+    url = f"https://127.0.0.1:{server.server_address[1]}/etag"
+    assert github.request(url) == b"fresh"
+    assert github.request(url) == b"fresh"
+    assert github.stats.not_modified == 1
+    assert server.connections == 1
+
+
+def test_download_retries_reset_mid_body(server, client, tmp_path):
+    github = client()
+    dest = tmp_path / "payload"
+    url = f"https://127.0.0.1:{server.server_address[1]}/flaky"
+    assert github.download(url, str(dest)) == 10
+    assert dest.read_bytes() == b"0123456789"
+    assert github.stats.retries == 1
+
+
+def test_redirect_keeps_token_on_github_hosts_only(server, client, monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", "secret")
+    monkeypatch.setattr(github_utils, "GITHUB_HOSTS", {"127.0.0.1"})
+    github = client()
+    port = server.server_address[1]
+    assert github.request(f"https://127.0.0.1:{port}/echo-auth", cache=False) == b"token secret"
+    assert github.request(f"https://127.0.0.1:{port}/redirect", cache=False) == b"none"
+
+
+def test_https_proxy_is_tunnelled_by_urllib(server, client, monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", f"http://user:pw@127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(github_utils, "MAX_RETRIES", 0)
+    github = client()
+    with pytest.raises(urllib.error.URLError, match="Tunnel connection failed: 403"):
+        github.request("https://api.github.com/repos/o/r", cache=False)
+    requestline, headers = server.seen[0]
+    assert requestline == "CONNECT api.github.com:443 HTTP/1.0"
+    assert headers["Proxy-Authorization"] == "Basic dXNlcjpwdw=="
+
+
+def test_http_proxy_gets_absolute_url(server, client, monkeypatch):
+    monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{server.server_address[1]}")
+    github = client()
+    assert github.request("http://example.invalid/thing", cache=False) == b"hello"
+    assert server.seen[0][0] == "GET http://example.invalid/thing HTTP/1.1"
+
+
+def test_no_proxy_hosts_connect_directly(server, client, monkeypatch):
+    dead = _serve()
+    dead_port = dead.server_address[1]
+    dead.shutdown()
+    dead.server_close()
+    monkeypatch.setenv("HTTPS_PROXY", f"http://127.0.0.1:{dead_port}")
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    github = client()
+    assert github.request(f"https://127.0.0.1:{server.server_address[1]}/data", cache=False) == b"hello"
+
+
+@pytest.mark.parametrize("path", ["/throttled", "/busy"])
+def test_transient_failures_are_retried(server, client, path):
+    github = client()
+    assert github.request(f"https://127.0.0.1:{server.server_address[1]}{path}", cache=False) == b"ok"
+    assert github.stats.retries == 1
+    assert server.hits[path] == 2
+
+
+def test_client_errors_are_not_retried(server, client):
+    github = client()
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        github.request(f"https://127.0.0.1:{server.server_address[1]}/missing", cache=False)
+    assert excinfo.value.code == 404
+    assert github.stats.retries == 0
+    assert server.hits["/missing"] == 1
+
+
+def test_long_rate_limit_waits_fail_fast(server, client):
+    github = client()
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        github.request(f"https://127.0.0.1:{server.server_address[1]}/exhausted", cache=False)
+    assert excinfo.value.code == 403
+    assert server.hits["/exhausted"] == 1
+
+
+def test_token_bucket_paces_after_burst():
+    bucket = github_utils.TokenBucket(rate=50.0, capacity=2)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() > 0.0
+    bucket.pause(0.05)
+    started = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - started >= 0.04
@@ -0,0 +1,478 @@
+from __future__ import annotations
+
+import io
+import json
+import sys
+import threading
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import inspect_pr_checks as ipc
+
+STEPS = [
+    {"name": "Set up job", "number": 1, "conclusion": "success"},
+    {"name": "Run tests", "number": 2, "conclusion": "failure"},
+    {"name": "Post", "number": 10, "conclusion": "success"},
+]
+
+
+def make_zip(members: dict[str, str]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, text in members.items():
+            archive.writestr(name, text)
+    return buffer.getvalue()
+
+
+class FakeGh:
+    """Stands in for the gh CLI: a job log payload plus the job API's step list."""
+
+    def __init__(self, payload: bytes, steps=STEPS, returncode: int = 0):
+        self.payload = payload
+        self.steps = steps
+        self.returncode = returncode
+        self.calls: list[list[str]] = []
+        self.spooled: list[io.BytesIO] = []
+
+    def stream(self, args, cwd, on_line):
+        self.calls.append(list(args))
+        if ipc.is_zip_payload(self.payload):
+            spooled = io.BytesIO(self.payload)
+            self.spooled.append(spooled)
+            return ipc.GhResult(self.returncode, "", "boom" if self.returncode else ""), spooled
+        for line in self.payload.decode().splitlines():
+            on_line(line)
+        return ipc.GhResult(self.returncode, "", ""), None
+
+    def run(self, args, cwd):
+        self.calls.append(list(args))
+        if self.steps is None:
+            return ipc.GhResult(1, "", "not found")
+        return ipc.GhResult(0, json.dumps({"steps": self.steps}), "")
+
+
+@pytest.fixture
+def fake_gh(monkeypatch):
+    def install(payload: bytes, **kwargs) -> FakeGh:
+        gh = FakeGh(payload, **kwargs)
+        monkeypatch.setattr(ipc, "stream_gh_command", gh.stream)
+        monkeypatch.setattr(ipc, "run_gh_command", gh.run)
+        return gh
+
+    return install
+
+
+def zipped_job_log() -> bytes:
+    return make_zip(
+        {
+            "build/1_Set up job.txt": "error: unrelated setup noise\n",
+            "build/2_Run tests.txt": "collecting\r\nFAILED tests/test_a.py::test_x - assert 1 == 2\r\n",
+            "build/10_Post.txt": "cleanup\n",
+            "build/system.txt": "runner info\n",
+        }
+    )
+
+
+def test_zipped_job_log_only_reads_failed_step(fake_gh, monkeypatch):
+    gh = fake_gh(zipped_job_log())
+    opened = []
+    real_open = zipfile.ZipFile.open
+
+    def spy_open(self, name, *args, **kwargs):
+        opened.append(name)
+        return real_open(self, name, *args, **kwargs)
+
+    monkeypatch.setattr(zipfile.ZipFile, "open", spy_open)
+
+    log, error = ipc.fetch_job_log("7", Path("."), "o/r")
+
+    assert error == ""
+    assert opened == ["build/2_Run tests.txt"]
+    assert log.tail() == "collecting\nFAILED tests/test_a.py::test_x - assert 1 == 2"
+    assert ["api", "/repos/o/r/actions/jobs/7"] in gh.calls
+    assert gh.spooled[0].closed
+
+
+def test_zipped_job_log_falls_back_to_every_step_in_order(fake_gh):
+    fake_gh(zipped_job_log(), steps=None)
+
+    log, error = ipc.fetch_job_log("7", Path("."), "o/r")
+
+    assert error == ""
+    assert log.tail().splitlines() == [
+        "error: unrelated setup noise",
+        "collecting",
+        "FAILED tests/test_a.py::test_x - assert 1 == 2",
+        "cleanup",
+    ]
+
+
+@pytest.mark.parametrize("offset", [70, 120, -60])
+def test_corrupt_zip_member_is_an_error_not_an_exception(fake_gh, offset):
+    payload = bytearray(
+        make_zip({"2_Run tests.txt": "".join(f"line {i} of output\n" for i in range(3000))})
+    )
+    # Past the local header and file name, inside the deflate stream.
+    payload[offset if offset > 0 else len(payload) + offset - 100] ^= 0xFF
+    fake_gh(bytes(payload))
+
+    log, error = ipc.fetch_job_log("7", Path("."), "o/r")
+
+    assert log is None
+    assert error.startswith("Job logs zip archive is corrupt (2_Run tests.txt): ")
+
+
+def test_unreadable_zip_and_missing_steps(fake_gh):
+    fake_gh(b"PK\x03\x04 definitely not a zip")
+    assert ipc.fetch_job_log("7", Path("."), "o/r") == (
+        None,
+        "Job logs returned an unreadable zip archive.",
+    )
+
+    fake_gh(make_zip({"README": "hi"}))
+    assert ipc.fetch_job_log("7", Path("."), "o/r") == (
+        None,
+        "Job logs zip archive contains no step logs.",
+    )
+
+
+def test_failed_gh_call_closes_zip_payload(fake_gh):
+    gh = fake_gh(zipped_job_log(), returncode=1)
+
+    assert ipc.fetch_job_log("7", Path("."), "o/r") == (None, "boom")
+    assert gh.spooled[0].closed
+
+
+PREFIX = "test (py3.11)\tRun tests\t2024-01-01T00:00:00.1234567Z "
+
+
+def analyze(lines, max_lines=160, context=30, regions=3) -> ipc.LogAnalyzer:
+    analyzer = ipc.LogAnalyzer(max_lines, context, regions)
+    for line in lines:
+        analyzer.feed(line)
+    return analyzer.finish()
+
+
+@pytest.mark.parametrize(
+    ("line", "signature"),
+    [
+        ("FAILED tests/test_a.py::test_x - assert 1 == 2", "pytest-failed"),
+        ("E       assert 1 == 2", "pytest-assert"),
+        ("===== 2 failed, 10 passed in 1.2s =====", "pytest-summary"),
+        ("error[E0308]: mismatched types", "cargo-error"),
+        ("test parser::tests::empty ... FAILED", "cargo-test-failed"),
+        ("thread 'main' panicked at src/lib.rs:3:5:", "rust-panic"),
+        ("  ● Cart › applies discount codes", "jest-test"),
+        ("FAIL src/cart/cart.test.ts", "jest-suite"),
+        ("--- FAIL: TestResolve (0.02s)", "go-test-failed"),
+        ("panic: runtime error: index out of range", "go-panic"),
+        ("FAIL\tgithub.com/acme/resolver\t0.412s", "go-package-failed"),
+        ("src/a.ts(3,5): error TS2322: Type 'string' is not assignable", "tsc-error"),
+        ("Traceback (most recent call last):", "python-traceback"),
+        ("##[error]Process completed with exit code 1.", "exit-code"),
+        ("##[error]Something went wrong", "actions-error"),
+        ("npm WARN deprecated error-ex@1.3.2", "generic"),
+        ("\x1b[31mE   assert 1\x1b[0m", "pytest-assert"),
+    ],
+)
+def test_match_signature_with_and_without_gh_prefix(line, signature):
+    for prefix in ("", "2024-01-01T00:00:00.1234567Z ", PREFIX, "job\tstep\t﻿2024-01-01T00:00:00Z "):
+        match = ipc.match_signature(prefix + line)
+        assert match is not None, prefix + line
+        assert match[0] == signature
+
+
+def test_markers_in_job_or_step_names_do_not_match():
+    assert ipc.match_signature("test-failures\tRun tests\t2024-01-01T00:00:00Z all good") is None
+    assert ipc.match_signature(PREFIX + "collected 12 items") is None
+
+
+def test_specific_failure_beats_later_generic_noise():
+    lines = [PREFIX + f"setup {i}" for i in range(100)]
+    lines += [PREFIX + "FAILED tests/test_api.py::test_timeout - assert 503 == 200"]
+    lines += [PREFIX + f"more output {i}" for i in range(100)]
+    lines += [PREFIX + "Removing error-reporter cache"]
+
+    analyzer = analyze(lines)
+    regions = analyzer.regions()
+
+    assert [region["line"] for region in regions] == [101, 202]
+    assert regions[0]["signatures"] == ["pytest-failed"]
+    assert "test_timeout" in analyzer.snippet().splitlines()[30]
+    # 30 lines of context before the failure and 29 after it.
+    assert len(regions[0]["text"].splitlines()) == 60
+
+
+def test_regions_are_top_k_distinct_and_ranked():
+    lines = []
+    for repeat in range(3):
+        lines += ["warning: flaky network, error: retrying"] + ["ok"] * 50
+    lines += ["--- FAIL: TestA (0.01s)"] + ["ok"] * 50
+    lines += ["error TS2322: nope"] + ["ok"] * 50
+    lines += ["Traceback (most recent call last):"] + ["ok"] * 50
+
+    regions = analyze(lines, context=5, regions=3).regions()
+
+    # Equal scores go to the later region.
+    assert [region["signatures"] for region in regions] == [
+        ["tsc-error"],
+        ["go-test-failed"],
+        ["python-traceback"],
+    ]
+    # The three retries of the same generic line count as one region.
+    assert [region["signatures"] for region in analyze(lines, context=5, regions=10).regions()][-1] == [
+        "generic"
+    ]
+    assert len(analyze(lines, context=5, regions=10).regions()) == 4
+
+
+def test_region_context_is_capped_and_does_not_overlap():
+    lines = [f"l{i}" for i in range(5)] + ["error: one"] + ["mid", "l8", "error: two"]
+
+    regions = analyze(lines, max_lines=20, context=2).regions()
+
+    assert [region["text"].splitlines() for region in regions] == [
+        ["l8", "error: two"],
+        ["l3", "l4", "error: one", "mid"],
+    ]
+
+
+def test_regions_is_read_only_after_finish():
+    analyzer = ipc.LogAnalyzer(160, 3)
+    for line in ["a", "b", "FAILED t.py::x - boom"]:
+        analyzer.feed(line)
+    # Still open: nothing is reported until finish() closes it.
+    assert analyzer.regions() == []
+    assert analyzer.regions() == []
+
+    analyzer.finish()
+    first = analyzer.regions()
+    analyzer.finish()
+    assert analyzer.regions() == first
+    assert analyzer.snippet() == "a\nb\nFAILED t.py::x - boom"
+
+
+def test_snippet_falls_back_to_tail_without_failures():
+    analyzer = analyze([f"line {i}" for i in range(10)], max_lines=3)
+
+    assert analyzer.regions() == []
+    assert analyzer.snippet() == analyzer.tail() == "line 7\nline 8\nline 9"
+
+
+def test_stream_run_log_finishes_every_analyzer(monkeypatch):
+    run_lines = [
+        "build\tRun\t2024-01-01T00:00:00Z compiling",
+        "build\tRun\t2024-01-01T00:00:01Z error[E0308]: mismatched types",
+        "test\tRun\t2024-01-01T00:00:02Z FAILED t.py::x - boom",
+    ]
+
+    def stream(args, cwd, on_line):
+        for line in run_lines:
+            on_line(line)
+        return ipc.GhResult(0, "", ""), None
+
+    monkeypatch.setattr(ipc, "stream_gh_command", stream)
+
+    job_logs, run_log, error = ipc.stream_run_log("1", Path("."), 160, 30)
+
+    assert error == ""
+    assert [region["signatures"] for region in job_logs["build"].regions()] == [["cargo-error"]]
+    assert [region["signatures"] for region in job_logs["test"].regions()] == [["pytest-failed"]]
+    assert run_log.regions()[0]["signatures"] == ["cargo-error", "pytest-failed"]
+
+
+class RunsGh:
+    """Stands in for `gh run view`: per-run logs (or an error) and call counts."""
+
+    def __init__(self, logs: dict[str, list[str] | str], barrier: threading.Barrier | None = None):
+        self.logs = logs
+        self.barrier = barrier
+        self.log_calls: list[str] = []
+        self.metadata_calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def stream(self, args, cwd, on_line):
+        run_id = args[2]
+        with self._lock:
+            self.log_calls.append(run_id)
+        if self.barrier is not None:
+            self.barrier.wait()
+        log = self.logs[run_id]
+        if isinstance(log, str):
+            return ipc.GhResult(1, "", log), None
+        for line in log:
+            on_line(line)
+        return ipc.GhResult(0, "", ""), None
+
+    def run(self, args, cwd):
+        with self._lock:
+            self.metadata_calls.append(args[2])
+        return ipc.GhResult(0, json.dumps({"name": f"run {args[2]}"}), "")
+
+
+@pytest.fixture
+def runs_gh(monkeypatch):
+    def install(logs, **kwargs) -> RunsGh:
+        gh = RunsGh(logs, **kwargs)
+        monkeypatch.setattr(ipc, "stream_gh_command", gh.stream)
+        monkeypatch.setattr(ipc, "run_gh_command", gh.run)
+        return gh
+
+    return install
+
+
+def check(name: str, run_id: str | None) -> dict[str, str]:
+    url = f"https://github.com/o/r/actions/runs/{run_id}/job/9" if run_id else "https://ci.example"
+    return {"name": name, "detailsUrl": url}
+
+
+def test_analyze_checks_fetches_runs_concurrently_and_keeps_order(runs_gh):
+    # Both run logs must be in flight at once for the barrier to release.
+    gh = runs_gh(
+        {
+            "1": ["build\tRun\t2024-01-01T00:00:00Z error[E0308]: mismatched types"],
+            "2": "run 2 failed",
+        },
+        barrier=threading.Barrier(2, timeout=5),
+    )
+    checks = [check("build", "1"), check("lint", None), check("test", "2")]
+
+    results = ipc.analyze_checks(checks, Path("."), 160, 30, jobs=4)
+
+    assert [result["name"] for result in results] == ["build", "lint", "test"]
+    assert [result["status"] for result in results] == ["ok", "external", "log_unavailable"]
+    assert results[0]["failureRegions"][0]["signatures"] == ["cargo-error"]
+    assert results[2]["error"] == "run 2 failed"
+    assert sorted(gh.log_calls) == ["1", "2"]
+
+
+def test_sequential_and_concurrent_analysis_agree(runs_gh):
+    runs_gh(
+        {
+            "1": ["build\tRun\t2024-01-01T00:00:00Z error[E0308]: mismatched types"],
+            "2": ["test\tRun\t2024-01-01T00:00:00Z FAILED t.py::x"],
+        }
+    )
+    checks = [check("test", "2"), check("build", "1"), check("lint", None)]
+
+    assert ipc.analyze_checks(checks, Path("."), 160, 30, jobs=1) == ipc.analyze_checks(
+        checks, Path("."), 160, 30, jobs=3
+    )
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_checks_sharing_a_run_fetch_it_once_and_get_their_own_job(runs_gh, jobs):
+    gh = runs_gh(
+        {
+            "7": [
+                "build\tRun\t2024-01-01T00:00:00Z error[E0308]: mismatched types",
+                "test\tRun\t2024-01-01T00:00:01Z FAILED t.py::x - boom",
+            ]
+        }
+    )
+    checks = [check("build", "7"), check("test", "7"), check("docs", "7")]
+
+    build, test, docs = ipc.analyze_checks(checks, Path("."), 160, 30, jobs=jobs)
+
+    assert gh.log_calls == ["7"]
+    assert gh.metadata_calls == ["7"]
+    assert build["failureRegions"][0]["signatures"] == ["cargo-error"]
+    assert "FAILED" not in build["logSnippet"]
+    assert test["failureRegions"][0]["signatures"] == ["pytest-failed"]
+    # A check whose job has no lines in the run log falls back to the whole run.
+    assert docs["failureRegions"][0]["signatures"] == ["cargo-error", "pytest-failed"]
+    assert build["run"] is test["run"] is docs["run"]
+
+
+def test_run_cache_shares_a_failed_fetch(runs_gh):
+    gh = runs_gh({"7": "HTTP 502"})
+    runs = ipc.RunCache(Path("."), 160, 30)
+
+    assert runs.job_log("7", "build") == (None, "HTTP 502")
+    assert runs.job_log("7", "test") == (None, "HTTP 502")
+    assert gh.log_calls == ["7"]
+
+
+def test_analyzer_memory_does_not_grow_with_the_log():
+    analyzer = ipc.LogAnalyzer(max_lines=5, context=3, regions=2)
+    for i in range(20000):
+        analyzer.feed(f"FAILED t.py::test_{i} - boom" if i % 50 == 0 else f"line {i}")
+        assert len(analyzer._lines) <= 5
+        assert len(analyzer._top) <= 2
+        assert analyzer._region is None or len(analyzer._region["lines"]) <= 5 + 3
+    analyzer.finish()
+
+    assert analyzer.tail() == "\n".join(f"line {i}" for i in range(19995, 20000))
+    assert [region["line"] for region in analyzer.regions()] == [19951, 19901]
+
+
+@pytest.fixture
+def fake_gh_process(monkeypatch):
+    """Run a Python snippet in place of the gh binary."""
+
+    def install(source: str):
+        real_popen = ipc.subprocess.Popen
+
+        def popen(args, **kwargs):
+            return real_popen([sys.executable, "-c", source, *args[1:]], **kwargs)
+
+        monkeypatch.setattr(ipc.subprocess, "Popen", popen)
+
+    return install
+
+
+def test_stream_gh_command_passes_lines_without_keeping_stdout(fake_gh_process):
+    fake_gh_process(
+        "import sys\n"
+        "for i in range(3): print(f'line {i}')\n"
+        "sys.stdout.write('no newline')\n"
+        "sys.stderr.write('warn')\n"
+        "sys.exit(3)\n"
+    )
+    lines: list[str] = []
+
+    result, payload = ipc.stream_gh_command(["run", "view"], Path("."), lines.append)
+
+    assert lines == ["line 0", "line 1", "line 2", "no newline"]
+    assert (result.returncode, result.stdout, result.stderr, payload) == (3, "", "warn", None)
+
+
+@pytest.mark.parametrize("spool_bytes", [ipc.ZIP_SPOOL_BYTES, 16])
+def test_stream_gh_command_spools_zip_payloads(fake_gh_process, tmp_path, monkeypatch, spool_bytes):
+    monkeypatch.setattr(ipc, "ZIP_SPOOL_BYTES", spool_bytes)
+    archive = tmp_path / "log.zip"
+    archive.write_bytes(make_zip({"build/1_Run.txt": "error: boom\n"}))
+    fake_gh_process(f"import sys; sys.stdout.buffer.write(open({str(archive)!r}, 'rb').read())")
+    lines: list[str] = []
+
+    result, payload = ipc.stream_gh_command(["api", "/logs"], Path("."), lines.append)
+
+    assert result.returncode == 0 and lines == []
+    with payload, zipfile.ZipFile(payload) as zip_file:
+        assert zip_file.read("build/1_Run.txt") == b"error: boom\n"
+
+
+def test_stream_run_log_matches_each_line_once(monkeypatch):
+    run_lines = [f"job{i % 3}\tRun\t2024-01-01T00:00:00Z line {i}" for i in range(30)]
+    matched: list[str] = []
+    real_match = ipc.match_signature
+
+    def match_signature(line):
+        matched.append(line)
+        return real_match(line)
+
+    def stream(args, cwd, on_line):
+        for line in run_lines:
+            on_line(line)
+        return ipc.GhResult(0, "", ""), None
+
+    monkeypatch.setattr(ipc, "match_signature", match_signature)
+    monkeypatch.setattr(ipc, "stream_gh_command", stream)
+
+    job_logs, run_log, _ = ipc.stream_run_log("1", Path("."), 160, 30)
+
+    assert matched == run_lines
+    assert sorted(job_logs) == ["job0", "job1", "job2"]
+    assert run_log.tail().count("\n") == 29
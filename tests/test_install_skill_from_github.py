@@ -0,0 +1,405 @@
+"""Tests for skill-installer's install-skill-from-github.py."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+import zipfile
+
+import pytest
+from conftest import load_script
+
+installer = load_script("skill-installer", "install-skill-from-github.py")
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+
+def _write_repo_zip(zip_path, comment, files=None):
+    files = files or {"skills/demo/SKILL.md": "---\nname: demo\ndescription: Demo.\n---\n"}
+    with zipfile.ZipFile(zip_path, "w") as zip_file:
+        for path, content in files.items():
+            zip_file.writestr(f"repo-{comment[:7]}/{path}", content)
+        zip_file.comment = comment.encode("ascii")
+
+
+@pytest.fixture
+def fake_github(monkeypatch):
+    """Serve repo zips whose comment is the commit they were built from."""
+    state = {"resolved": SHA_A, "head": SHA_A, "fetched": []}
+
+    def resolve(owner, repo, ref, max_age=installer.REF_CACHE_TTL_SECONDS):
+        return state["resolved"]
+
+    def fetch(owner, repo, ref, zip_path):
+        state["fetched"].append(ref)
+        _write_repo_zip(zip_path, ref if installer.COMMIT_SHA_RE.match(ref) else state["head"])
+
+    monkeypatch.setattr(installer, "_resolve_commit_sha", resolve)
+    monkeypatch.setattr(installer, "_fetch_repo_zip", fetch)
+    return state
+
+
+def _install(dest, *extra):
+    argv = ["--repo", "o/r", "--path", "skills/demo", "--method", "download", "--dest", str(dest)]
+    return installer.main([*argv, *extra])
+
+
+@pytest.mark.parametrize("extra", [(), ("--no-cache",)])
+def test_lock_records_downloaded_commit(tmp_path, fake_github, extra):
+    dest = tmp_path / "skills"
+    assert _install(dest, *extra) == 0
+    assert fake_github["fetched"] == [SHA_A]
+    entry = installer.read_lock(str(dest))["demo"]
+    assert entry["sha"] == SHA_A
+    assert entry["tree_hash"] == installer.tree_hash(str(dest / "demo"))
+
+
+def test_unresolved_ref_uses_archive_commit(tmp_path, fake_github):
+    fake_github.update(resolved=None, head=SHA_B)
+    dest = tmp_path / "skills"
+    assert _install(dest, "--no-cache") == 0
+    assert fake_github["fetched"] == ["main"]
+    assert installer.read_lock(str(dest))["demo"]["sha"] == SHA_B
+
+
+def test_sync_skips_unchanged_and_reinstalls_modified(tmp_path, fake_github, monkeypatch, capsys):
+    dest = tmp_path / "skills"
+    assert _install(dest) == 0
+    monkeypatch.setattr(installer, "_remote_commit_sha", lambda source: SHA_A)
+    groups, unchanged, skipped = installer._sync_groups(str(dest))
+    assert (groups, unchanged, skipped) == ([], ["demo"], [])
+
+    (dest / "demo" / "SKILL.md").write_text("local edit")
+    capsys.readouterr()
+    assert installer.main(["--sync", "--dest", str(dest)]) == 0
+    assert "Installed demo" in capsys.readouterr().out
+    assert (dest / "demo" / "SKILL.md").read_text().startswith("---")
+
+
+def test_failed_replace_restores_existing_skills(tmp_path, monkeypatch):
+    dest_root = tmp_path / "skills"
+    items = []
+    for name in ("alpha", "beta"):
+        (dest_root / name).mkdir(parents=True)
+        (dest_root / name / "SKILL.md").write_text(f"old {name}")
+        src = tmp_path / "new" / name
+        src.mkdir(parents=True)
+        (src / "SKILL.md").write_text(f"new {name}")
+        items.append((str(src), str(dest_root / name)))
+
+    real_rename = os.rename
+
+    def rename(src, dest):
+        if os.path.basename(dest) == "beta" and "new-" in os.path.basename(src):
+            raise OSError("rename failed")
+        return real_rename(src, dest)
+
+    monkeypatch.setattr(os, "rename", rename)
+    with pytest.raises(OSError):
+        installer._install_trees(items, str(dest_root), replace=True)
+    assert (dest_root / "alpha" / "SKILL.md").read_text() == "old alpha"
+    assert (dest_root / "beta" / "SKILL.md").read_text() == "old beta"
+    assert sorted(os.listdir(dest_root)) == ["alpha", "beta"]
+
+
+def test_existing_destination_requires_upgrade(tmp_path, fake_github, capsys):
+    dest = tmp_path / "skills"
+    assert _install(dest) == 0
+    assert _install(dest) == 1
+    assert "use --upgrade" in capsys.readouterr().err
+    assert _install(dest, "--upgrade") == 0
+
+
+def test_manifest_conflicts_mention_archive(tmp_path, capsys):
+    argv = ["--manifest", str(tmp_path / "m.json"), "--archive", "x.skill"]
+    assert installer.main(argv) == 1
+    assert "--name or --archive" in capsys.readouterr().err
+
+
+def test_transfer_summary_separates_renamed_and_copied(tmp_path, fake_github, capsys):
+    assert _install(tmp_path / "skills") == 0
+    out = capsys.readouterr().out
+    size = installer._format_bytes(len("---\nname: demo\ndescription: Demo.\n---\n"))
+    assert f"Skill files: {size} renamed into place, 0 B copied." in out
+
+
+def test_move_tree_copies_across_filesystems(tmp_path, monkeypatch):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "SKILL.md").write_text("12345")
+
+    def cross_device(src_path, dest_path):
+        raise OSError(installer.errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "rename", cross_device)
+    monkeypatch.setattr(installer, "_transfer_stats", installer.TransferStats())
+    installer._move_tree(str(src), str(tmp_path / "dest"))
+    assert (tmp_path / "dest" / "SKILL.md").read_text() == "12345"
+    assert installer._transfer_stats == installer.TransferStats(moved_bytes=0, copied_bytes=5)
+
+
+def test_cached_archive_is_reused(tmp_path, fake_github):
+    assert _install(tmp_path / "one") == 0
+    assert _install(tmp_path / "two") == 0
+    assert fake_github["fetched"] == [SHA_A]
+    assert os.path.isfile(installer.github_archive_cache_path("o/r", SHA_A))
+
+
+def test_eviction_waits_for_archive_readers(tmp_path, monkeypatch):
+    import threading
+
+    archive_root = os.path.join(installer._cache_root(), "archives")
+    os.makedirs(os.path.join(archive_root, "o", "r"))
+    archive = os.path.join(archive_root, "o", "r", f"{SHA_B}.zip")
+    with open(archive, "wb") as file_handle:
+        file_handle.write(b"zip")
+    monkeypatch.setattr(installer, "CACHE_MAX_BYTES", 0)
+
+    lock_path = os.path.join(archive_root, installer.ARCHIVE_LOCK_FILENAME)
+    evictor = threading.Thread(target=installer._evict_archives, args=(archive_root, "other"))
+    with installer.file_lock(lock_path, shared=True):
+        evictor.start()
+        evictor.join(0.2)
+        assert evictor.is_alive()
+        assert os.path.exists(archive)
+    evictor.join(5)
+    assert not os.path.exists(archive)
+
+
+def test_download_extracts_only_requested_paths(tmp_path, monkeypatch):
+    def fetch(owner, repo, ref, zip_path):
+        _write_repo_zip(
+            zip_path,
+            SHA_A,
+            {
+                "skills/demo/SKILL.md": "demo",
+                "skills/demo/scripts/run.py": "print()",
+                "skills/demo-extra/SKILL.md": "sibling with a shared prefix",
+                "README.md": "readme",
+            },
+        )
+
+    monkeypatch.setattr(installer, "_resolve_commit_sha", lambda *args: None)
+    monkeypatch.setattr(installer, "_fetch_repo_zip", fetch)
+    dest = tmp_path / "extract"
+    dest.mkdir()
+    repo_root, sha = installer._download_repo_zip("o", "r", "main", str(dest), ["skills/demo/"])
+    extracted = sorted(
+        os.path.relpath(os.path.join(dirpath, name), repo_root)
+        for dirpath, _, names in os.walk(repo_root)
+        for name in names
+    )
+    assert extracted == ["skills/demo/SKILL.md", "skills/demo/scripts/run.py"]
+    assert sha == SHA_A
+    assert not (dest / "repo.zip").exists()
+
+
+def test_extract_rejects_paths_outside_destination(tmp_path):
+    zip_path = tmp_path / "evil.zip"
+    with zipfile.ZipFile(zip_path, "w") as zip_file:
+        zip_file.writestr("repo-main/skills/demo/../../../../escape.txt", "x")
+    with zipfile.ZipFile(zip_path) as zip_file, pytest.raises(installer.InstallError):
+        installer._safe_extract_zip(zip_file, str(tmp_path / "out"), ["repo-main/skills/demo/"])
+    assert not (tmp_path / "escape.txt").exists()
+
+
+def test_manifest_fetches_each_repo_once(tmp_path, monkeypatch, capsys):
+    fetched = []
+
+    def fetch(owner, repo, ref, zip_path):
+        fetched.append(f"{owner}/{repo}@{ref}")
+        files = {
+            f"skills/{name}/SKILL.md": f"---\nname: {name}\ndescription: Demo.\n---\n"
+            for name in ("one", "two")
+        }
+        _write_repo_zip(zip_path, ref, files)
+
+    monkeypatch.setattr(installer, "_resolve_commit_sha", lambda *args: SHA_A)
+    monkeypatch.setattr(installer, "_fetch_repo_zip", fetch)
+    manifest = tmp_path / "skills.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "skills": [
+                    {"repo": "o/r", "path": "skills/one"},
+                    {"repo": "o/r", "path": "skills/two"},
+                    {"url": "https://github.com/o/other/tree/main/skills/one", "name": "other-one"},
+                ]
+            }
+        )
+    )
+    dest = tmp_path / "skills"
+    argv = ["--manifest", str(manifest), "--method", "download", "--dest", str(dest), "--jobs", "2"]
+    assert installer.main(argv) == 0
+    assert sorted(fetched) == [f"o/other@{SHA_A}", f"o/r@{SHA_A}"]
+    assert sorted(installer.read_lock(str(dest))) == ["one", "other-one", "two"]
+    assert "Installed other-one" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "skills, message",
+    [
+        ([], "non-empty list"),
+        (["skills/one"], "must be objects"),
+        ([{"repo": "o/r", "path": "a", "method": "ftp"}], "Unsupported method"),
+        ([{"repo": "o/r", "path": "a/x"}, {"repo": "o/q", "path": "b/x"}], "listed more than once"),
+    ],
+)
+def test_manifest_errors(tmp_path, skills, message, capsys):
+    manifest = tmp_path / "skills.json"
+    manifest.write_text(json.dumps({"skills": skills}))
+    assert installer.main(["--manifest", str(manifest), "--dest", str(tmp_path / "d")]) == 1
+    assert message in capsys.readouterr().err
+
+
+def test_yaml_manifest(tmp_path):
+    pytest.importorskip("yaml")
+    manifest = tmp_path / "skills.yaml"
+    manifest.write_text("skills:\n  - repo: o/r\n    path: [skills/one, skills/two]\n    ref: v1\n")
+    groups = installer._load_manifest(str(manifest), "main", "auto")
+    assert [(group.source.ref, group.names) for group in groups] == [("v1", ["one", "two"])]
+
+
+def _skill_archive(path, top="demo", skill_md="---\nname: demo\ndescription: Demo.\n---\n"):
+    with zipfile.ZipFile(path, "w") as zip_file:
+        if skill_md is not None:
+            zip_file.writestr(f"{top}/SKILL.md", skill_md)
+        zip_file.writestr(f"{top}/scripts/run.py", "print('hi')\n")
+    return path
+
+
+def test_install_from_archive_locks_its_hash(tmp_path, capsys):
+    archive = _skill_archive(tmp_path / "demo.skill")
+    dest = tmp_path / "skills"
+    assert installer.main(["--archive", str(archive), "--dest", str(dest)]) == 0
+    assert (dest / "demo" / "scripts" / "run.py").is_file()
+    entry = installer.read_lock(str(dest))["demo"]
+    assert entry["archive"] == str(archive)
+    assert entry["archive_sha256"] == installer._file_sha256(str(archive))
+
+    assert installer.main(["--sync", "--dest", str(dest)]) == 0
+    assert "Skipped demo: installed from a .skill archive" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"skill_md": None}, "SKILL.md not found in archive"),
+        ({"skill_md": "---\nname: Demo Skill\ndescription: x\n---\n"}, "Invalid skill in archive"),
+    ],
+)
+def test_invalid_archives_are_rejected(tmp_path, capsys, kwargs, message):
+    archive = _skill_archive(tmp_path / "bad.skill", **kwargs)
+    dest = tmp_path / "skills"
+    assert installer.main(["--archive", str(archive), "--dest", str(dest)]) == 1
+    assert message in capsys.readouterr().err
+    assert not (dest / "demo").exists()
+
+
+def test_not_a_zip_archive_is_rejected(tmp_path, capsys):
+    archive = tmp_path / "junk.skill"
+    archive.write_text("not a zip")
+    assert installer.main(["--archive", str(archive), "--dest", str(tmp_path / "d")]) == 1
+    assert "not a valid .skill (zip) file" in capsys.readouterr().err
+
+
+def test_package_skill_output_installs(tmp_path):
+    package_skill = load_script("skill-creator", "package_skill.py")
+    skill = tmp_path / "src" / "packed"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: packed\ndescription: Packed skill.\n---\n")
+    archive = package_skill.package_skill(skill, tmp_path / "dist", reproducible=True)
+    dest = tmp_path / "skills"
+    assert installer.main(["--archive", str(archive), "--dest", str(dest), "--name", "renamed"]) == 0
+    assert (dest / "renamed" / "SKILL.md").is_file()
+
+
+def test_install_lock_removes_stale_staging_dirs(tmp_path):
+    dest_root = tmp_path / "skills"
+    stale = dest_root / f"{installer.STAGING_PREFIX}crashed" / "new-0"
+    stale.mkdir(parents=True)
+    (dest_root / "kept").mkdir()
+    with installer._install_lock(str(dest_root)):
+        assert sorted(os.listdir(dest_root)) == [installer.INSTALL_LOCK_FILENAME, "kept"]
+
+
+def test_install_lock_removes_old_temporary_trees(tmp_path):
+    tmp_root = installer._tmp_root()
+    old = os.path.join(tmp_root, f"{installer.TMP_PREFIX}killed")
+    fresh = os.path.join(tmp_root, f"{installer.TMP_PREFIX}running")
+    other = os.path.join(tmp_root, "unrelated")
+    for path in (old, fresh, other):
+        os.makedirs(os.path.join(path, "repo"))
+    stale_time = time.time() - installer.STALE_TMP_SECONDS - 60
+    for path in (old, other):
+        os.utime(path, (stale_time, stale_time))
+    with installer._install_lock(str(tmp_path / "skills")):
+        assert sorted(os.listdir(tmp_root)) == sorted(
+            os.path.basename(path) for path in (fresh, other)
+        )
+
+
+def test_failed_multi_skill_install_leaves_nothing_behind(tmp_path, fake_github, capsys):
+    dest = tmp_path / "skills"
+    argv = ["--repo", "o/r", "--path", "skills/demo", "skills/missing", "--method", "download"]
+    assert installer.main([*argv, "--dest", str(dest)]) == 1
+    assert "Skill path not found" in capsys.readouterr().err
+    assert sorted(os.listdir(dest)) == [installer.INSTALL_LOCK_FILENAME]
+
+
+def test_existing_destination_aborts_before_any_rename(tmp_path):
+    dest_root = tmp_path / "skills"
+    (dest_root / "beta").mkdir(parents=True)
+    items = []
+    for name in ("alpha", "beta"):
+        src = tmp_path / "new" / name
+        src.mkdir(parents=True)
+        (src / "SKILL.md").write_text(name)
+        items.append((str(src), str(dest_root / name)))
+    with pytest.raises(installer.InstallError, match="beta"):
+        installer._install_trees(items, str(dest_root))
+    assert os.listdir(dest_root) == ["beta"]
+
+
+def _git(*args):
+    return installer._run_git(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args]).strip()
+
+
+@pytest.mark.skipif(not shutil.which("git"), reason="git is not installed")
+def test_git_mirror_is_reused_and_fetched_incrementally(tmp_path):
+    upstream = tmp_path / "upstream"
+    for path in ("skills/demo/SKILL.md", "skills/other/SKILL.md"):
+        (upstream / path).parent.mkdir(parents=True, exist_ok=True)
+        (upstream / path).write_text("v1")
+    _git("init", "--quiet", "--initial-branch=main", str(upstream))
+    _git("-C", str(upstream), "config", "uploadpack.allowFilter", "true")
+    _git("-C", str(upstream), "add", ".")
+    _git("-C", str(upstream), "commit", "--quiet", "-m", "v1")
+    source = installer.Source("o", "r", "main", ["skills/demo"], repo_url=upstream.as_uri())
+
+    repo_root, sha = installer._git_mirror_checkout(source, str(tmp_path / "first"))
+    assert sha == _git("-C", str(upstream), "rev-parse", "HEAD")
+    assert (tmp_path / "first" / "repo" / "skills" / "demo" / "SKILL.md").read_text() == "v1"
+    assert not os.path.exists(os.path.join(repo_root, "skills", "other"))
+    mirror = installer._git_mirror_dir("o", "r")
+    assert os.path.isfile(os.path.join(mirror, "HEAD"))
+
+    (upstream / "skills" / "demo" / "SKILL.md").write_text("v2")
+    _git("-C", str(upstream), "commit", "--quiet", "-am", "v2")
+    repo_root, sha = installer._git_mirror_checkout(source, str(tmp_path / "second"))
+    assert sha == _git("-C", str(upstream), "rev-parse", "HEAD")
+    assert (tmp_path / "second" / "repo" / "skills" / "demo" / "SKILL.md").read_text() == "v2"
+    assert installer._git_mirror_dir("o", "r") == mirror
+
+
+@pytest.mark.skipif(not shutil.which("git"), reason="git is not installed")
+def test_git_mirror_reports_unknown_refs(tmp_path, monkeypatch):
+    upstream = tmp_path / "upstream"
+    _git("init", "--quiet", "--bare", str(upstream))
+    monkeypatch.setattr(installer, "_build_repo_ssh", lambda owner, repo: upstream.as_uri())
+    source = installer.Source("o", "r", "nope", ["skills/demo"], repo_url=upstream.as_uri())
+    with pytest.raises(installer.InstallError):
+        installer._git_mirror_checkout(source, str(tmp_path / "out"))
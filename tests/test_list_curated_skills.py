@@ -0,0 +1,126 @@
+"""Tests for skill-installer's list-curated-skills.py."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import urllib.error
+import zipfile
+
+import pytest
+from conftest import load_script
+
+lister = load_script("skill-installer", "list-curated-skills.py")
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+
+def _write_catalog_zip(zip_path):
+    with zipfile.ZipFile(zip_path, "w") as zip_file:
+        zip_file.writestr(
+            "skills-main/skills/.curated/demo/SKILL.md",
+            "---\nname: demo\ndescription: >\n  Builds demos.\nlicense: MIT\n---\n"
+            "# Demo\n## Usage\n```\n# not a heading\n```\n",
+        )
+        zip_file.writestr("skills-main/skills/.curated/demo/scripts/run.py", "print('hi')\n")
+        zip_file.writestr("skills-main/skills/.curated/other/SKILL.md", "no frontmatter")
+        zip_file.writestr("skills-main/skills/.experimental/hidden/SKILL.md", "---\n---\n")
+
+
+def test_catalog_entries_read_metadata_from_one_archive(tmp_path):
+    zip_path = tmp_path / "repo.zip"
+    _write_catalog_zip(zip_path)
+    with zipfile.ZipFile(zip_path) as zip_file:
+        entries = lister._catalog_entries(zip_file, "skills/.curated")
+    assert [entry["name"] for entry in entries] == ["demo", "other"]
+    demo = entries[0]
+    assert demo["description"] == "Builds demos."
+    assert demo["license"] == "MIT"
+    assert demo["headings"] == ["Demo", "Usage"]
+    assert demo["files"] == 2
+    assert entries[1]["description"] == ""
+
+
+@pytest.fixture
+def remote(monkeypatch):
+    state = {"sha": SHA_A, "resolves": 0, "builds": 0}
+
+    def resolve(repo, ref):
+        state["resolves"] += 1
+        return state["sha"]
+
+    def build(repo, path, sha):
+        state["builds"] += 1
+        return [{"name": "demo", "description": f"at {sha[:7]}", "headings": []}]
+
+    monkeypatch.setattr(lister, "_resolve_commit_sha", resolve)
+    monkeypatch.setattr(lister, "_build_catalog", build)
+    return state
+
+
+def test_catalog_is_rebuilt_only_when_the_ref_moves(remote):
+    args = ("o/r", "skills/.curated", "main")
+    assert lister._load_catalog(*args, ttl=3600, refresh=False)["sha"] == SHA_A
+    lister._load_catalog(*args, ttl=3600, refresh=False)
+    assert (remote["resolves"], remote["builds"]) == (1, 1)
+
+    lister._load_catalog(*args, ttl=3600, refresh=True)
+    assert (remote["resolves"], remote["builds"]) == (2, 1)
+
+    remote["sha"] = SHA_B
+    catalog = lister._load_catalog(*args, ttl=0, refresh=False)
+    assert catalog["skills"][0]["description"] == "at bbbbbbb"
+    assert (remote["resolves"], remote["builds"]) == (3, 2)
+
+
+def test_failed_archive_download_is_a_list_error(monkeypatch):
+    def offline(url, dest_path):
+        raise urllib.error.URLError("[Errno 111] Connection refused")
+
+    monkeypatch.setattr(lister, "_download", offline)
+    with pytest.raises(lister.ListError, match="Failed to download o/r@"):
+        lister._build_catalog("o/r", "skills/.curated", SHA_A)
+
+
+def test_stale_catalog_is_used_when_github_is_unreachable(remote, monkeypatch, capsys):
+    args = ("o/r", "skills/.curated", "main")
+    lister._load_catalog(*args, ttl=3600, refresh=False)
+
+    def offline(repo, ref):
+        raise lister.ListError("Failed to resolve o/r@main: connection refused")
+
+    monkeypatch.setattr(lister, "_resolve_commit_sha", offline)
+    catalog = lister._load_catalog(*args, ttl=0, refresh=False)
+    assert catalog["sha"] == SHA_A
+    assert "using the cached catalog at aaaaaaa" in capsys.readouterr().err
+
+    monkeypatch.setattr(lister, "_read_catalog", lambda catalog_path: None)
+    with pytest.raises(lister.ListError, match="connection refused"):
+        lister._load_catalog(*args, ttl=0, refresh=False)
+
+
+def test_cached_archive_is_read_under_the_shared_archive_lock(monkeypatch):
+    archive = lister.github_archive_cache_path("o/r", SHA_A)
+    os.makedirs(os.path.dirname(archive))
+    _write_catalog_zip(archive)
+    held = []
+    real_file_lock = lister.file_lock
+    real_read = lister._read_archive_catalog
+
+    @contextlib.contextmanager
+    def file_lock(lock_path, shared=False):
+        with real_file_lock(lock_path, shared):
+            held.append((os.path.basename(lock_path), shared))
+            yield
+            held.pop()
+
+    def read(zip_path, path):
+        assert held == [(lister.ARCHIVE_LOCK_FILENAME, True)]
+        return real_read(zip_path, path)
+
+    monkeypatch.setattr(lister, "file_lock", file_lock)
+    monkeypatch.setattr(lister, "_read_archive_catalog", read)
+    monkeypatch.setattr(lister, "_download", lambda url, dest_path: pytest.fail("downloaded"))
+    entries = lister._build_catalog("o/r", "skills/.curated", SHA_A)
+    assert [entry["name"] for entry in entries] == ["demo", "other"]
@@ -0,0 +1,313 @@
+"""Tests for skill-creator's package_skill.py."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import subprocess
+import zipfile
+
+import pytest
+from conftest import write_skill
+
+import package_skill
+
+
+@pytest.fixture
+def skill(tmp_path):
+    skill_dir = write_skill(tmp_path / "src", "demo")
+    (skill_dir / "scripts").mkdir()
+    (skill_dir / "scripts" / "run.sh").write_text("#!/bin/sh\necho hi\n")
+    (skill_dir / "assets").mkdir()
+    (skill_dir / "assets" / "logo.png").write_bytes(b"\x89PNG" + bytes(range(256)) * 8)
+    return skill_dir
+
+
+def _package(skill_dir, out_dir, **options):
+    return package_skill.package_skill(skill_dir, out_dir, **options)
+
+
+def _manifest(out_dir):
+    return json.loads((out_dir / f"demo.skill{package_skill.MANIFEST_SUFFIX}").read_text())
+
+
+def test_reproducible_archives_are_byte_identical(skill, tmp_path):
+    first = _package(skill, tmp_path / "a", reproducible=True)
+    second = _package(skill, tmp_path / "b", reproducible=True)
+    assert first.read_bytes() == second.read_bytes()
+    assert _manifest(tmp_path / "a")["archive_sha256"] == package_skill.file_sha256(first)
+
+
+def test_reproducible_members_use_compresslevel_and_normalized_metadata(skill, tmp_path):
+    archive = _package(skill, tmp_path / "out", reproducible=True, compresslevel=1)
+    with zipfile.ZipFile(archive) as zipf:
+        infos = {info.filename: info for info in zipf.infolist()}
+        assert zipf.testzip() is None
+    assert infos["demo/assets/logo.png"].compress_type == zipfile.ZIP_STORED
+    assert infos["demo/SKILL.md"].compress_type == zipfile.ZIP_DEFLATED
+    assert infos["demo/SKILL.md"].date_time == (1980, 1, 1, 0, 0, 0)
+    assert infos["demo/SKILL.md"].external_attr >> 16 & 0o777 == 0o644
+
+
+def test_default_level_streams_deflated_members(skill, tmp_path, monkeypatch):
+    (skill / "data.json").write_text('{"rows": [' + ", ".join(["1"] * 50000) + "]}")
+    expected = package_skill.file_sha256(_package(skill, tmp_path / "first", reproducible=True))
+
+    def no_read_bytes(self):
+        pytest.fail(f"read whole: {self}")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(package_skill.Path, "read_bytes", no_read_bytes)
+        streamed = _package(skill, tmp_path / "streamed", reproducible=True)
+    assert package_skill.file_sha256(streamed) == expected
+
+    # Streaming gives the same bytes as writestr at an explicit level 6.
+    monkeypatch.setattr(package_skill, "DEFAULT_COMPRESSLEVEL", -1)
+    written = _package(skill, tmp_path / "writestr", reproducible=True)
+    assert package_skill.file_sha256(written) == expected
+
+
+def test_unchanged_content_keeps_archive(skill, tmp_path, capsys):
+    out = tmp_path / "out"
+    archive = _package(skill, out, reproducible=True)
+    mtime = archive.stat().st_mtime_ns
+    capsys.readouterr()
+    assert _package(skill, out, reproducible=True) == archive
+    assert "Content unchanged" in capsys.readouterr().out
+    assert archive.stat().st_mtime_ns == mtime
+
+
+def test_exec_bit_change_rebuilds(skill, tmp_path):
+    out = tmp_path / "out"
+    _package(skill, out, reproducible=True)
+    before = _manifest(out)["content_sha256"]
+    (skill / "scripts" / "run.sh").chmod(0o755)
+    archive = _package(skill, out, reproducible=True)
+    assert _manifest(out)["content_sha256"] != before
+    with zipfile.ZipFile(archive) as zipf:
+        assert zipf.getinfo("demo/scripts/run.sh").external_attr >> 16 & 0o777 == 0o755
+
+
+def test_damaged_archive_is_rebuilt(skill, tmp_path, capsys):
+    out = tmp_path / "out"
+    archive = _package(skill, out, reproducible=True)
+    good = archive.read_bytes()
+    archive.write_bytes(good[: len(good) // 2])
+    capsys.readouterr()
+    _package(skill, out, reproducible=True)
+    assert "Content unchanged" not in capsys.readouterr().out
+    assert archive.read_bytes() == good
+
+
+def test_non_reproducible_run_drops_stale_manifest(skill, tmp_path, capsys):
+    out = tmp_path / "out"
+    archive = _package(skill, out, reproducible=True)
+    good = archive.read_bytes()
+    _package(skill, out)
+    assert not (out / f"demo.skill{package_skill.MANIFEST_SUFFIX}").exists()
+    capsys.readouterr()
+    _package(skill, out, reproducible=True)
+    assert "Content unchanged" not in capsys.readouterr().out
+    assert archive.read_bytes() == good
+
+
+def test_failed_write_leaves_previous_archive(skill, tmp_path, monkeypatch):
+    out = tmp_path / "out"
+    archive = _package(skill, out, reproducible=True)
+    good = archive.read_bytes()
+    (skill / "SKILL.md").write_text(
+        (skill / "SKILL.md").read_text() + "\nMore.\n"
+    )
+
+    def explode(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(package_skill, "_write_reproducible", explode)
+    assert _package(skill, out, reproducible=True) is None
+    assert archive.read_bytes() == good
+    assert sorted(path.name for path in out.iterdir()) == [
+        "demo.skill",
+        f"demo.skill{package_skill.MANIFEST_SUFFIX}",
+    ]
+
+
+def test_jobs_requires_reproducible_or_tree(skill, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(
+        "sys.argv", ["package_skill.py", str(skill), str(tmp_path / "out"), "--jobs", "4"]
+    )
+    with pytest.raises(SystemExit) as excinfo:
+        package_skill.main()
+    assert excinfo.value.code == 2
+    assert "--jobs only applies with --reproducible or --tree" in capsys.readouterr().err
+
+
+def test_manifest_is_independent_of_jobs(skill):
+    files = package_skill.collect_files(skill)
+    serial = package_skill.build_manifest("demo", files, jobs=1)
+    parallel = package_skill.build_manifest("demo", files, jobs=4)
+    assert serial == parallel
+
+
+def test_tree_records_crashed_skill_and_writes_index(tmp_path, monkeypatch, capsys):
+    from concurrent.futures import ThreadPoolExecutor
+
+    root = tmp_path / "skills"
+    write_skill(root, "good")
+    write_skill(root, "bad")
+    real_worker = package_skill._package_tree_worker
+
+    def worker(skill_path, output_dir, options):
+        if skill_path.endswith("bad"):
+            raise MemoryError("worker died")
+        return real_worker(skill_path, output_dir, options)
+
+    # Threads keep the patched worker in this process.
+    monkeypatch.setattr(package_skill, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(package_skill, "_package_tree_worker", worker)
+    out = tmp_path / "dist"
+    assert package_skill.package_tree(root, out, jobs=2) is False
+
+    index = json.loads((out / package_skill.TREE_INDEX_FILENAME).read_text())
+    assert [entry["name"] for entry in index["skills"]] == ["good"]
+    output = capsys.readouterr().out
+    assert "failed: bad" in output
+    assert "Packaging crashed: MemoryError: worker died" in output
+
+
+IGNORE_PATTERNS = [
+    "*.log",
+    "!keep.log",
+    "/build",
+    "docs/*.md",
+    "**/tmp",
+    "a/**/z.txt",
+    "cache/",
+    "vendor/**",
+    "[!s]rc.txt",
+    "\\#literal",
+    "data?.csv",
+]
+TREE_FILES = [
+    "SKILL.md",
+    "run.log",
+    "sub/keep.log",
+    "sub/other.log",
+    "build/out.txt",
+    "sub/build/out.txt",
+    "docs/guide.md",
+    "docs/deep/guide.md",
+    "sub/docs/guide.md",
+    "tmp/x.txt",
+    "sub/tmp/x.txt",
+    "a/z.txt",
+    "a/b/c/z.txt",
+    "cache/x.txt",
+    "sub/cache/x.txt",
+    "cache.txt",
+    "vendor/lib.py",
+    "vendor.py",
+    "src.txt",
+    "arc.txt",
+    "#literal",
+    "data1.csv",
+    "data10.csv",
+]
+
+
+def _make_tree(root, patterns, ignore_name):
+    for rel in TREE_FILES:
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(rel)
+    (root / ignore_name).write_text("\n".join(patterns) + "\n")
+
+
+def test_skillignore_matches_git(tmp_path):
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    skill = tmp_path / "demo"
+    skill.mkdir()
+    _make_tree(skill, IGNORE_PATTERNS, ".skillignore")
+    (skill / ".gitignore").write_text((skill / ".skillignore").read_text())
+    subprocess.run(["git", "init", "-q", str(skill)], check=True)
+    listed = subprocess.run(
+        ["git", "-C", str(skill), "ls-files", "--others", "--exclude-standard"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    ignore_files = {".gitignore", ".skillignore"}
+    expected = sorted(path for path in listed if path not in ignore_files)
+    packaged = [arcname[len("demo/") :] for _, arcname in package_skill.collect_files(skill)]
+    assert sorted(path for path in packaged if path not in ignore_files) == expected
+    assert "vendor.py" in expected and "sub/keep.log" in expected
+
+
+def test_default_ignores_can_be_re_included(tmp_path):
+    skill = write_skill(tmp_path, "demo")
+    (skill / "__pycache__").mkdir()
+    (skill / "__pycache__" / "x.pyc").write_bytes(b"")
+    (skill / ".DS_Store").write_bytes(b"")
+    (skill / "node_modules" / "pkg").mkdir(parents=True)
+    (skill / "node_modules" / "pkg" / "index.js").write_text("")
+    assert [arcname for _, arcname in package_skill.collect_files(skill)] == ["demo/SKILL.md"]
+
+    (skill / ".skillignore").write_text("!node_modules/\n")
+    assert [arcname for _, arcname in package_skill.collect_files(skill)] == [
+        "demo/SKILL.md",
+        "demo/node_modules/pkg/index.js",
+    ]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("512", 512), ("200K", 200 * 1024), ("10MB", 10 * 1024**2), ("1.5g", int(1.5 * 1024**3))],
+)
+def test_parse_size(value, expected):
+    assert package_skill.parse_size(value) == expected
+
+
+def test_parse_size_rejects_garbage():
+    with pytest.raises(argparse.ArgumentTypeError):
+        package_skill.parse_size("ten megs")
+
+
+def test_size_budgets_block_packaging_and_list_largest_files(skill, tmp_path, capsys):
+    assert _package(skill, tmp_path / "out", max_file_size=1024) is None
+    output = capsys.readouterr().out
+    assert "1 file(s) exceed the per-file limit of 1.0 KB" in output
+    assert output.index("demo/assets/logo.png") < output.index("demo/SKILL.md")
+    assert not (tmp_path / "out" / "demo.skill").exists()
+
+    assert _package(skill, tmp_path / "out", max_total_size=100) is None
+    assert "exceeds the limit of 100 B" in capsys.readouterr().out
+
+
+def test_tree_rebuilds_only_changed_skills(tmp_path, capsys):
+    root = tmp_path / "skills"
+    write_skill(root / ".curated", "alpha")
+    beta = write_skill(root / ".experimental", "beta")
+    out = tmp_path / "dist"
+    assert package_skill.package_tree(root, out, jobs=2) is True
+    index = json.loads((out / package_skill.TREE_INDEX_FILENAME).read_text())
+    assert [(entry["name"], entry["source"]) for entry in index["skills"]] == [
+        ("alpha", ".curated/alpha"),
+        ("beta", ".experimental/beta"),
+    ]
+    for entry in index["skills"]:
+        assert entry["sha256"] == package_skill.file_sha256(out / entry["archive"])
+
+    (beta / "notes.txt").write_text("new file")
+    capsys.readouterr()
+    assert package_skill.package_tree(root, out, jobs=2) is True
+    output = capsys.readouterr().out
+    assert "unchanged: alpha" in output
+    assert "built: beta" in output
+
+
+def test_tree_rejects_duplicate_skill_names(tmp_path, capsys):
+    root = tmp_path / "skills"
+    write_skill(root / "one", "same")
+    write_skill(root / "two", "same")
+    assert package_skill.package_tree(root, tmp_path / "dist") is False
+    assert "Duplicate skill name 'same'" in capsys.readouterr().out
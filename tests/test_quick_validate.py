@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import quick_validate
+from conftest import SCRIPT_DIRS, write_skill
+
+SCRIPT = SCRIPT_DIRS["skill-creator"] / "quick_validate.py"
+
+
+def run_validate(*args):
+    return subprocess.run(
+        [sys.executable, str(SCRIPT), *map(str, args)], capture_output=True, text=True
+    )
+
+
+def test_collect_errors_reports_every_problem(tmp_path):
+    skill = tmp_path / "bad"
+    skill.mkdir()
+    (skill / "SKILL.md").write_text("---\nname: Bad_Name\ndescription: has <html>\nextra: 1\n---\n")
+
+    errors = quick_validate.collect_errors(skill)
+
+    assert len(errors) == 3
+    assert errors[0].startswith("Unexpected key(s) in SKILL.md frontmatter: extra.")
+    assert "should be hyphen-case" in errors[1]
+    assert errors[2] == "Description cannot contain angle brackets (< or >)"
+
+
+def test_unreadable_skill_md_is_reported_not_raised(tmp_path):
+    skill = tmp_path / "binary"
+    skill.mkdir()
+    (skill / "SKILL.md").write_bytes(b"---\nname: binary\ndescription: \xff\xfe\n---\n")
+
+    errors = quick_validate.collect_errors(skill)
+
+    assert len(errors) == 1
+    assert errors[0].startswith("Unable to read SKILL.md:")
+
+
+def test_validate_many_keeps_order_and_isolates_crashes(tmp_path, monkeypatch):
+    good = write_skill(tmp_path, "good-skill")
+    boom = write_skill(tmp_path, "boom-skill")
+    real_collect = quick_validate.collect_errors
+
+    def collect(path):
+        if str(path) == str(boom):
+            raise RuntimeError("kaboom")
+        return real_collect(path)
+
+    monkeypatch.setattr(quick_validate, "collect_errors", collect)
+    cache = quick_validate.ValidationCache(tmp_path / "cache.json")
+
+    results = quick_validate.validate_many([boom, good], jobs=1, cache=cache)
+
+    assert [result["path"] for result in results] == [str(boom), str(good)]
+    assert results[0]["valid"] is False
+    assert results[0]["crashed"] is True
+    assert results[0]["errors"] == ["Validation crashed: RuntimeError: kaboom"]
+    assert results[1]["valid"] is True
+    # Crashes are not cached, so the next run tries again.
+    assert quick_validate.ValidationCache.key_for(boom) not in cache.entries
+    assert quick_validate.ValidationCache.key_for(good) in cache.entries
+
+
+def test_root_mode_writes_report_despite_undecodable_skill(tmp_path):
+    root = tmp_path / "skills"
+    write_skill(root, "alpha")
+    write_skill(root, "beta", description="Has <angle> brackets.")
+    broken = root / "gamma"
+    broken.mkdir()
+    (broken / "SKILL.md").write_bytes(b"---\nname: gamma\ndescription: \xff\n---\n")
+    report = tmp_path / "report.json"
+
+    result = run_validate("--root", root, "--jobs", "2", "--format", "json", "--output", report)
+
+    assert result.returncode == 1, result.stderr
+    data = json.loads(report.read_text())
+    assert data["total"] == 3
+    assert data["failed"] == 2
+    by_name = {entry["path"].rsplit("/", 1)[-1]: entry for entry in data["skills"]}
+    assert by_name["alpha"]["valid"] is True
+    assert by_name["beta"]["errors"] == ["Description cannot contain angle brackets (< or >)"]
+    assert by_name["gamma"]["errors"][0].startswith("Unable to read SKILL.md:")
+
+
+def test_junit_report_marks_failures(tmp_path):
+    root = tmp_path / "skills"
+    write_skill(root, "alpha")
+    write_skill(root, "Bad")
+
+    result = run_validate("--root", root, "--jobs", "1", "--format", "junit", "--no-cache")
+
+    suite = ET.fromstring(result.stdout)
+    assert suite.get("tests") == "2"
+    assert suite.get("failures") == "1"
+    failures = [case for case in suite if case.find("failure") is not None]
+    assert [case.get("name").rsplit("/", 1)[-1] for case in failures] == ["Bad"]
+
+
+def test_single_skill_text_mode_keeps_one_line_output(tmp_path):
+    skill = write_skill(tmp_path, "solo")
+
+    result = run_validate(skill)
+
+    assert result.returncode == 0
+    assert result.stdout == "Skill is valid!\n"
+
+
+def test_cache_save_merges_concurrent_writers(tmp_path):
+    path = tmp_path / "cache.json"
+    first = quick_validate.ValidationCache(path)
+    second = quick_validate.ValidationCache(path)
+    first.put("a", [])
+    second.put("b", ["broken"])
+    first.save()
+    second.save()
+    assert quick_validate.ValidationCache(path).entries == {"a": [], "b": ["broken"]}
+
+
+def test_cache_answers_unchanged_frontmatter(tmp_path):
+    path = tmp_path / "cache.json"
+    skill = write_skill(tmp_path, "demo")
+    cache = quick_validate.ValidationCache(path)
+    assert quick_validate.validate_many([skill], jobs=1, cache=cache)[0]["cached"] is False
+    cache.save()
+
+    # Body edits do not change the key; frontmatter edits do.
+    (skill / "SKILL.md").write_text((skill / "SKILL.md").read_text() + "\nMore body.\n")
+    cache = quick_validate.ValidationCache(path)
+    assert quick_validate.validate_many([skill], jobs=1, cache=cache)[0]["cached"] is True
+    assert (cache.hits, cache.misses) == (1, 0)
+
+    write_skill(tmp_path, "demo", description="Uses <html>.")
+    cache = quick_validate.ValidationCache(path)
+    result = quick_validate.validate_many([skill], jobs=1, cache=cache)[0]
+    assert result["cached"] is False
+    assert result["errors"] == ["Description cannot contain angle brackets (< or >)"]
+
+
+def test_cache_keys_change_with_validator_version(tmp_path, monkeypatch):
+    skill = write_skill(tmp_path, "demo")
+    key = quick_validate.ValidationCache.key_for(skill)
+    monkeypatch.setattr(quick_validate, "VALIDATOR_VERSION", quick_validate.VALIDATOR_VERSION + 1)
+    assert quick_validate.ValidationCache.key_for(skill) != key
+
+
+def test_cache_drops_oldest_entries_past_the_cap(tmp_path, monkeypatch):
+    monkeypatch.setattr(quick_validate, "MAX_CACHE_ENTRIES", 2)
+    path = tmp_path / "cache.json"
+    cache = quick_validate.ValidationCache(path)
+    for key in ("a", "b", "c"):
+        cache.put(key, [])
+    cache.save()
+    assert list(quick_validate.ValidationCache(path).entries) == ["b", "c"]
+
+
+FRONTMATTER_SAMPLES = [
+    "name: demo\ndescription: Plain words, with commas.",
+    "name: demo\ndescription: 'single quoted: yes'",
+    'name: demo\ndescription: "double quoted"',
+    "name: demo\ndescription: yes",
+    "name: 123\ndescription: numbers",
+    "name: demo\ndescription: >\n  folded",
+    "name: demo\ndescription: a: b",
+    "name: demo\ndescription: trailing # comment",
+    "name: demo\ndescription: ~",
+    "name: demo\ndescription: -leading dash",
+    "name: demo\ndescription: x\nmetadata:\n  owner: team\n  tier: gold",
+    "name: demo\ndescription: x\nmetadata:\n  owner: team\n    nested: deeper",
+    "name: demo\ndescription: x\nmetadata:",
+    "name: demo\nname: again\ndescription: duplicate keys",
+    "name: demo\ndescription: x\nlicense: Apache-2.0",
+    "name: demo\ndescription: tab\there",
+    "name: demo\ndescription:   spaced   ",
+]
+
+
+@pytest.mark.parametrize("text", FRONTMATTER_SAMPLES)
+def test_simple_parser_agrees_with_pyyaml_or_defers(text):
+    yaml = pytest.importorskip("yaml")
+    parsed = quick_validate.parse_simple_frontmatter(text)
+    if parsed is not None:
+        assert parsed == yaml.safe_load(text)
+
+
+def test_simple_parser_handles_the_common_case():
+    text = "name: demo\ndescription: Does a thing.\nmetadata:\n  owner: team"
+    assert quick_validate.parse_simple_frontmatter(text) == {
+        "name": "demo",
+        "description": "Does a thing.",
+        "metadata": {"owner": "team"},
+    }
+
+
+def test_read_frontmatter_stops_at_the_closing_line(tmp_path):
+    skill_md = tmp_path / "SKILL.md"
+    body = b"# Demo\n" * 10000 + b"\xff\xfe not utf-8"
+    skill_md.write_bytes(b"---\nname: demo\ndescription: x\n---\n" + body)
+    assert quick_validate.read_frontmatter(skill_md) == ("name: demo\ndescription: x", None)
@@ -0,0 +1,71 @@
+"""Tests for skill-installer's skill_metadata.py."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+
+import pytest
+from conftest import SCRIPT_DIRS
+
+import quick_validate
+import skill_metadata
+
+CASES = {
+    "valid": "---\nname: demo\ndescription: Does a thing.\n---\n# Demo\n",
+    "crlf": "---\r\nname: demo\r\ndescription: Does a thing.\r\n---\r\n",
+    "numeric name": "---\nname: 123\ndescription: Does a thing.\n---\n",
+    "folded description": "---\nname: demo\ndescription: >\n  Folded\n  text.\n---\n",
+    "angle brackets": "---\nname: demo\ndescription: Use <tag>.\n---\n",
+    "list frontmatter": "---\n- name\n- description\n---\n",
+    "bad yaml": "---\nname: [demo\ndescription: x\n---\n",
+    "unexpected key": "---\nname: demo\ndescription: x\nversion: 1\n---\n",
+    "no frontmatter": "# Demo\n",
+    "unterminated": "---\nname: demo\n",
+    "boolean name": "---\nname: yes\ndescription: x\n---\n",
+    "quoted": "---\nname: 'demo'\ndescription: \"Says: hi\"\n---\n",
+    "metadata": "---\nname: demo\ndescription: x\nmetadata:\n  short-description: y\n---\n",
+    "empty description": "---\nname: demo\ndescription:\n---\n",
+    "long name": "---\nname: " + "a" * 65 + "\ndescription: x\n---\n",
+    "bad name": "---\nname: Demo--Skill-\ndescription: x\n---\n",
+}
+
+
+@pytest.mark.parametrize("content", CASES.values(), ids=CASES.keys())
+def test_validate_skill_md_matches_quick_validate(tmp_path, content):
+    (tmp_path / "SKILL.md").write_bytes(content.encode("utf-8"))
+    assert skill_metadata.validate_skill_md(content) == quick_validate.collect_errors(tmp_path)
+
+
+@pytest.mark.parametrize("content", CASES.values(), ids=CASES.keys())
+def test_frontmatter_parsing_matches_quick_validate(content):
+    text, error = skill_metadata.read_frontmatter_text(content)
+    assert (text, error) == quick_validate.read_frontmatter_text(content)
+    if text is not None:
+        assert skill_metadata.load_frontmatter(text) == quick_validate.load_frontmatter(text)
+
+
+@pytest.mark.parametrize("script", ["install-skill-from-github.py", "list-curated-skills.py"])
+def test_skill_installer_runs_without_skill_creator(tmp_path, script):
+    scripts = tmp_path / "skill-installer" / "scripts"
+    shutil.copytree(SCRIPT_DIRS["skill-installer"], scripts)
+    result = subprocess.run(
+        [sys.executable, str(scripts / script), "--help"], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_numeric_name_is_rejected():
+    errors = skill_metadata.validate_skill_md(CASES["numeric name"])
+    assert errors == ["Name must be a string, got int"]
+
+
+def test_parse_frontmatter_folds_block_scalars():
+    frontmatter = skill_metadata.parse_frontmatter(CASES["folded description"])
+    assert frontmatter == {"name": "demo", "description": "Folded text."}
+
+
+def test_parse_frontmatter_rejects_malformed():
+    assert skill_metadata.parse_frontmatter(CASES["list frontmatter"]) is None
+    assert skill_metadata.parse_frontmatter(CASES["no frontmatter"]) is None
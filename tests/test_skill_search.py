@@ -0,0 +1,69 @@
+"""Tests for skill-installer's skill_search.py and the list script's search command."""
+
+from __future__ import annotations
+
+import json
+import urllib.error
+
+from conftest import load_script, write_skill
+
+import skill_search
+
+
+def _doc(doc_id, name, description="", headings=(), signature="v1"):
+    return {
+        "id": doc_id,
+        "source": "curated",
+        "name": name,
+        "description": description,
+        "headings": list(headings),
+        "signature": signature,
+    }
+
+
+def test_search_ranks_name_over_description_and_matches_prefixes():
+    index = skill_search.load_index("/nonexistent/index.json")
+    docs = [
+        _doc("a", "pdf-tools", "Work with documents."),
+        _doc("b", "notes", "Export notes to PDF files."),
+        _doc("c", "sheets", "Spreadsheets.", headings=["Formulas"]),
+    ]
+    assert skill_search.refresh_index(index, docs)
+    assert [hit["name"] for hit in skill_search.search(index, "pdf", 10)] == ["pdf-tools", "notes"]
+    assert [hit["name"] for hit in skill_search.search(index, "formu", 10)] == ["sheets"]
+    assert skill_search.search(index, "the and", 10) == []
+
+
+def test_refresh_index_reindexes_only_changed_docs():
+    index = skill_search.load_index("/nonexistent/index.json")
+    skill_search.refresh_index(index, [_doc("a", "alpha", "First."), _doc("b", "beta", "Second.")])
+    unchanged = [{"id": "a", "signature": "v1"}, {"id": "b", "signature": "v1"}]
+    assert not skill_search.refresh_index(index, unchanged)
+
+    changed = [{"id": "a", "signature": "v1"}, _doc("b", "beta", "Rewritten.", signature="v2")]
+    assert skill_search.refresh_index(index, changed)
+    assert skill_search.search(index, "second", 10) == []
+    assert skill_search.search(index, "rewritten", 10)[0]["name"] == "beta"
+
+    assert skill_search.refresh_index(index, [{"id": "a", "signature": "v1"}])
+    assert "b" not in index["docs"]
+    assert all("b" not in posting for posting in index["postings"].values())
+
+
+def test_search_command_uses_installed_skills_offline(codex_home, monkeypatch, capsys):
+    lister = load_script("skill-installer", "list-curated-skills.py")
+
+    def offline(*args, **kwargs):
+        raise urllib.error.URLError("[Errno 111] Connection refused")
+
+    monkeypatch.setattr(lister, "github_commit_sha", offline)
+    write_skill(codex_home / "skills", "pdf-tools", "Merge and split PDF files.")
+    write_skill(codex_home / "skills", "notes", "Take notes.")
+
+    assert lister.main(["search", "pdf", "--format", "json"]) == 0
+    captured = capsys.readouterr()
+    assert [hit["name"] for hit in json.loads(captured.out)] == ["pdf-tools"]
+    assert "searching installed skills only" in captured.err
+
+    index = skill_search.load_index(skill_search.index_path(str(codex_home)))
+    assert len(index["docs"]) == 2
@@ -0,0 +1,64 @@
+"""Tests for skill-installer's skill_state.py."""
+
+from __future__ import annotations
+
+import os
+
+from conftest import write_skill
+
+import skill_state
+
+
+def test_installed_skills_rescans_only_when_the_directory_changes(tmp_path, monkeypatch):
+    root = tmp_path / "skills"
+    registry = str(tmp_path / "registry.json")
+    write_skill(root, "alpha")
+    skill_state.write_lock(
+        str(root), {"alpha": {"repo": "o/r", "path": "skills/alpha", "ref": "main", "sha": "abc"}}
+    )
+    os.utime(root, ns=(1_000_000_000, 1_000_000_000))
+    assert skill_state.installed_skills(str(root), registry)["alpha"] == {
+        "source": "o/r/skills/alpha@main",
+        "sha": "abc",
+        "mtime_ns": (root / "alpha").stat().st_mtime_ns,
+    }
+
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+    assert set(skill_state.installed_skills(str(root), registry)) == {"alpha"}
+    assert scans == []
+
+    write_skill(root, "beta")
+    os.utime(root, ns=(2_000_000_000, 2_000_000_000))
+    assert set(skill_state.installed_skills(str(root), registry)) == {"alpha", "beta"}
+    assert scans == [str(root)]
+
+
+def test_archive_installs_report_their_archive_as_source(tmp_path):
+    root = tmp_path / "skills"
+    write_skill(root, "packed")
+    skill_state.write_lock(str(root), {"packed": {"archive": "/dist/packed.skill"}})
+    skills = skill_state.refresh_installed(str(root), str(tmp_path / "registry.json"))
+    assert skills["packed"]["source"] == "/dist/packed.skill"
+    assert skills["packed"]["sha"] is None
+
+
+def test_corrupt_lock_and_registry_are_ignored(tmp_path):
+    root = tmp_path / "skills"
+    write_skill(root, "alpha")
+    (root / skill_state.LOCK_FILENAME).write_text("{not json")
+    registry = tmp_path / "registry.json"
+    registry.write_text("[]")
+    assert skill_state.read_lock(str(root)) == {}
+    assert skill_state.installed_skills(str(root), str(registry))["alpha"]["source"] is None
+
+
+def test_tree_hash_tracks_paths_and_contents(tmp_path):
+    first = write_skill(tmp_path / "a", "demo", body="same")
+    second = write_skill(tmp_path / "b", "demo", body="same")
+    (first / "x.txt").write_text("1")
+    (second / "x.txt").write_text("1")
+    assert skill_state.tree_hash(str(first)) == skill_state.tree_hash(str(second))
+    (second / "x.txt").rename(second / "y.txt")
+    assert skill_state.tree_hash(str(first)) != skill_state.tree_hash(str(second))